@@ -0,0 +1,79 @@
+"""Event-loop stall while rendering: `generate_pptx` called inline versus `agenerate_pptx`.
+
+A ticker coroutine records how late each 5 ms sleep wakes up while a burst of decks
+renders; the worst lag is what other requests on the same loop would have waited.
+
+    python benchmarks/bench_async.py --decks 8 --slides 60
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from pptx import Presentation
+
+from pptx_ooxml_engine.aio import AsyncRenderer
+from pptx_ooxml_engine.engine import generate_pptx
+
+_OPS = [{"op": "rewrite_text", "slide_index": 0, "find": "Old", "replace": "New"}]
+
+
+def _build_template(path: Path, slides: int) -> None:
+    prs = Presentation()
+    for idx in range(slides):
+        prs.slides.add_slide(prs.slide_layouts[1]).shapes.title.text = f"Old Title {idx}"
+    prs.save(str(path))
+
+
+async def _measure(render) -> tuple[float, float]:
+    lags: list[float] = []
+
+    async def _ticker() -> None:
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(0.005)
+            lags.append(time.perf_counter() - start - 0.005)
+
+    ticker = asyncio.create_task(_ticker())
+    await asyncio.sleep(0.02)
+    start = time.perf_counter()
+    await render()
+    total = time.perf_counter() - start
+    await asyncio.sleep(0.02)
+    ticker.cancel()
+    return total, max(lags)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--decks", type=int, default=8)
+    parser.add_argument("--slides", type=int, default=60)
+    parser.add_argument("--concurrency", type=int, default=2)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        template = Path(tmp) / "template.pptx"
+        _build_template(template, args.slides)
+        renderer = AsyncRenderer(max_concurrency=args.concurrency)
+
+        async def inline() -> None:
+            for idx in range(args.decks):
+                generate_pptx(template, _OPS, Path(tmp) / f"inline_{idx}.pptx")
+
+        async def offloaded() -> None:
+            await asyncio.gather(
+                *(renderer.generate_pptx(template, _OPS, Path(tmp) / f"async_{idx}.pptx") for idx in range(args.decks))
+            )
+
+        for label, render in (("inline", inline), ("agenerate_pptx", offloaded)):
+            total, lag = asyncio.run(_measure(render))
+            print(f"{label:<15} total {total * 1000:8.1f} ms  worst loop lag {lag * 1000:8.1f} ms")
+        renderer.close()
+
+
+if __name__ == "__main__":
+    main()
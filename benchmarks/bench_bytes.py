@@ -0,0 +1,75 @@
+"""Service round trip: temp files on disk versus bytes in, bytes out.
+
+Simulates a request whose template arrives as bytes and whose result is sent back as
+bytes. The file path writes the template to a temp file, renders to a second temp file
+and reads it back; the in-memory path hands the bytes straight to `generate_pptx`.
+
+    python benchmarks/bench_bytes.py --slides 60 --repeat 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from io import BytesIO
+from pathlib import Path
+
+from pptx import Presentation
+
+from pptx_ooxml_engine.engine import generate_pptx
+
+_OPS = [{"op": "rewrite_text", "slide_index": 0, "find": "Old", "replace": "New"}]
+
+
+def _template_bytes(slides: int, media_mb: int) -> bytes:
+    prs = Presentation()
+    for idx in range(slides):
+        prs.slides.add_slide(prs.slide_layouts[1]).shapes.title.text = f"Old Title {idx}"
+    buffer = BytesIO()
+    prs.save(buffer)
+    if media_mb:
+        from zipfile import ZIP_STORED, ZipFile
+
+        with ZipFile(buffer, "a") as archive:
+            archive.writestr("ppt/media/blob.bin", os.urandom(media_mb * 2**20), compress_type=ZIP_STORED)
+    return buffer.getvalue()
+
+
+def _via_files(data: bytes, tmp: Path) -> bytes:
+    template = tmp / "template.pptx"
+    output = tmp / "output.pptx"
+    template.write_bytes(data)
+    generate_pptx(template, _OPS, output)
+    result = output.read_bytes()
+    template.unlink()
+    output.unlink()
+    return result
+
+
+def _in_memory(data: bytes) -> bytes:
+    return generate_pptx(data, _OPS).output_bytes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--slides", type=int, default=60)
+    parser.add_argument("--media-mb", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    data = _template_bytes(args.slides, args.media_mb)
+    print(f"template {len(data) / 2**20:.1f} MB, {args.slides} slides")
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, run in (("temp files", lambda: _via_files(data, Path(tmp))), ("bytes", lambda: _in_memory(data))):
+            best = float("inf")
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                run()
+                best = min(best, time.perf_counter() - start)
+            print(f"{label:<11} best {best * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
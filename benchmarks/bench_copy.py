@@ -0,0 +1,70 @@
+"""copy_slide throughput for many copies from one reuse library.
+
+Copies `--copies` slides from a single library into one deck and reports the whole job
+and the per-op split from `ApplyResult.timings`: the first copy also resolves and checks
+the library path; whether later copies avoid reopening the library is up to
+`pptx-copy-ops`. Needs `pptx-copy-ops`.
+
+    python benchmarks/bench_copy.py --copies 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from pptx import Presentation
+
+from pptx_ooxml_engine.engine import _import_copy_ops, apply_ops
+
+
+def _build_library(path: Path, slides: int) -> None:
+    prs = Presentation()
+    for idx in range(slides):
+        slide = prs.slides.add_slide(prs.slide_layouts[1])
+        slide.shapes.title.text = f"Library slide {idx}"
+        slide.placeholders[1].text = "Body"
+    prs.save(str(path))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--copies", type=int, default=100)
+    parser.add_argument("--library-slides", type=int, default=60)
+    args = parser.parse_args()
+
+    try:
+        _import_copy_ops()
+    except ModuleNotFoundError as exc:
+        raise SystemExit(str(exc))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        template = tmp_path / "template.pptx"
+        library = tmp_path / "library.pptx"
+        Presentation().save(str(template))
+        _build_library(library, args.library_slides)
+        plan = {
+            "template_pptx": str(template),
+            "reuse_slide_libraries": [str(library)],
+            "operations": [
+                {"op": "copy_slide", "reuse_library_index": 0, "source_slide_index": idx % args.library_slides}
+                for idx in range(args.copies)
+            ],
+        }
+        start = time.perf_counter()
+        result = apply_ops(None, plan, tmp_path / "out.pptx", profile=True)
+        elapsed = time.perf_counter() - start
+
+    copies = [event.wall * 1000 for event in result.timings.ops]
+    print(f"{args.copies} copies from one library: {elapsed * 1000:.1f} ms ({args.copies / elapsed:.1f} copies/s)")
+    print(f"  first copy {copies[0]:.2f} ms, later copies median {statistics.median(copies[1:]):.2f} ms")
+    for name, event in result.timings.phases.items():
+        print(f"  {name:<6} {event.wall * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
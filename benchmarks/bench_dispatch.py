@@ -0,0 +1,106 @@
+"""Per-op dispatch overhead: the former isinstance chain versus the handler table.
+
+Handlers are no-ops, so the numbers isolate the cost of finding the handler.
+
+    python benchmarks/bench_dispatch.py --ops 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from pptx_ooxml_engine import models
+from pptx_ooxml_engine.engine import _OP_HANDLERS
+
+# Order of the isinstance checks in apply_ops before the handler table was introduced.
+_CHAIN_ORDER = [
+    models.CopySlideOp,
+    models.CreateSlideOnLayoutOp,
+    models.RewriteTextOp,
+    models.DeleteSlideOp,
+    models.MoveSlideOp,
+    models.SetSlideSizeOp,
+    models.SetSlideLayoutOp,
+    models.SetNotesOp,
+    models.AddTextBoxOp,
+    models.SetShapeTextOp,
+    models.AddImageOp,
+    models.AddShapeOp,
+    models.AddTableOp,
+    models.SetSlideBackgroundOp,
+    models.FillPlaceholderOp,
+    models.SetShapeGeometryOp,
+    models.SetShapeZOrderOp,
+    models.AddChartOp,
+    models.UpdateChartDataOp,
+    models.SetTableCellOp,
+    models.MergeTableCellsOp,
+    models.SetTableStyleOp,
+    models.SetTableRowColSizeOp,
+    models.SetShapeHyperlinkOp,
+    models.SetTextHyperlinkOp,
+    models.ReplaceImageOp,
+    models.AlignShapesOp,
+    models.DistributeShapesOp,
+]
+
+
+def _noop(op, ctx) -> None:
+    return None
+
+
+def _dispatch_chain(operations, ctx) -> None:
+    for op in operations:
+        for op_cls in _CHAIN_ORDER:
+            if isinstance(op, op_cls):
+                _noop(op, ctx)
+                break
+        else:
+            raise ValueError(f"Unsupported operation type: {type(op)!r}")
+
+
+def _dispatch_table(operations, ctx) -> None:
+    handlers = {name: _noop for name in _OP_HANDLERS}
+    for op in operations:
+        handler = handlers.get(getattr(op, "op", None))
+        if handler is None:
+            raise ValueError(f"Unsupported operation type: {type(op)!r}")
+        handler(op, ctx)
+
+
+def _build_ops(count: int) -> list:
+    cell = models.SetTableCellOp.model_construct(op="set_table_cell", slide_index=0, table_index=0, row=0, col=0)
+    rewrite = models.RewriteTextOp.model_construct(op="rewrite_text", slide_index=0, find="a", replace="b")
+    distribute = models.DistributeShapesOp.model_construct(op="distribute_shapes", slide_index=0)
+    mix = [cell, cell, rewrite, distribute]
+    return [mix[idx % len(mix)] for idx in range(count)]
+
+
+def _best_of(fn, operations, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(operations, None)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ops", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    operations = _build_ops(args.ops)
+    chain = _best_of(_dispatch_chain, operations, args.repeat)
+    table = _best_of(_dispatch_table, operations, args.repeat)
+    print(f"ops={args.ops} (set_table_cell/rewrite_text/distribute_shapes mix)")
+    print(f"isinstance chain : {chain / args.ops * 1e9:8.1f} ns/op")
+    print(f"handler table    : {table / args.ops * 1e9:8.1f} ns/op")
+    print(f"speedup          : {chain / table:8.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
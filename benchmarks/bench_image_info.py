@@ -0,0 +1,81 @@
+"""Catalog renders reusing one photo set: image metadata cache cold versus warm.
+
+Each render places `--per-deck` photos (drawn from a pool of `--photos`) with `contain`
+fit. Cold clears the process-wide `ImageInfoCache` before every render, so each photo's
+header is sniffed and its bytes hashed again; warm keeps it across renders, as a
+long-lived worker does. Photo bytes are still read once per render to embed them.
+
+    python benchmarks/bench_image_info.py --photos 300 --per-deck 100 --renders 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import tempfile
+from pathlib import Path
+
+from PIL import Image
+from pptx import Presentation
+
+from pptx_ooxml_engine.cache import get_image_info_cache
+from pptx_ooxml_engine.engine import apply_ops
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--photos", type=int, default=300)
+    parser.add_argument("--per-deck", type=int, default=100)
+    parser.add_argument("--renders", type=int, default=5)
+    parser.add_argument("--side", type=int, default=1200, help="Photo width in pixels (4:3, noisy JPEG)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        template = tmp_path / "template.pptx"
+        prs = Presentation()
+        for _ in range(args.per_deck // 4):
+            prs.slides.add_slide(prs.slide_layouts[6])
+        prs.save(str(template))
+        photos = []
+        noise = Image.effect_noise((args.side, args.side * 3 // 4), 60).convert("RGB")
+        for idx in range(args.photos):
+            photo = tmp_path / f"photo_{idx}.jpg"
+            # Distinct bytes per photo at photo-like sizes.
+            noise.putpixel((idx % args.side, 0), (idx % 256, idx // 256 % 256, 90))
+            noise.save(photo, quality=85)
+            photos.append(photo)
+
+        def render(job: int) -> float:
+            ops = [
+                {
+                    "op": "add_image",
+                    "slide_index": idx // 4 % (args.per_deck // 4),
+                    "image_path": str(photos[(job * args.per_deck + idx) % args.photos]),
+                    "x_inches": 0.3 + idx % 4 * 2.4,
+                    "y_inches": 2,
+                    "width_inches": 2.2,
+                    "height_inches": 2.2,
+                    "fit": "contain",
+                }
+                for idx in range(args.per_deck)
+            ]
+            return apply_ops(template, ops, tmp_path / "out.pptx", profile=True).timings.phases["apply"].wall
+
+        cache = get_image_info_cache()
+        # Warm the photo pool once, as a worker that has been serving the catalog would be.
+        for job in range(args.photos // args.per_deck + 1):
+            render(job)
+        warm = [render(job) for job in range(args.renders)]
+        cold = []
+        for job in range(args.renders):
+            cache.clear()
+            cold.append(render(job))
+
+    print(f"{args.per_deck} photos per render from a pool of {args.photos}, apply phase per render")
+    print(f"  cold metadata cache  {statistics.median(cold) * 1000:8.1f} ms")
+    print(f"  warm metadata cache  {statistics.median(warm) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
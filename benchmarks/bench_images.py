@@ -0,0 +1,86 @@
+"""Placing one logo on every slide: python-pptx `add_picture` versus `apply_ops`.
+
+`add_picture` reads and hashes the file on every call, then walks the package and
+rehashes existing image parts until one matches. Placed first-to-last, the match is
+the logo already on slide 1; placed last-to-first, every insert walks past all the
+template images. `apply_ops` reads each file once per job and hashes existing parts
+only on a size match. Also reports the media dedup pass on a deck without duplicates.
+
+    python benchmarks/bench_images.py --slides 200 --template-images 40
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from pptx import Presentation
+from pptx.util import Inches
+
+from pptx_ooxml_engine.engine import apply_ops
+from pptx_ooxml_engine.media import dedupe_media
+
+
+def _write_bmp(path: Path, seed: int, side: int = 256) -> None:
+    # Uncompressed BMP so each image is a sizeable, distinct blob.
+    row = side * 3
+    pixels = (bytes([seed % 256, (seed * 7) % 256, (seed * 13) % 256]) * side) * side
+    header = b"BM" + (54 + row * side).to_bytes(4, "little") + b"\0\0\0\0" + (54).to_bytes(4, "little")
+    info = (40).to_bytes(4, "little") + side.to_bytes(4, "little") + side.to_bytes(4, "little")
+    info += (1).to_bytes(2, "little") + (24).to_bytes(2, "little") + b"\0" * 24
+    path.write_bytes(header + info + pixels)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--slides", type=int, default=200)
+    parser.add_argument("--template-images", type=int, default=40)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        template = tmp_path / "template.pptx"
+        prs = Presentation()
+        for idx in range(args.slides):
+            slide = prs.slides.add_slide(prs.slide_layouts[6])
+            if idx < args.template_images:
+                image = tmp_path / f"photo_{idx}.bmp"
+                _write_bmp(image, idx + 1)
+                slide.shapes.add_picture(str(image), Inches(2), Inches(2))
+        prs.save(str(template))
+        logo = tmp_path / "logo.bmp"
+        _write_bmp(logo, 0)
+
+        order = {"first-to-last": list(range(args.slides)), "last-to-first": list(range(args.slides))[::-1]}
+        add_picture, engine_apply = {}, {}
+        output = tmp_path / "out.pptx"
+        for label, indexes in order.items():
+            prs = Presentation(str(template))
+            start = time.perf_counter()
+            for idx in indexes:
+                prs.slides[idx].shapes.add_picture(str(logo), Inches(0.2), Inches(0.2), Inches(1), Inches(1))
+            add_picture[label] = time.perf_counter() - start
+
+            ops = [
+                {"op": "add_image", "slide_index": idx, "image_path": str(logo),
+                 "x_inches": 0.2, "y_inches": 0.2, "width_inches": 1, "height_inches": 1}
+                for idx in indexes
+            ]
+            result = apply_ops(template, ops, output, profile=True)
+            engine_apply[label] = result.timings.phases["apply"].wall
+
+        deck = Presentation(str(output))
+        start = time.perf_counter()
+        dedupe_media(deck.part.package)
+        dedupe = time.perf_counter() - start
+
+    print(f"{args.slides} slides, {args.template_images} template images, one logo per slide")
+    for label in order:
+        print(f"  {label:<14} add_picture loop {add_picture[label] * 1000:8.1f} ms   apply_ops {engine_apply[label] * 1000:8.1f} ms")
+    print(f"  dedup pass on the output (no duplicates) {dedupe * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
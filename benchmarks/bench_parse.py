@@ -0,0 +1,76 @@
+"""Plan parse throughput (ops/sec): json.loads + parse_plan versus parse_plan_json.
+
+The plan mixes text, shape, table and chart ops so several union members and their
+model validators are exercised. The last column is the cost of re-parsing the same
+bytes under an already-trusted content hash, which skips validation entirely.
+
+    python benchmarks/bench_parse.py --ops 1000 10000 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import time
+
+from pptx_ooxml_engine.models import parse_plan, parse_plan_json
+
+_TEMPLATES = [
+    {"op": "rewrite_text", "slide_index": 0, "find": "Old", "replace": "New"},
+    {
+        "op": "add_textbox",
+        "slide_index": 0,
+        "x_inches": 1.0,
+        "y_inches": 1.0,
+        "width_inches": 3.0,
+        "height_inches": 1.0,
+        "text": "Hello",
+        "font_size_pt": 18,
+        "bold": True,
+    },
+    {"op": "set_table_cell", "slide_index": 0, "table_index": 0, "row": 1, "col": 2, "text": "42"},
+    {"op": "set_shape_geometry", "slide_index": 0, "shape_name": "box", "x_inches": 2.0, "y_inches": 2.0},
+    {
+        "op": "update_chart_data",
+        "slide_index": 0,
+        "chart_index": 0,
+        "categories": ["Q1", "Q2", "Q3"],
+        "series": [{"name": "Revenue", "values": [1, 2, 3]}],
+    },
+]
+
+
+def _plan_bytes(count: int) -> bytes:
+    operations = [_TEMPLATES[idx % len(_TEMPLATES)] for idx in range(count)]
+    return json.dumps({"template_pptx": "template.pptx", "operations": operations}).encode("utf-8")
+
+
+def _best(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ops", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'ops':>8} {'parse_plan ops/s':>17} {'parse_plan_json ops/s':>22} {'trusted hit ms':>15}")
+    for count in args.ops:
+        data = _plan_bytes(count)
+        content_hash = hashlib.sha256(data).hexdigest()
+        baseline = _best(lambda: parse_plan(json.loads(data)), args.repeat)
+        native = _best(lambda: parse_plan_json(data), args.repeat)
+        parse_plan_json(data, content_hash=content_hash)
+        trusted = _best(lambda: parse_plan_json(data, content_hash=content_hash), args.repeat)
+        print(f"{count:>8} {count / baseline:>17,.0f} {count / native:>22,.0f} {trusted * 1000:>15.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Cost of the timing instrumentation in the op loop: profiling off versus on.
+
+Handlers are no-ops and the loop is `engine._run_operations` itself, so the numbers are
+the per-op price of the disabled check and of collecting one `TimingEvent` per op.
+
+    python benchmarks/bench_profile.py --ops 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from pptx_ooxml_engine import engine, models
+from pptx_ooxml_engine.profiling import _Profiler
+
+
+def _noop(op, ctx) -> None:
+    return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ops", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine._OP_HANDLERS = {name: _noop for name in engine._OP_HANDLERS}
+    op = models.RewriteTextOp.model_construct(op="rewrite_text", slide_index=0, find="a", replace="b")
+    operations = [op] * args.ops
+
+    for label, make_profiler in (("profiling off", lambda: None), ("profiling on", _Profiler)):
+        best = float("inf")
+        for _ in range(args.repeat):
+            ctx = engine.ApplyContext.__new__(engine.ApplyContext)
+            ctx.cancel_event = None
+            ctx.profiler = make_profiler()
+            start = time.perf_counter()
+            engine._run_operations(operations, ctx)
+            best = min(best, time.perf_counter() - start)
+        print(f"{label:<14} {best / args.ops * 1e9:8.1f} ns/op")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Save time on a media-heavy template: python-pptx save versus the engine's writer.
+
+Builds a template carrying `--media-mb` of incompressible video parts, edits one slide
+title, then saves the result three ways:
+
+- `Presentation.save`: every part re-serialized and re-compressed
+- `save_presentation(..., source=...)`: unchanged bytes copied from the template zip
+- `save_presentation(..., clean_parts=...)`: parts no op touched are not even serialized
+
+    python benchmarks/bench_save.py --media-mb 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from pptx import Presentation
+from pptx.util import Inches
+
+from pptx_ooxml_engine.engine import ApplyContext, _apply_rewrite
+from pptx_ooxml_engine.models import RewriteTextOp
+from pptx_ooxml_engine.writer import save_presentation
+
+_CHUNK_MB = 10
+
+
+def _build_template(path: Path, media_mb: int, workdir: Path) -> None:
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[0])
+    slide.shapes.title.text = "Benchmark Title"
+    remaining = media_mb
+    idx = 0
+    while remaining > 0:
+        size_mb = min(_CHUNK_MB, remaining)
+        movie = workdir / f"clip_{idx}.mp4"
+        movie.write_bytes(os.urandom(size_mb * 1024 * 1024))
+        media_slide = prs.slides.add_slide(prs.slide_layouts[6])
+        media_slide.shapes.add_movie(str(movie), Inches(1), Inches(1), Inches(4), Inches(3), mime_type="video/mp4")
+        remaining -= size_mb
+        idx += 1
+    prs.save(str(path))
+
+
+def _edited(template: Path) -> ApplyContext:
+    ctx = ApplyContext(presentation=Presentation(str(template)))
+    _apply_rewrite(RewriteTextOp(op="rewrite_text", slide_index=0, find="Benchmark", replace="Edited"), ctx)
+    return ctx
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--media-mb", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        template = workdir / "template.pptx"
+        _build_template(template, args.media_mb, workdir)
+        print(f"template: {template.stat().st_size / 1e6:.1f} MB, {args.repeat} runs each (best)")
+
+        variants = {
+            "Presentation.save": lambda ctx, out: ctx.presentation.save(str(out)),
+            "save_presentation(source)": lambda ctx, out: save_presentation(ctx.presentation, out, source=template),
+            "save_presentation(source, clean_parts)": lambda ctx, out: save_presentation(
+                ctx.presentation, out, source=template, clean_parts=ctx.clean_parts()
+            ),
+        }
+        for label, save in variants.items():
+            best = float("inf")
+            for run in range(args.repeat):
+                ctx = _edited(template)
+                out = workdir / f"out_{run}.pptx"
+                start = time.perf_counter()
+                save(ctx, out)
+                best = min(best, time.perf_counter() - start)
+                out.unlink()
+            print(f"{label:<40} {best:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Per-deck latency: one CLI process per deck versus requests to a warm `serve` daemon.
+
+The CLI path pays interpreter start, imports and template parsing for every deck; the
+daemon keeps workers with the template already cached. Requests are sent one at a time
+so the numbers are latency, not throughput.
+
+    python benchmarks/bench_serve.py --decks 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from pptx import Presentation
+
+from pptx_ooxml_engine.server import RenderService, make_server
+
+_SRC = Path(__file__).resolve().parents[1] / "src"
+_OPS = [{"op": "rewrite_text", "slide_index": 0, "find": "Old", "replace": "New"}]
+
+
+def _build_template(path: Path, slides: int) -> None:
+    prs = Presentation()
+    for idx in range(slides):
+        prs.slides.add_slide(prs.slide_layouts[1]).shapes.title.text = f"Old Title {idx}"
+    prs.save(str(path))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--decks", type=int, default=20)
+    parser.add_argument("--slides", type=int, default=30)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        template = tmp_path / "template.pptx"
+        _build_template(template, args.slides)
+        ops_file = tmp_path / "ops.json"
+        ops_file.write_text(json.dumps(_OPS), encoding="utf-8")
+
+        cli_times = []
+        env = dict(os.environ, PYTHONPATH=str(_SRC))
+        for idx in range(args.decks):
+            start = time.perf_counter()
+            subprocess.run(
+                [sys.executable, "-m", "pptx_ooxml_engine.cli", "--template", str(template),
+                 "--ops-file", str(ops_file), "--output", str(tmp_path / f"cli_{idx}.pptx")],
+                env=env,
+                check=True,
+                capture_output=True,
+            )
+            cli_times.append(time.perf_counter() - start)
+
+        service = RenderService(workers=1, preload=[template])
+        server = make_server(service, port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        conn = http.client.HTTPConnection(*server.server_address[:2])
+        serve_times = []
+        try:
+            for idx in range(args.decks + 1):
+                body = json.dumps(
+                    {"template_pptx": str(template), "output_pptx": str(tmp_path / f"srv_{idx}.pptx"), "plan": _OPS}
+                )
+                start = time.perf_counter()
+                conn.request("POST", "/render", body=body)
+                response = conn.getresponse()
+                response.read()
+                assert response.status == 200
+                serve_times.append(time.perf_counter() - start)
+            metrics = service.metrics()
+        finally:
+            server.shutdown()
+            server.server_close()
+            service.close()
+
+        # The first request also pays for worker start-up.
+        for label, times in (("cli per deck", cli_times), ("serve warm", serve_times[1:])):
+            print(f"{label:<14} median {statistics.median(times) * 1000:8.1f} ms  max {max(times) * 1000:8.1f} ms")
+        print(f"serve first request {serve_times[0] * 1000:.1f} ms; server p95 {metrics['latency_ms']['p95']:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""CLI cold start: wall time of `--version` and cumulative import time per top-level package.
+
+Each run is a fresh interpreter with `-X importtime`; the table lists the slowest
+top-level imports of the median run. After the package moved to lazy exports, neither
+`--version` nor `--help` should list pptx, lxml or pydantic.
+
+    python benchmarks/bench_startup.py --runs 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+_SRC = Path(__file__).resolve().parents[1] / "src"
+
+
+def _run(args: list[str]) -> tuple[float, dict[str, int]]:
+    env = dict(os.environ, PYTHONPATH=str(_SRC))
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "pptx_ooxml_engine.cli", *args],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    wall = time.perf_counter() - start
+    cumulative: dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative_us, name = (part.strip() for part in line[len("import time:") :].split("|"))
+        if cumulative_us.isdigit() and not name.startswith(" ") and "." not in name:
+            cumulative[name] = int(cumulative_us)
+    return wall, cumulative
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--top", type=int, default=8)
+    args = parser.parse_args()
+
+    for command in (["--version"], ["--help"]):
+        runs = sorted((_run(command) for _ in range(args.runs)), key=lambda run: run[0])
+        wall, imports = runs[len(runs) // 2]
+        print(f"{' '.join(command)}: median {wall * 1000:.1f} ms over {args.runs} runs")
+        print(f"  best {runs[0][0] * 1000:.1f} ms, stdev {statistics.pstdev(r[0] for r in runs) * 1000:.1f} ms")
+        for name, micros in sorted(imports.items(), key=lambda item: -item[1])[: args.top]:
+            print(f"  {name:<24} {micros / 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Peak memory and time-to-first-op: whole-file JSON plans versus streamed JSON Lines.
+
+Each plan is written to disk in both formats and consumed without rendering, so the
+numbers isolate ingestion: the JSON path validates every op before yielding the first,
+the JSONL path validates one line at a time.
+
+    python benchmarks/bench_stream.py --ops 10000 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from pptx_ooxml_engine.models import load_ops_jsonl, parse_plan_json
+
+_OP = {"op": "set_notes", "slide_index": 0, "text": "Speaker notes " * 8}
+
+
+def _consume(load) -> tuple[float, float, int]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    ops = iter(load())
+    next(ops)
+    first = time.perf_counter() - start
+    for _ in ops:
+        pass
+    total = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return first, total, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ops", type=int, nargs="+", default=[10000, 100000])
+    args = parser.parse_args()
+
+    print(f"{'ops':>8} {'format':>6} {'first op ms':>12} {'total s':>8} {'peak MB':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in args.ops:
+            plan_json = Path(tmp) / f"plan_{count}.json"
+            plan_jsonl = Path(tmp) / f"plan_{count}.jsonl"
+            plan_json.write_text(json.dumps({"operations": [_OP] * count}), encoding="utf-8")
+            plan_jsonl.write_text("".join(json.dumps(_OP) + "\n" for _ in range(count)), encoding="utf-8")
+            runs = {
+                "json": lambda: parse_plan_json(plan_json.read_bytes()).operations,
+                "jsonl": lambda: load_ops_jsonl(plan_jsonl),
+            }
+            for label, load in runs.items():
+                first, total, peak = _consume(load)
+                print(f"{count:>8} {label:>6} {first * 1000:>12.2f} {total:>8.3f} {peak / 2**20:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""verify_pptx cost on synthetic decks where every slide shares one layout.
+
+Counts the XML parts parsed per run alongside wall time. Before rels maps and
+layout -> master resolution were memoized, the layout's rels were parsed once per
+slide (2 + 3 * slides parses); now parses grow only with the unique parts.
+
+    python benchmarks/bench_verify.py --slides 250 500 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from pptx import Presentation
+
+from pptx_ooxml_engine import verify
+
+
+def _build_deck(path: Path, slides: int) -> None:
+    prs = Presentation()
+    for idx in range(slides):
+        slide = prs.slides.add_slide(prs.slide_layouts[1])
+        slide.shapes.title.text = f"Slide {idx}"
+        slide.placeholders[1].text = "\n".join(f"Bullet {line}" for line in range(8))
+    prs.save(str(path))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--slides", type=int, nargs="+", default=[250, 500, 1000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    real_fromstring = verify.ET.fromstring
+    parses = 0
+
+    def counting_fromstring(data):
+        nonlocal parses
+        parses += 1
+        return real_fromstring(data)
+
+    verify.ET.fromstring = counting_fromstring
+    print(f"{'slides':>8} {'parses':>8} {'uncached':>9} {'best s':>8} {'ms/slide':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in args.slides:
+            deck = Path(tmp) / f"deck_{count}.pptx"
+            _build_deck(deck, count)
+            best = float("inf")
+            for _ in range(args.repeat):
+                parses = 0
+                start = time.perf_counter()
+                report = verify.verify_pptx(deck)
+                best = min(best, time.perf_counter() - start)
+            assert report.ok, report.issues
+            print(f"{count:>8} {parses:>8} {2 + 3 * count:>9} {best:>8.3f} {best * 1000 / count:>9.3f}")
+    verify.ET.fromstring = real_fromstring
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Serial versus process-sharded verify_pptx on a large, shape-dense deck.
+
+Every slide carries a grid of text boxes, so the per-slide parse and dangling
+`r:id` scan dominate. Speedup is bounded by the CPUs available to the run.
+
+    python benchmarks/bench_verify_parallel.py --slides 800 --workers 1 2 4 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from pptx import Presentation
+from pptx.util import Inches
+
+from pptx_ooxml_engine.verify import verify_pptx
+
+
+def _build_deck(path: Path, slides: int, shapes_per_slide: int) -> None:
+    prs = Presentation()
+    for idx in range(slides):
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        for shape_idx in range(shapes_per_slide):
+            box = slide.shapes.add_textbox(
+                Inches(0.2 + (shape_idx % 8) * 1.2), Inches(0.2 + (shape_idx // 8) * 0.5), Inches(1.1), Inches(0.4)
+            )
+            box.text_frame.text = f"Cell {idx}.{shape_idx}"
+    prs.save(str(path))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--slides", type=int, default=800)
+    parser.add_argument("--shapes-per-slide", type=int, default=40)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        deck = Path(tmp) / "deck.pptx"
+        _build_deck(deck, args.slides, args.shapes_per_slide)
+        print(f"{args.slides} slides x {args.shapes_per_slide} shapes, {os.cpu_count()} CPUs")
+        serial_best = None
+        reference = None
+        for workers in args.workers:
+            best = float("inf")
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                report = verify_pptx(deck, workers=workers)
+                best = min(best, time.perf_counter() - start)
+            if reference is None:
+                reference = report.issues
+            assert report.issues == reference
+            serial_best = serial_best or best
+            print(f"workers={workers:<3} {best:8.3f} s  speedup x{serial_best / best:.2f}")
+
+
+if __name__ == "__main__":
+    main()
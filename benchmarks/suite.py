@@ -0,0 +1,417 @@
+"""Benchmark suite: every op family at increasing deck and plan sizes, with baselines.
+
+Each case runs in a fresh child process so its peak RSS is its own. Templates are
+synthesized once per deck size before any timing; plans are generated in the child.
+Per case the suite reports latency percentiles over `--repeat` runs, throughput in the
+case's unit (ops, slides, cells or points per second) and peak RSS.
+
+    python benchmarks/suite.py --preset small
+    python benchmarks/suite.py --preset medium --json results/medium.json
+    python benchmarks/suite.py --preset medium --baseline results/medium.json --threshold 0.15
+
+With `--baseline`, every case is compared on p50 latency and peak RSS against the stored
+run; the exit status is 1 when any case regresses by more than `--threshold`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mP8/x8AAwMCAO+/a5sAAAAASUVORK5CYII="
+)
+
+# (case, family, params); sizes grow along the axis each family is sensitive to.
+_PRESETS: dict[str, list[tuple[str, str, dict[str, int]]]] = {
+    "small": [
+        ("parse", "parse", {"ops": 1}),
+        ("parse", "parse", {"ops": 1000}),
+        ("parse", "parse", {"ops": 10000}),
+        ("rewrite_text", "text", {"slides": 10, "ops": 10}),
+        ("rewrite_text", "text", {"slides": 100, "ops": 1000}),
+        ("add_textbox", "text", {"slides": 10, "ops": 1000}),
+        ("add_shape", "shape", {"slides": 10, "ops": 1000}),
+        ("add_image", "image", {"slides": 10, "ops": 200}),
+        ("create_slide", "structure", {"slides": 10, "ops": 100}),
+        ("move_slide", "structure", {"slides": 100, "ops": 1000}),
+        ("delete_slide", "structure", {"slides": 100, "ops": 90}),
+        ("copy_slide", "copy", {"slides": 10, "ops": 100}),
+        ("fill_placeholder", "placeholder", {"slides": 100, "ops": 1000}),
+        ("hyperlink", "link", {"slides": 100, "ops": 1000}),
+        ("fill_table", "table", {"rows": 50, "cols": 10}),
+        ("set_table_cell", "table", {"rows": 50, "cols": 10}),
+        ("table_format", "table", {"rows": 50, "cols": 10}),
+        ("add_chart", "chart", {"points": 1000}),
+        ("update_chart_data", "chart", {"points": 1000}),
+        ("verify", "verify", {"slides": 100}),
+    ],
+    "medium": [
+        ("parse", "parse", {"ops": 1}),
+        ("parse", "parse", {"ops": 10000}),
+        ("parse", "parse", {"ops": 100000}),
+        ("rewrite_text", "text", {"slides": 10, "ops": 10}),
+        ("rewrite_text", "text", {"slides": 500, "ops": 10000}),
+        ("add_textbox", "text", {"slides": 100, "ops": 10000}),
+        ("add_shape", "shape", {"slides": 100, "ops": 10000}),
+        ("add_image", "image", {"slides": 100, "ops": 2000}),
+        ("create_slide", "structure", {"slides": 10, "ops": 500}),
+        ("move_slide", "structure", {"slides": 500, "ops": 10000}),
+        ("delete_slide", "structure", {"slides": 500, "ops": 450}),
+        ("copy_slide", "copy", {"slides": 60, "ops": 500}),
+        ("fill_placeholder", "placeholder", {"slides": 500, "ops": 10000}),
+        ("hyperlink", "link", {"slides": 500, "ops": 10000}),
+        ("fill_table", "table", {"rows": 200, "cols": 50}),
+        ("set_table_cell", "table", {"rows": 200, "cols": 50}),
+        ("table_format", "table", {"rows": 200, "cols": 50}),
+        ("add_chart", "chart", {"points": 10000}),
+        ("update_chart_data", "chart", {"points": 10000}),
+        ("verify", "verify", {"slides": 1000}),
+    ],
+    "large": [
+        ("parse", "parse", {"ops": 100000}),
+        ("rewrite_text", "text", {"slides": 5000, "ops": 100000}),
+        ("add_textbox", "text", {"slides": 1000, "ops": 100000}),
+        ("add_shape", "shape", {"slides": 1000, "ops": 100000}),
+        ("add_image", "image", {"slides": 1000, "ops": 10000}),
+        ("create_slide", "structure", {"slides": 10, "ops": 5000}),
+        ("move_slide", "structure", {"slides": 5000, "ops": 100000}),
+        ("delete_slide", "structure", {"slides": 5000, "ops": 4500}),
+        ("copy_slide", "copy", {"slides": 60, "ops": 2000}),
+        ("fill_placeholder", "placeholder", {"slides": 5000, "ops": 100000}),
+        ("hyperlink", "link", {"slides": 5000, "ops": 100000}),
+        ("fill_table", "table", {"rows": 200, "cols": 50}),
+        ("set_table_cell", "table", {"rows": 200, "cols": 50}),
+        ("table_format", "table", {"rows": 200, "cols": 50}),
+        ("add_chart", "chart", {"points": 10000}),
+        ("update_chart_data", "chart", {"points": 10000}),
+        ("verify", "verify", {"slides": 5000}),
+    ],
+}
+
+
+def _build_deck(path: Path, slides: int, chart_points: int = 0) -> None:
+    from pptx import Presentation
+    from pptx.chart.data import CategoryChartData
+    from pptx.enum.chart import XL_CHART_TYPE
+    from pptx.util import Inches
+
+    prs = Presentation()
+    for idx in range(slides):
+        slide = prs.slides.add_slide(prs.slide_layouts[5])
+        slide.shapes.title.text = f"Title {idx}"
+    if chart_points:
+        data = CategoryChartData()
+        data.categories = [f"c{idx}" for idx in range(chart_points)]
+        data.add_series("s", [float(idx) for idx in range(chart_points)])
+        graphic = prs.slides[0].shapes.add_chart(
+            XL_CHART_TYPE.LINE, Inches(1), Inches(1), Inches(6), Inches(4), data
+        )
+        graphic.name = "chart"
+    prs.save(str(path))
+
+
+def _box(op: str, slide: int, idx: int) -> dict[str, Any]:
+    return {
+        "op": op,
+        "slide_index": slide,
+        "x_inches": 0.1 + (idx % 20) * 0.4,
+        "y_inches": 0.1 + (idx // 20 % 15) * 0.4,
+        "width_inches": 0.4,
+        "height_inches": 0.3,
+    }
+
+
+def _table(rows: int, cols: int, text: str = "") -> dict[str, Any]:
+    return {
+        "op": "add_table",
+        "slide_index": 0,
+        "x_inches": 0.2,
+        "y_inches": 1.5,
+        "width_inches": 9.5,
+        "height_inches": 5.5,
+        "data": [[text] * cols for _ in range(rows)],
+        "name": "grid",
+    }
+
+
+def _plan(case: str, params: dict[str, int], workdir: Path, template: str | None) -> tuple[list[dict] | dict, int, str]:
+    """Return the plan for one run, the number of units it processes and the unit name."""
+    slides = params.get("slides", 1)
+    count = params.get("ops", 0)
+    if case == "rewrite_text":
+        return [
+            {"op": "rewrite_text", "slide_index": idx % slides, "find": "Title", "replace": "Title"}
+            for idx in range(count)
+        ], count, "ops"
+    if case == "add_textbox":
+        return [{**_box("add_textbox", idx % slides, idx), "text": f"T{idx}"} for idx in range(count)], count, "ops"
+    if case == "add_shape":
+        return [{**_box("add_shape", idx % slides, idx), "shape_type": "rect"} for idx in range(count)], count, "ops"
+    if case == "add_image":
+        image = workdir / "pixel.png"
+        image.write_bytes(_PNG)
+        return [
+            {**_box("add_image", idx % slides, idx), "image_path": str(image), "fit": "contain"} for idx in range(count)
+        ], count, "ops"
+    if case == "create_slide":
+        return [{"op": "create_slide_on_layout", "layout_index": 1, "title": f"S{idx}"} for idx in range(count)], count, "ops"
+    if case == "move_slide":
+        return [
+            {"op": "move_slide", "from_index": idx % slides, "to_index": idx * 7 % slides} for idx in range(count)
+        ], count, "ops"
+    if case == "delete_slide":
+        return [{"op": "delete_slide", "slide_index": 0} for _ in range(count)], count, "ops"
+    if case == "copy_slide":
+        # The template doubles as the reuse library, so copies land next to their source.
+        return {
+            "template_pptx": template,
+            "reuse_slide_libraries": [template],
+            "operations": [
+                {"op": "copy_slide", "reuse_library_index": 0, "source_slide_index": idx % slides}
+                for idx in range(count)
+            ],
+        }, count, "ops"
+    if case == "fill_placeholder":
+        return [
+            {"op": "fill_placeholder", "slide_index": idx % slides, "placeholder_type": "title", "text": f"P{idx}"}
+            for idx in range(count)
+        ], count, "ops"
+    if case == "hyperlink":
+        # Alternates whole-shape links with links on the matched title text.
+        return [
+            {
+                "op": "set_text_hyperlink" if idx % 2 else "set_shape_hyperlink",
+                "slide_index": idx % slides,
+                "shape_index": 0,
+                "url": f"https://example.com/{idx}",
+                **({"match_text": "Title"} if idx % 2 else {}),
+            }
+            for idx in range(count)
+        ], count, "ops"
+    rows, cols = params.get("rows", 0), params.get("cols", 0)
+    if case == "fill_table":
+        return [
+            _table(rows, cols),
+            {
+                "op": "fill_table",
+                "slide_index": 0,
+                "table_name": "grid",
+                "data": [[row * cols + col for col in range(cols)] for row in range(rows)],
+            },
+        ], rows * cols, "cells"
+    if case == "set_table_cell":
+        return [_table(rows, cols)] + [
+            {"op": "set_table_cell", "slide_index": 0, "table_name": "grid", "row": row, "col": col,
+             "text": str(row * cols + col), "bold": row == 0}
+            for row in range(rows)
+            for col in range(cols)
+        ], rows * cols, "cells"
+    if case == "table_format":
+        # 2x2 merges over the whole grid, then one table-wide style pass.
+        merges = [
+            {"op": "merge_table_cells", "slide_index": 0, "table_name": "grid",
+             "start_row": row, "start_col": col, "end_row": row + 1, "end_col": col + 1}
+            for row in range(0, rows - 1, 2)
+            for col in range(0, cols - 1, 2)
+        ]
+        style = {"op": "set_table_style", "slide_index": 0, "table_name": "grid", "font_size_pt": 9,
+                 "header_bold": True, "header_fill_color_hex": "#1F4E79", "body_fill_color_hex": "#F2F2F2"}
+        return [_table(rows, cols, "x"), *merges, style], rows * cols, "cells"
+    points = params.get("points", 0)
+    series = [{"name": "s", "values": [float(idx % 97) for idx in range(points)]}]
+    categories = [f"c{idx}" for idx in range(points)]
+    if case == "add_chart":
+        return [
+            {
+                "op": "add_chart",
+                "slide_index": 0,
+                "chart_type": "line",
+                "x_inches": 1,
+                "y_inches": 1,
+                "width_inches": 6,
+                "height_inches": 4,
+                "categories": categories,
+                "series": series,
+            }
+        ], points, "points"
+    if case == "update_chart_data":
+        return [
+            {"op": "update_chart_data", "slide_index": 0, "chart_name": "chart", "categories": categories, "series": series}
+        ], points, "points"
+    raise ValueError(f"unknown case: {case}")
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux and bytes on macOS.
+    return peak / 2**20 if sys.platform == "darwin" else peak / 1024
+
+
+def _run_case(case: str, params: dict[str, int], template: str | None, workdir: Path, repeat: int) -> dict:
+    from pptx_ooxml_engine.engine import apply_ops
+    from pptx_ooxml_engine.models import parse_plan_json
+    from pptx_ooxml_engine.verify import verify_pptx
+
+    run: Callable[[], Any]
+    if case == "parse":
+        count = params["ops"]
+        data = json.dumps(
+            {"operations": [{"op": "rewrite_text", "slide_index": 0, "find": "a", "replace": "b"}] * count}
+        ).encode("utf-8")
+        units, unit = count, "ops"
+
+        def run() -> Any:
+            return parse_plan_json(data)
+
+    elif case == "verify":
+        units, unit = params["slides"], "slides"
+
+        def run() -> Any:
+            return verify_pptx(template)
+
+    else:
+        if case == "copy_slide":
+            from pptx_ooxml_engine.engine import _import_copy_ops
+
+            try:
+                _import_copy_ops()
+            except ModuleNotFoundError as exc:
+                return {"skipped": str(exc)}
+        plan, units, unit = _plan(case, params, workdir, template)
+        output = workdir / "out.pptx"
+        # A plan object names its own template.
+        source = None if isinstance(plan, dict) else template
+
+        def run() -> Any:
+            return apply_ops(source, plan, output)
+
+    rss_before = _peak_rss_mb()
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+
+    def pct(fraction: float) -> float:
+        return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))]
+
+    return {
+        "units": units,
+        "unit": unit,
+        "latency_s": {"min": latencies[0], "p50": pct(0.5), "p95": pct(0.95), "max": latencies[-1]},
+        "throughput_per_s": units / pct(0.5) if pct(0.5) else None,
+        "peak_rss_mb": _peak_rss_mb(),
+        "rss_before_mb": rss_before,
+    }
+
+
+def _case_id(case: str, params: dict[str, int]) -> str:
+    return case + "[" + ",".join(f"{key}={value}" for key, value in sorted(params.items())) + "]"
+
+
+def _compare(results: list[dict], baseline_path: Path, threshold: float) -> int:
+    baseline = {item["id"]: item for item in json.loads(baseline_path.read_text(encoding="utf-8"))["results"]}
+    regressions = 0
+    print(f"\ncompared with {baseline_path} (threshold {threshold:.0%})")
+    print(f"{'case':<44} {'p50 delta':>10} {'rss delta':>10}")
+    for item in results:
+        old = baseline.get(item["id"])
+        if old is None:
+            print(f"{item['id']:<44} {'new':>10}")
+            continue
+        p50 = item["latency_s"]["p50"] / old["latency_s"]["p50"] - 1
+        rss = item["peak_rss_mb"] / old["peak_rss_mb"] - 1
+        flag = "  REGRESSION" if p50 > threshold or rss > threshold else ""
+        regressions += bool(flag)
+        print(f"{item['id']:<44} {p50:>+10.1%} {rss:>+10.1%}{flag}")
+    return 1 if regressions else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--preset", choices=sorted(_PRESETS), default="small")
+    parser.add_argument("--family", action="append", help="Only run these op families; repeatable")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", dest="json_path", help="Write machine-readable results here")
+    parser.add_argument("--baseline", help="Results JSON from an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Allowed relative slowdown / RSS growth")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        spec = json.loads(args.child)
+        result = _run_case(spec["case"], spec["params"], spec["template"], Path(spec["workdir"]), spec["repeat"])
+        print(json.dumps(result))
+        return 0
+
+    cases = [item for item in _PRESETS[args.preset] if not args.family or item[1] in args.family]
+    src = str(Path(__file__).resolve().parents[1] / "src")
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [src, os.environ.get("PYTHONPATH")])))
+    results = []
+    print(f"{'case':<44} {'p50 ms':>10} {'p95 ms':>10} {'throughput':>16} {'peak RSS MB':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        templates: dict[tuple[int, int], Path] = {}
+        for case, family, params in cases:
+            template = None
+            if case != "parse":
+                chart_points = params["points"] if case == "update_chart_data" else 0
+                key = (params.get("slides", 1), chart_points)
+                if key not in templates:
+                    templates[key] = Path(tmp) / f"deck_{key[0]}_{key[1]}.pptx"
+                    _build_deck(templates[key], *key)
+                template = str(templates[key])
+            workdir = Path(tempfile.mkdtemp(dir=tmp))
+            spec = {"case": case, "params": params, "template": template, "workdir": str(workdir), "repeat": args.repeat}
+            completed = subprocess.run(
+                [sys.executable, __file__, "--child", json.dumps(spec)],
+                env=env,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            item = {"id": _case_id(case, params), "case": case, "family": family, "params": params}
+            item.update(json.loads(completed.stdout.splitlines()[-1]))
+            if "skipped" in item:
+                print(f"{item['id']:<44} skipped: {item['skipped']}")
+                continue
+            results.append(item)
+            throughput = f"{item['throughput_per_s']:,.0f} {item['unit']}/s"
+            print(
+                f"{item['id']:<44} {item['latency_s']['p50'] * 1000:>10.1f} {item['latency_s']['p95'] * 1000:>10.1f}"
+                f" {throughput:>16} {item['peak_rss_mb']:>12.1f}"
+            )
+
+    report = {
+        "preset": args.preset,
+        "repeat": args.repeat,
+        "machine": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+        },
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "results": results,
+    }
+    if args.json_path:
+        out = Path(args.json_path)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    if args.baseline:
+        return _compare(results, Path(args.baseline), args.threshold)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,26 +1,118 @@
-"""pptx-ooxml-engine public API."""
+"""pptx-ooxml-engine public API.
 
-from .engine import ApplyResult, apply_ops, generate_pptx
-from .models import parse_ops, parse_plan
-from .schema import load_ops_schema
-from .verify import VerifyReport, verify_pptx
+Names are resolved from their submodules on first access, so importing the package
+(and running trivial CLI commands) does not load python-pptx, lxml or pydantic.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING
 
 __version__ = "1.3.0"
 
+_EXPORTS = {
+    "AsyncRenderer": "aio",
+    "aapply_ops": "aio",
+    "agenerate_pptx": "aio",
+    "get_async_renderer": "aio",
+    "ImageInfo": "cache",
+    "ImageInfoCache": "cache",
+    "TemplateCache": "cache",
+    "TemplateCacheStats": "cache",
+    "VerifyCache": "cache",
+    "get_image_info_cache": "cache",
+    "get_template_cache": "cache",
+    "ApplyContext": "engine",
+    "ApplyResult": "engine",
+    "apply_ops": "engine",
+    "generate_pptx": "engine",
+    "register_op_handler": "engine",
+    "render_batch": "engine",
+    "OperationStream": "models",
+    "load_ops_jsonl": "models",
+    "parse_ops": "models",
+    "parse_ops_jsonl": "models",
+    "parse_plan": "models",
+    "parse_plan_json": "models",
+    "ApplyTimings": "profiling",
+    "TimingEvent": "profiling",
+    "RenderOutcome": "parallel",
+    "render_parallel": "parallel",
+    "load_ops_schema": "schema",
+    "VerifyReport": "verify",
+    "verify_presentation": "verify",
+    "verify_pptx": "verify",
+}
+
+if TYPE_CHECKING:
+    from .aio import AsyncRenderer, aapply_ops, agenerate_pptx, get_async_renderer
+    from .cache import (
+        ImageInfo,
+        ImageInfoCache,
+        TemplateCache,
+        TemplateCacheStats,
+        VerifyCache,
+        get_image_info_cache,
+        get_template_cache,
+    )
+    from .engine import ApplyContext, ApplyResult, apply_ops, generate_pptx, register_op_handler, render_batch
+    from .models import OperationStream, load_ops_jsonl, parse_ops, parse_ops_jsonl, parse_plan, parse_plan_json
+    from .parallel import RenderOutcome, render_parallel
+    from .profiling import ApplyTimings, TimingEvent
+    from .schema import load_ops_schema
+    from .verify import VerifyReport, verify_presentation, verify_pptx
+
 __all__ = [
     "__version__",
+    "ApplyContext",
     "ApplyResult",
+    "ApplyTimings",
+    "AsyncRenderer",
+    "ImageInfo",
+    "ImageInfoCache",
+    "OperationStream",
+    "RenderOutcome",
+    "TemplateCache",
+    "TemplateCacheStats",
+    "TimingEvent",
+    "VerifyCache",
     "VerifyReport",
+    "aapply_ops",
+    "agenerate_pptx",
     "apply_ops",
     "generate_pptx",
     "generate_example_outputs",
+    "get_async_renderer",
+    "get_image_info_cache",
+    "get_template_cache",
+    "load_ops_jsonl",
     "load_ops_schema",
     "parse_ops",
+    "parse_ops_jsonl",
     "parse_plan",
+    "parse_plan_json",
+    "register_op_handler",
+    "render_batch",
+    "render_parallel",
+    "verify_presentation",
     "verify_pptx",
 ]
 
 
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
 def generate_example_outputs(*args, **kwargs):
     from .examples_runner import generate_example_outputs as _generate_example_outputs
 
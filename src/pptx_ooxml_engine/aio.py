@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import IO, Any, Iterable
+
+from .cache import TemplateCache
+from .engine import ApplyResult, PptxSource, apply_ops
+from .models import Operation, OperationPlan, OperationStream
+from .profiling import TimingHook
+
+
+class AsyncRenderer:
+    """Run `apply_ops` off the event loop with at most `max_concurrency` jobs at once.
+
+    Jobs run on `executor`, by default a thread pool owned by the renderer and sized to
+    `max_concurrency`; template, image and output I/O all happen inside the job, so the
+    loop never blocks on them. Requests beyond the limit wait on a per-loop semaphore
+    instead of piling onto the executor. Cancelling an awaiting task stops a thread job
+    before its next op and keeps its slot until the job has actually returned; jobs on
+    a `ProcessPoolExecutor` can only be cancelled before they start.
+    """
+
+    def __init__(self, max_concurrency: int | None = None, executor: Executor | None = None) -> None:
+        self.max_concurrency = max_concurrency or os.cpu_count() or 1
+        if self.max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be positive: {self.max_concurrency}")
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="pptx-render"
+        )
+        self._semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    async def apply_ops(
+        self,
+        input_pptx: PptxSource | None,
+        ops: Iterable[Operation] | list[dict] | dict | OperationPlan | OperationStream,
+        output_pptx: str | Path | IO[bytes] | None,
+        verify: bool = False,
+        strict_verify: bool = True,
+        template_pptx: PptxSource | None = None,
+        template_cache: TemplateCache | None = None,
+        incremental_verify: bool = False,
+        profile: bool = False,
+        on_timing: TimingHook | None = None,
+    ) -> ApplyResult:
+        job: dict[str, Any] = dict(
+            input_pptx=input_pptx,
+            ops=ops,
+            output_pptx=output_pptx,
+            verify=verify,
+            strict_verify=strict_verify,
+            template_pptx=template_pptx,
+            template_cache=template_cache,
+            incremental_verify=incremental_verify,
+            profile=profile,
+            on_timing=on_timing,
+        )
+        cancel_event = None
+        if not isinstance(self._executor, ProcessPoolExecutor):
+            cancel_event = job["cancel_event"] = threading.Event()
+
+        async with self._semaphore():
+            submitted = self._executor.submit(partial(apply_ops, **job))
+            future = asyncio.wrap_future(submitted)
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not submitted.cancel() and cancel_event is not None:
+                    cancel_event.set()
+                    # Hold the slot until the job stops so cancelled work still counts.
+                    await asyncio.wait([future])
+                raise
+
+    async def generate_pptx(
+        self,
+        template_pptx: PptxSource,
+        ops: Iterable[Operation] | list[dict] | dict | OperationPlan | OperationStream,
+        output_pptx: str | Path | IO[bytes] | None = None,
+        verify: bool = False,
+        strict_verify: bool = True,
+        template_cache: TemplateCache | None = None,
+        incremental_verify: bool = False,
+        profile: bool = False,
+        on_timing: TimingHook | None = None,
+    ) -> ApplyResult:
+        return await self.apply_ops(
+            input_pptx=None,
+            template_pptx=template_pptx,
+            ops=ops,
+            output_pptx=output_pptx,
+            verify=verify,
+            strict_verify=strict_verify,
+            template_cache=template_cache,
+            incremental_verify=incremental_verify,
+            profile=profile,
+            on_timing=on_timing,
+        )
+
+    def close(self) -> None:
+        if self._owns_executor:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+_DEFAULT_RENDERER: AsyncRenderer | None = None
+_DEFAULT_RENDERER_LOCK = threading.Lock()
+
+
+def get_async_renderer() -> AsyncRenderer:
+    """Process-wide renderer used by `aapply_ops` / `agenerate_pptx` (one slot per CPU)."""
+    global _DEFAULT_RENDERER
+    with _DEFAULT_RENDERER_LOCK:
+        if _DEFAULT_RENDERER is None:
+            _DEFAULT_RENDERER = AsyncRenderer()
+        return _DEFAULT_RENDERER
+
+
+async def aapply_ops(
+    input_pptx: PptxSource | None,
+    ops: Iterable[Operation] | list[dict] | dict | OperationPlan | OperationStream,
+    output_pptx: str | Path | IO[bytes] | None,
+    verify: bool = False,
+    strict_verify: bool = True,
+    template_pptx: PptxSource | None = None,
+    template_cache: TemplateCache | None = None,
+    incremental_verify: bool = False,
+    profile: bool = False,
+    on_timing: TimingHook | None = None,
+    renderer: AsyncRenderer | None = None,
+) -> ApplyResult:
+    """Async `apply_ops` on `renderer` (default: `get_async_renderer()`)."""
+    return await (renderer or get_async_renderer()).apply_ops(
+        input_pptx,
+        ops,
+        output_pptx,
+        verify=verify,
+        strict_verify=strict_verify,
+        template_pptx=template_pptx,
+        template_cache=template_cache,
+        incremental_verify=incremental_verify,
+        profile=profile,
+        on_timing=on_timing,
+    )
+
+
+async def agenerate_pptx(
+    template_pptx: PptxSource,
+    ops: Iterable[Operation] | list[dict] | dict | OperationPlan | OperationStream,
+    output_pptx: str | Path | IO[bytes] | None = None,
+    verify: bool = False,
+    strict_verify: bool = True,
+    template_cache: TemplateCache | None = None,
+    incremental_verify: bool = False,
+    profile: bool = False,
+    on_timing: TimingHook | None = None,
+    renderer: AsyncRenderer | None = None,
+) -> ApplyResult:
+    """Async `generate_pptx` on `renderer` (default: `get_async_renderer()`)."""
+    return await (renderer or get_async_renderer()).generate_pptx(
+        template_pptx,
+        ops,
+        output_pptx,
+        verify=verify,
+        strict_verify=strict_verify,
+        template_cache=template_cache,
+        incremental_verify=incremental_verify,
+        profile=profile,
+        on_timing=on_timing,
+    )
@@ -0,0 +1,396 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from io import BytesIO
+from pathlib import Path
+from typing import Iterable
+from zipfile import ZipFile
+
+from pptx import Presentation
+from pptx.parts.image import Image
+
+DEFAULT_TEMPLATE_CACHE_BYTES = 512 * 1024 * 1024
+DEFAULT_VERIFY_CACHE_ENTRIES = 50_000
+DEFAULT_IMAGE_INFO_CACHE_ENTRIES = 4096
+# Bump when the shape of a cached verification result changes.
+_VERIFY_CACHE_FORMAT = b"pptx-ooxml-engine/verify/1"
+
+
+@dataclass
+class TemplateCacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    current_bytes: int
+    max_bytes: int
+
+
+@dataclass
+class _TemplateEntry:
+    key: tuple[str, int, int]
+    digest: str
+    cost: int
+    presentation: Presentation
+
+
+def file_key(path: Path) -> tuple[str, int, int]:
+    """Path, mtime and size of a file: the identity the caches use to notice it changed."""
+    stat = path.stat()
+    return str(path), stat.st_mtime_ns, stat.st_size
+
+
+def _package_cost(data: bytes) -> int:
+    # Uncompressed member sizes are a closer proxy for parsed size than the zip size.
+    with ZipFile(BytesIO(data)) as archive:
+        return sum(info.file_size for info in archive.infolist())
+
+
+class TemplateCache:
+    """LRU cache of pristine parsed templates; every `open` returns an independent clone.
+
+    Entries are keyed by resolved path, mtime and size; a content hash lets identical
+    templates stored under different paths share one parsed package.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_TEMPLATE_CACHE_BYTES):
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive: {max_bytes}")
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple[str, int, int], _TemplateEntry] = OrderedDict()
+        self._current_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def open(self, path: str | Path) -> Presentation:
+        return copy.deepcopy(self._pristine(Path(path).expanduser().resolve()))
+
+    def stats(self) -> TemplateCacheStats:
+        with self._lock:
+            return TemplateCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                current_bytes=self._current_bytes,
+                max_bytes=self.max_bytes,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+            self._hits = self._misses = self._evictions = 0
+
+    def _pristine(self, path: Path) -> Presentation:
+        key = file_key(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry.presentation
+
+        data = path.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            twin = next((item for item in self._entries.values() if item.digest == digest), None)
+            if twin is not None:
+                self._hits += 1
+                if twin.key[0] == key[0]:
+                    # Same file touched without a content change: re-key the entry in place.
+                    del self._entries[twin.key]
+                    twin.key = key
+                    self._entries[key] = twin
+                else:
+                    self._drop_stale(key)
+                    # Aliases share the twin's package, so only the twin carries the cost.
+                    self._entries[key] = _TemplateEntry(key=key, digest=digest, cost=0, presentation=twin.presentation)
+                return twin.presentation
+            self._misses += 1
+            cost = _package_cost(data)
+
+        presentation = Presentation(BytesIO(data))
+        with self._lock:
+            self._drop_stale(key)
+            if cost <= self.max_bytes:
+                self._entries[key] = _TemplateEntry(key=key, digest=digest, cost=cost, presentation=presentation)
+                self._current_bytes += cost
+                self._evict()
+        return presentation
+
+    def _drop_stale(self, key: tuple[str, int, int]) -> None:
+        # Only the outdated key goes; aliases of its old content stay valid.
+        for stale_key in [item for item in self._entries if item[0] == key[0] and item != key]:
+            entry = self._entries.pop(stale_key)
+            if not entry.cost:
+                continue
+            heir = next((item for item in self._entries.values() if item.digest == entry.digest), None)
+            if heir is not None:
+                heir.cost = entry.cost
+            else:
+                self._current_bytes -= entry.cost
+
+    def _evict(self) -> None:
+        while self._current_bytes > self.max_bytes and self._entries:
+            # Aliases share one parsed package, so memory is only freed by dropping them all.
+            digest = next(iter(self._entries.values())).digest
+            for key in [key for key, item in self._entries.items() if item.digest == digest]:
+                self._current_bytes -= self._entries.pop(key).cost
+                self._evictions += 1
+
+
+_DEFAULT_TEMPLATE_CACHE: TemplateCache | None = None
+_DEFAULT_TEMPLATE_CACHE_LOCK = threading.Lock()
+
+
+def get_template_cache() -> TemplateCache:
+    """Return the process-level template cache shared by callers that opt in."""
+    global _DEFAULT_TEMPLATE_CACHE
+    with _DEFAULT_TEMPLATE_CACHE_LOCK:
+        if _DEFAULT_TEMPLATE_CACHE is None:
+            _DEFAULT_TEMPLATE_CACHE = TemplateCache()
+        return _DEFAULT_TEMPLATE_CACHE
+
+
+@dataclass(frozen=True)
+class ImageInfo:
+    """Decoded header facts of one image file: pixel size, format, SHA1 and byte size."""
+
+    width: int
+    height: int
+    ext: str
+    content_type: str
+    sha1: str
+    byte_size: int
+
+    @property
+    def size(self) -> tuple[int, int]:
+        return self.width, self.height
+
+
+@dataclass
+class ImageInfoCacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    max_entries: int
+
+
+class ImageInfoCache:
+    """Bounded LRU of `ImageInfo` keyed by resolved path, mtime and size.
+
+    Lets fit math and image-part matching skip reading and sniffing a file that an
+    earlier job (or op) already decoded. Entries are a few hundred bytes each; a file
+    that changes on disk is decoded again and replaces its old entry.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_IMAGE_INFO_CACHE_ENTRIES):
+        if max_entries <= 0:
+            raise ValueError(f"max_entries must be positive: {max_entries}")
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[tuple[str, int, int], ImageInfo]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, path: str | Path) -> ImageInfo:
+        return self.lookup(Path(path).expanduser().resolve())[0]
+
+    def lookup(self, path: Path) -> tuple[ImageInfo, bytes | None]:
+        """Info for the resolved `path`, plus the file's bytes when it had to be read."""
+        key = file_key(path)
+        with self._lock:
+            entry = self._entries.get(key[0])
+            if entry is not None and entry[0] == key:
+                self._entries.move_to_end(key[0])
+                self._hits += 1
+                return entry[1], None
+            self._misses += 1
+
+        image = Image.from_file(str(path))
+        width, height = image.size
+        info = ImageInfo(
+            width=width,
+            height=height,
+            ext=image.ext,
+            content_type=image.content_type,
+            sha1=image.sha1,
+            byte_size=len(image.blob),
+        )
+        with self._lock:
+            self._entries[key[0]] = (key, info)
+            self._entries.move_to_end(key[0])
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return info, image.blob
+
+    def stats(self) -> ImageInfoCacheStats:
+        with self._lock:
+            return ImageInfoCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                max_entries=self.max_entries,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+
+_DEFAULT_IMAGE_INFO_CACHE: ImageInfoCache | None = None
+_DEFAULT_IMAGE_INFO_CACHE_LOCK = threading.Lock()
+
+
+def get_image_info_cache() -> ImageInfoCache:
+    """Return the process-level image metadata cache used by image ops."""
+    global _DEFAULT_IMAGE_INFO_CACHE
+    with _DEFAULT_IMAGE_INFO_CACHE_LOCK:
+        if _DEFAULT_IMAGE_INFO_CACHE is None:
+            _DEFAULT_IMAGE_INFO_CACHE = ImageInfoCache()
+        return _DEFAULT_IMAGE_INFO_CACHE
+
+
+def default_verify_cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "pptx-ooxml-engine" / "verify"
+
+
+class VerifyCache:
+    """On-disk store of per-slide verification results keyed by content hash.
+
+    `verify_pptx` only caches slide checks (keyed by the slide and its rels part); the
+    presentation, layout and master checks run on every call. Each entry is a small JSON
+    file named after the sha256 of the inputs that determine the result. Hits refresh the
+    file's mtime; once more than `max_entries` are stored the least recently used tenth
+    is removed. Writes are atomic, so processes can share one directory.
+    """
+
+    def __init__(self, directory: str | Path | None = None, max_entries: int = DEFAULT_VERIFY_CACHE_ENTRIES):
+        if max_entries <= 0:
+            raise ValueError(f"max_entries must be positive: {max_entries}")
+        self.directory = Path(directory).expanduser() if directory is not None else default_verify_cache_dir()
+        self.max_entries = max_entries
+        self.writes = 0
+        self._count: int | None = None
+        self._owner = True
+
+    def __getstate__(self) -> dict:
+        # Copies sent to worker processes only read and write entries; the owner keeps
+        # the count and evicts, see `note_written`.
+        return {
+            "directory": self.directory,
+            "max_entries": self.max_entries,
+            "writes": 0,
+            "_count": None,
+            "_owner": False,
+        }
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self._entry_paths())
+
+    @staticmethod
+    def key(*blobs: bytes | None) -> str:
+        return VerifyCache.key_chunks(*(None if blob is None else (len(blob), (blob,)) for blob in blobs))
+
+    @staticmethod
+    def key_chunks(*inputs: tuple[int, Iterable[bytes]] | None) -> str:
+        """`key` of inputs given as `(size, chunks)`, so a part can be hashed as it is read."""
+        digest = hashlib.sha256(_VERIFY_CACHE_FORMAT)
+        for item in inputs:
+            if item is None:
+                digest.update(b"\xff" * 8)
+                continue
+            size, chunks = item
+            digest.update(size.to_bytes(8, "big"))
+            for chunk in chunks:
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> dict | None:
+        path = self._path(key)
+        try:
+            value = json.loads(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    def put(self, key: str, value: dict) -> bool:
+        """Store `value`; returns False if the entry already existed."""
+        path = self._path(key)
+        if path.exists():
+            return False
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(json.dumps(value, separators=(",", ":")).encode("utf-8"))
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        self.writes += 1
+        if self._owner:
+            self.note_written(1)
+        return True
+
+    def note_written(self, count: int) -> None:
+        """Account for `count` new entries (possibly written by another process) and evict."""
+        if count <= 0:
+            return
+        if self._count is None:
+            self._count = len(self)
+        else:
+            self._count += count
+        if self._count > self.max_entries:
+            self._evict()
+
+    def clear(self) -> None:
+        for path in list(self._entry_paths()):
+            path.unlink(missing_ok=True)
+        self._count = 0
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _entry_paths(self):
+        if self.directory.is_dir():
+            yield from self.directory.glob("??/*.json")
+
+    def _evict(self) -> None:
+        entries = []
+        for path in self._entry_paths():
+            try:
+                entries.append((path.stat().st_mtime_ns, path))
+            except OSError:
+                continue
+        entries.sort()
+        keep = self.max_entries - self.max_entries // 10
+        for _, path in entries[: max(len(entries) - keep, 0)]:
+            path.unlink(missing_ok=True)
+        self._count = min(len(entries), keep)
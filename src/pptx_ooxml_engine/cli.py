@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import argparse
-import json
+from pathlib import Path
 
 from . import __version__
-from .engine import apply_ops
+
+# The engine and models (python-pptx, lxml, pydantic) are imported only by commands
+# that render, so `--version` and `--help` start without them.
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -12,7 +14,7 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--version", action="store_true", help="Print package version")
     parser.add_argument("--template", dest="template_pptx", help="Master template PPTX path")
     parser.add_argument("--input", dest="template_pptx", help=argparse.SUPPRESS)
-    parser.add_argument("--ops-file", help="Operations JSON file path")
+    parser.add_argument("--ops-file", help="Operations JSON or JSONL file path")
     parser.add_argument("--output", help="Output PPTX path")
     parser.add_argument("--verify", action="store_true", help="Run OOXML verification after apply")
     parser.add_argument(
@@ -20,21 +22,99 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Do not fail command when verifier reports issues",
     )
+
+    subparsers = parser.add_subparsers(dest="command")
+    batch = subparsers.add_parser("batch", help="Render many ops files against one template")
+    batch.add_argument("ops_files", nargs="+", help="Operations JSON or JSONL file paths")
+    batch.add_argument("--template", dest="template_pptx", required=True, help="Master template PPTX path")
+    batch.add_argument("--output-dir", required=True, help="Output directory; each deck is named after its ops file")
+    batch.add_argument("--verify", action="store_true", help="Run OOXML verification after apply")
+    batch.add_argument(
+        "--no-strict-verify",
+        action="store_true",
+        help="Do not fail command when verifier reports issues",
+    )
+
+    serve = subparsers.add_parser("serve", help="Run a warm render daemon over localhost HTTP or a Unix socket")
+    serve.add_argument("--host", default="127.0.0.1", help="HTTP bind address (default: 127.0.0.1)")
+    serve.add_argument("--port", type=int, default=8765, help="HTTP port (default: 8765)")
+    serve.add_argument("--socket", dest="unix_socket", help="Serve on this Unix domain socket instead of TCP")
+    serve.add_argument("--workers", type=int, help="Render worker processes (default: CPU count)")
+    serve.add_argument("--max-queue", type=int, help="Jobs queued beyond busy workers before rejecting with 503")
+    serve.add_argument("--timeout", type=float, help="Per-job timeout in seconds")
+    serve.add_argument(
+        "--preload",
+        action="append",
+        default=[],
+        metavar="TEMPLATE",
+        help="Template PPTX to parse into every worker at startup; repeatable",
+    )
+    serve.add_argument("--output-root", help="Directory outputs must be written under (default: current directory)")
+    serve.add_argument("--template-root", help="Directory templates and plan input files must be read from (default: current directory)")
+    serve.add_argument("--allow-remote", action="store_true", help="Allow --host to be a non-loopback address")
     return parser
 
 
+def _load_ops_file(path: str | Path):
+    from .models import load_ops_jsonl, parse_plan_json
+
+    if Path(path).suffix.lower() == ".jsonl":
+        return load_ops_jsonl(path)
+    return parse_plan_json(Path(path).read_bytes())
+
+
+def _run_batch(args: argparse.Namespace) -> int:
+    from .engine import render_batch
+
+    for result in render_batch(
+        template_pptx=args.template_pptx,
+        plans=(_load_ops_file(ops_file) for ops_file in args.ops_files),
+        output_dir=args.output_dir,
+        verify=args.verify,
+        strict_verify=not args.no_strict_verify,
+        names=[Path(ops_file).stem for ops_file in args.ops_files],
+    ):
+        print(result.output_path, flush=True)
+    return 0
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
     if args.version:
         print(__version__)
         return 0
+    if args.command == "batch":
+        stems = [Path(ops_file).stem for ops_file in args.ops_files]
+        duplicates = sorted({stem for stem in stems if stems.count(stem) > 1})
+        if duplicates:
+            parser.error(f"batch outputs would overwrite each other; duplicate ops file names: {', '.join(duplicates)}")
+        return _run_batch(args)
+    if args.command == "serve":
+        from .server import _is_loopback, serve
+
+        if args.unix_socket is None and not args.allow_remote and not _is_loopback(args.host):
+            parser.error(f"--host {args.host} is not a loopback address; pass --allow-remote to serve on it")
+        serve(
+            host=args.host,
+            port=args.port,
+            unix_socket=args.unix_socket,
+            workers=args.workers,
+            max_queue=args.max_queue,
+            timeout=args.timeout,
+            preload=args.preload,
+            output_root=args.output_root,
+            template_root=args.template_root,
+            allow_remote=args.allow_remote,
+        )
+        return 0
     if not args.ops_file or not args.output:
         parser.print_help()
         return 0
 
-    with open(args.ops_file, "r", encoding="utf-8") as f:
-        raw_ops = json.load(f)
+    from .engine import apply_ops
+
+    raw_ops = _load_ops_file(args.ops_file)
 
     result = apply_ops(
         template_pptx=args.template_pptx,
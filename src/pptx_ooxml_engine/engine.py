@@ -1,18 +1,29 @@
 from __future__ import annotations
 
+import copy
+import os
 import sys
-from dataclasses import dataclass
+import threading
+import time
+from concurrent.futures import CancelledError
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from io import BytesIO
 from pathlib import Path
-from typing import Iterable
+from typing import IO, Any, Callable, Iterable, Iterator, Union
 
+from lxml import etree
 from pptx import Presentation
 from pptx.chart.data import CategoryChartData
 from pptx.enum.chart import XL_CHART_TYPE
 from pptx.dml.color import RGBColor
 from pptx.enum.shapes import MSO_CONNECTOR, MSO_SHAPE, PP_PLACEHOLDER
 from pptx.enum.text import MSO_ANCHOR, PP_ALIGN
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 from pptx.oxml.ns import qn
+from pptx.oxml.shapes.picture import CT_Picture
 from pptx.oxml.xmlchemy import OxmlElement
+from pptx.shapes.picture import Picture
 from pptx.slide import Slide
 from pptx.util import Inches, Pt
 
@@ -29,11 +40,14 @@ from .models import (
     DeleteSlideOp,
     DistributeShapesOp,
     FillPlaceholderOp,
+    FillTableOp,
     MergeTableCellsOp,
     MoveSlideOp,
     Operation,
     OperationPlan,
+    OperationStream,
     ParagraphSpec,
+    PlanHeader,
     ReplaceImageOp,
     RewriteTextOp,
     SetNotesOp,
@@ -48,11 +62,16 @@ from .models import (
     SetSlideLayoutOp,
     SetSlideSizeOp,
     SetTableCellOp,
+    TableColumnFormatSpec,
     UpdateChartDataOp,
     parse_plan,
     parse_ops,
 )
-from .verify import verify_pptx
+from .cache import TemplateCache, file_key
+from .media import ImageStore, dedupe_media
+from .profiling import ApplyTimings, TimingHook, _Profiler, _profiler
+from .verify import slide_baseline, verify_presentation, verify_pptx
+from .writer import save_presentation
 
 _SLIDE_LAYOUT_RELTYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideLayout"
 _BULLET_TAGS = (qn("a:buNone"), qn("a:buChar"), qn("a:buAutoNum"))
@@ -67,6 +86,12 @@ _VERTICAL_ANCHOR_MAP = {
     "middle": MSO_ANCHOR.MIDDLE,
     "bottom": MSO_ANCHOR.BOTTOM,
 }
+_ALIGN_ATTR_MAP = {
+    "left": "l",
+    "center": "ctr",
+    "right": "r",
+    "justify": "just",
+}
 _SHAPE_MAP = {
     "rect": MSO_SHAPE.RECTANGLE,
     "round_rect": MSO_SHAPE.ROUNDED_RECTANGLE,
@@ -117,15 +142,168 @@ def _import_copy_ops():
         ) from exc
 
 
+# A deck given as a filesystem path, raw bytes or a readable binary stream.
+PptxSource = Union[str, Path, bytes, IO[bytes]]
+
+
 @dataclass
 class ApplyResult:
-    output_path: Path
+    output_path: Path | None
     operations_applied: int
     verify_issues: list[str]
+    output_bytes: bytes | None = None
+    timings: ApplyTimings | None = None
+
+
+def _template_source(template: PptxSource) -> Path | bytes:
+    """Resolve a template to a path, or read a bytes-like / stream template into bytes."""
+    if isinstance(template, (str, os.PathLike)):
+        return Path(template).expanduser().resolve()
+    if isinstance(template, (bytes, bytearray, memoryview)):
+        return bytes(template)
+    return template.read()
+
+
+def _source_key(source: Path | bytes) -> tuple[str, int, int] | None:
+    """Path, mtime and size of a template file; `None` for bytes or a file that is gone."""
+    if not isinstance(source, Path):
+        return None
+    try:
+        return file_key(source)
+    except OSError:
+        return None
+
+
+def _open_template(source: Path | bytes, template_cache: TemplateCache | None = None) -> Presentation:
+    if isinstance(source, bytes):
+        return Presentation(BytesIO(source))
+    if template_cache is not None:
+        return template_cache.open(source)
+    return Presentation(str(source))
+
+
+class _SlideShapeIndex:
+    """Lookup tables over one slide's shapes, in shape-tree order.
+
+    First match wins for duplicate names, as with a linear scan of `slide.shapes`.
+    """
+
+    def __init__(self, slide: Slide):
+        self.shapes: list = []
+        self.by_name: dict[str, Any] = {}
+        self.tables: list = []
+        self.tables_by_name: dict[str, Any] = {}
+        self.charts: list = []
+        self.charts_by_name: dict[str, Any] = {}
+        self.placeholders_by_idx: dict[int, Any] = {}
+        self.placeholders_by_type: dict[Any, tuple[int, Any]] = {}
+        for shape in slide.shapes:
+            self.add(shape)
+
+    def add(self, shape) -> None:
+        position = len(self.shapes)
+        self.shapes.append(shape)
+        self.by_name.setdefault(shape.name, shape)
+        if getattr(shape, "has_table", False):
+            self.tables.append(shape)
+            self.tables_by_name.setdefault(shape.name, shape)
+        if getattr(shape, "has_chart", False):
+            self.charts.append(shape)
+            self.charts_by_name.setdefault(shape.name, shape)
+        if getattr(shape, "is_placeholder", False):
+            placeholder_format = shape.placeholder_format
+            self.placeholders_by_idx.setdefault(placeholder_format.idx, shape)
+            try:
+                placeholder_type = placeholder_format.type
+            except Exception:
+                return
+            self.placeholders_by_type.setdefault(placeholder_type, (position, shape))
+
+
+@dataclass
+class ApplyContext:
+    """Per-job state handed to every op handler."""
+
+    presentation: Presentation
+    plan: PlanHeader | None = None
+    copier: Any = None
+    slide_spec_cls: Any = None
+    cancel_event: threading.Event | None = None
+    profiler: _Profiler | None = None
+    shape_indexes: dict[Any, _SlideShapeIndex] = field(default_factory=dict)
+    source_parts: dict[Any, str] = field(default_factory=dict)
+    dirty_parts: set = field(default_factory=set)
+    library_paths: dict[str, str] = field(default_factory=dict)
+    images: ImageStore | None = None
+    media_added: bool = False
+
+    def __post_init__(self) -> None:
+        if not self.source_parts:
+            # Partnames as loaded; parts not dirtied by an op are copied verbatim on save.
+            self.source_parts = {part: part.partname for part in self.presentation.part.package.iter_parts()}
+
+    def mark_dirty(self, *parts) -> None:
+        self.dirty_parts.update(parts)
+
+    def mark_all_dirty(self) -> None:
+        self.dirty_parts.update(self.source_parts)
+
+    def clean_parts(self) -> dict[Any, str]:
+        """Source parts no op has modified, mapped to their partname in the template."""
+        return {part: name for part, name in self.source_parts.items() if part not in self.dirty_parts}
+
+    def library_path(self, raw: str) -> str:
+        """Absolute path of a copy source; each one is resolved and existence-checked once per job."""
+        path = self.library_paths.get(raw)
+        if path is None:
+            resolved = Path(raw).expanduser().resolve()
+            if not resolved.is_file():
+                raise FileNotFoundError(f"source_path not found: {raw}")
+            path = self.library_paths[raw] = str(resolved)
+        return path
+
+    def image_part(self, slide: Slide, image_path: Path):
+        """`(image_part, rId, info)` of `image_path` related from `slide`; each file is read once per job."""
+        if self.images is None:
+            self.images = ImageStore(self.presentation.part.package)
+        image_part, info = self.images.part_for(image_path)
+        return image_part, slide.part.relate_to(image_part, RT.IMAGE), info
+
+    def dedupe_media(self) -> None:
+        """Collapse byte-identical media parts, e.g. one logo arriving with several copied slides.
+
+        Only runs when an op flagged `media_added`. Image ops reuse a matching part instead
+        of adding a copy, and a job that added no media keeps the template's own media,
+        duplicates included, on the raw-copy path.
+        """
+        if self.media_added:
+            self.mark_dirty(*dedupe_media(self.presentation.part.package))
+
+    def shapes_of(self, slide: Slide) -> _SlideShapeIndex:
+        """Shape index of `slide`, built on first use and reused by later ops."""
+        index = self.shape_indexes.get(slide.part)
+        if index is None:
+            index = self.shape_indexes[slide.part] = _SlideShapeIndex(slide)
+        return index
+
+    def shape_added(self, slide: Slide, shape) -> None:
+        index = self.shape_indexes.get(slide.part)
+        if index is not None:
+            index.add(shape)
+
+    def invalidate_shapes(self, slide: Slide | None = None) -> None:
+        """Drop the index of `slide` (or of every slide) after shapes were removed or reordered."""
+        if slide is None:
+            self.shape_indexes.clear()
+        else:
+            self.shape_indexes.pop(slide.part, None)
+
+
+OpHandler = Callable[[Any, ApplyContext], None]
 
 
-def _iter_text_shapes(slide: Slide):
-    for shape in slide.shapes:
+def _iter_text_shapes(shapes: Iterable):
+    for shape in shapes:
         if getattr(shape, "has_text_frame", False):
             yield shape
 
@@ -134,44 +312,46 @@ def _hex_to_rgb(color_hex: str) -> RGBColor:
     return RGBColor.from_string(color_hex.lstrip("#"))
 
 
-def _slide_or_raise(presentation: Presentation, slide_index: int, op_name: str):
-    if slide_index >= len(presentation.slides):
-        raise IndexError(f"{op_name} slide_index out of range: {slide_index}, total={len(presentation.slides)}")
-    return presentation.slides[slide_index]
+def _slide_or_raise(ctx: ApplyContext, slide_index: int, op_name: str):
+    slides = ctx.presentation.slides
+    if slide_index >= len(slides):
+        raise IndexError(f"{op_name} slide_index out of range: {slide_index}, total={len(slides)}")
+    slide = slides[slide_index]
+    ctx.mark_dirty(slide.part)
+    return slide
 
 
-def _shape_by_name(slide: Slide, shape_name: str):
-    for shape in slide.shapes:
-        if shape.name == shape_name:
-            return shape
-    raise ValueError(f"shape not found by name: {shape_name}")
+def _shape_by_name(index: _SlideShapeIndex, shape_name: str):
+    shape = index.by_name.get(shape_name)
+    if shape is None:
+        raise ValueError(f"shape not found by name: {shape_name}")
+    return shape
 
 
-def _shape_by_index(slide: Slide, shape_index: int):
-    if shape_index >= len(slide.shapes):
-        raise IndexError(f"shape_index out of range: {shape_index}, total={len(slide.shapes)}")
-    return slide.shapes[shape_index]
+def _shape_by_index(index: _SlideShapeIndex, shape_index: int):
+    if shape_index >= len(index.shapes):
+        raise IndexError(f"shape_index out of range: {shape_index}, total={len(index.shapes)}")
+    return index.shapes[shape_index]
 
 
-def _shape_for_target(slide: Slide, shape_name: str | None, shape_index: int | None):
+def _shape_for_target(index: _SlideShapeIndex, shape_name: str | None, shape_index: int | None):
     if shape_name is not None:
-        return _shape_by_name(slide, shape_name)
+        return _shape_by_name(index, shape_name)
     if shape_index is not None:
-        return _shape_by_index(slide, shape_index)
+        return _shape_by_index(index, shape_index)
     raise ValueError("shape target is required")
 
 
-def _table_for_target(slide: Slide, table_name: str | None, table_index: int | None):
-    table_shapes = [shape for shape in slide.shapes if getattr(shape, "has_table", False)]
+def _table_for_target(index: _SlideShapeIndex, table_name: str | None, table_index: int | None):
     if table_name is not None:
-        for shape in table_shapes:
-            if shape.name == table_name:
-                return shape.table
-        raise ValueError(f"table not found by name: {table_name}")
+        shape = index.tables_by_name.get(table_name)
+        if shape is None:
+            raise ValueError(f"table not found by name: {table_name}")
+        return shape.table
     if table_index is not None:
-        if table_index >= len(table_shapes):
-            raise IndexError(f"table_index out of range: {table_index}, total={len(table_shapes)}")
-        return table_shapes[table_index].table
+        if table_index >= len(index.tables):
+            raise IndexError(f"table_index out of range: {table_index}, total={len(index.tables)}")
+        return index.tables[table_index].table
     raise ValueError("table target is required")
 
 
@@ -184,45 +364,36 @@ def _table_cell_or_raise(table, row: int, col: int, op_name: str):
     return table.cell(row, col)
 
 
-def _chart_for_target(slide: Slide, chart_name: str | None, chart_index: int | None):
-    chart_shapes = [shape for shape in slide.shapes if getattr(shape, "has_chart", False)]
+def _chart_for_target(index: _SlideShapeIndex, chart_name: str | None, chart_index: int | None):
     if chart_name is not None:
-        for shape in chart_shapes:
-            if shape.name == chart_name:
-                return shape.chart
-        raise ValueError(f"chart not found by name: {chart_name}")
+        shape = index.charts_by_name.get(chart_name)
+        if shape is None:
+            raise ValueError(f"chart not found by name: {chart_name}")
+        return shape.chart
     if chart_index is not None:
-        if chart_index >= len(chart_shapes):
-            raise IndexError(f"chart_index out of range: {chart_index}, total={len(chart_shapes)}")
-        return chart_shapes[chart_index].chart
+        if chart_index >= len(index.charts):
+            raise IndexError(f"chart_index out of range: {chart_index}, total={len(index.charts)}")
+        return index.charts[chart_index].chart
     raise ValueError("chart target is required")
 
 
 def _placeholder_for_target(
-    slide: Slide,
+    index: _SlideShapeIndex,
     placeholder_idx: int | None,
     placeholder_type: str | None,
 ):
     if placeholder_idx is not None:
-        for shape in slide.shapes:
-            if not getattr(shape, "is_placeholder", False):
-                continue
-            if shape.placeholder_format.idx == placeholder_idx:
-                return shape
-        raise ValueError(f"placeholder idx not found: {placeholder_idx}")
+        shape = index.placeholders_by_idx.get(placeholder_idx)
+        if shape is None:
+            raise ValueError(f"placeholder idx not found: {placeholder_idx}")
+        return shape
 
     if placeholder_type is None:
         raise ValueError("placeholder target is required")
-    target_types = _PLACEHOLDER_MAP[placeholder_type]
-    for shape in slide.shapes:
-        if not getattr(shape, "is_placeholder", False):
-            continue
-        try:
-            if shape.placeholder_format.type in target_types:
-                return shape
-        except Exception:
-            continue
-    raise ValueError(f"placeholder type not found: {placeholder_type}")
+    matches = [index.placeholders_by_type[t] for t in _PLACEHOLDER_MAP[placeholder_type] if t in index.placeholders_by_type]
+    if not matches:
+        raise ValueError(f"placeholder type not found: {placeholder_type}")
+    return min(matches, key=lambda item: item[0])[1]
 
 
 def _draw_node_indices(sp_tree) -> list[int]:
@@ -234,8 +405,8 @@ def _move_shape_tree_node(sp_tree, element, target_idx: int) -> None:
     sp_tree.insert(target_idx, element)
 
 
-def _apply_picture_fit(pic, fit: str, box_w, box_h) -> None:
-    iw_px, ih_px = pic.image.size
+def _apply_picture_fit(pic, fit: str, box_w, box_h, image_size: tuple[int, int]) -> None:
+    iw_px, ih_px = image_size
     image_ratio = iw_px / ih_px if ih_px else 1.0
     box_ratio = box_w / box_h if box_h else 1.0
 
@@ -263,9 +434,19 @@ def _apply_picture_fit(pic, fit: str, box_w, box_h) -> None:
             pic.crop_bottom = crop
 
 
-def _insert_picture_with_fit(slide: Slide, image_path: Path, x, y, box_w, box_h, fit: str, name: str | None):
-    pic = slide.shapes.add_picture(str(image_path), x, y, box_w, box_h)
-    _apply_picture_fit(pic, fit, box_w, box_h)
+def _insert_picture_with_fit(
+    ctx: ApplyContext, slide: Slide, image_path: Path, x, y, box_w, box_h, fit: str, name: str | None
+):
+    # What `SlideShapes.add_picture` builds, with the image part from the per-job image
+    # store: `add_picture` would read the file again and rehash every image part ahead of
+    # the match, and re-parse the image header for its native size.
+    image_part, rId, info = ctx.image_part(slide, image_path)
+    cx, cy = (box_w, box_h) if box_w and box_h else image_part.scale(box_w, box_h)
+    sp_tree = slide.shapes.element
+    shape_id = sp_tree.max_shape_id + 1
+    pic_element = sp_tree.add_pic(shape_id, f"Picture {shape_id - 1}", image_part.desc, rId, x, y, cx, cy)
+    pic = Picture(pic_element, slide.shapes)
+    _apply_picture_fit(pic, fit, box_w, box_h, info.size)
     if name:
         pic.name = name
     return pic
@@ -334,7 +515,7 @@ def _write_text_frame(
 
 
 def _set_slide_body(slide: Slide, body: str) -> None:
-    for shape in _iter_text_shapes(slide):
+    for shape in _iter_text_shapes(slide.shapes):
         if getattr(shape, "is_placeholder", False):
             try:
                 placeholder_type = shape.placeholder_format.type
@@ -344,16 +525,16 @@ def _set_slide_body(slide: Slide, body: str) -> None:
             if placeholder_type == 2:
                 shape.text_frame.text = body
                 return
-    for shape in _iter_text_shapes(slide):
+    for shape in _iter_text_shapes(slide.shapes):
         if shape != slide.shapes.title:
             shape.text_frame.text = body
             return
 
 
-def _apply_rewrite(op: RewriteTextOp, presentation: Presentation) -> None:
-    slide = _slide_or_raise(presentation, op.slide_index, "rewrite_text")
+def _apply_rewrite(op: RewriteTextOp, ctx: ApplyContext) -> None:
+    slide = _slide_or_raise(ctx, op.slide_index, "rewrite_text")
     replaced = 0
-    for shape in _iter_text_shapes(slide):
+    for shape in _iter_text_shapes(ctx.shapes_of(slide).shapes):
         if op.shape_name and shape.name != op.shape_name:
             continue
         text = shape.text_frame.text
@@ -368,25 +549,30 @@ def _apply_rewrite(op: RewriteTextOp, presentation: Presentation) -> None:
         raise ValueError(f"rewrite_text cannot find target text on slide {op.slide_index}: {op.find!r}")
 
 
-def _apply_create(op: CreateSlideOnLayoutOp, presentation: Presentation) -> None:
+def _apply_create(op: CreateSlideOnLayoutOp, ctx: ApplyContext) -> None:
+    presentation = ctx.presentation
     if op.layout_index >= len(presentation.slide_layouts):
         raise IndexError(f"layout_index out of range: {op.layout_index}, total={len(presentation.slide_layouts)}")
     slide = presentation.slides.add_slide(presentation.slide_layouts[op.layout_index])
+    ctx.mark_dirty(presentation.part)
     if op.title and slide.shapes.title is not None:
         slide.shapes.title.text = op.title
     if op.body:
         _set_slide_body(slide, op.body)
 
 
-def _apply_delete(op: DeleteSlideOp, presentation: Presentation) -> None:
+def _apply_delete(op: DeleteSlideOp, ctx: ApplyContext) -> None:
+    presentation = ctx.presentation
     if op.slide_index >= len(presentation.slides):
         raise IndexError(f"delete_slide slide_index out of range: {op.slide_index}, total={len(presentation.slides)}")
     r_id = presentation.slides._sldIdLst[op.slide_index].rId
     presentation.part.drop_rel(r_id)
     del presentation.slides._sldIdLst[op.slide_index]
+    ctx.mark_dirty(presentation.part)
 
 
-def _apply_move(op: MoveSlideOp, presentation: Presentation) -> None:
+def _apply_move(op: MoveSlideOp, ctx: ApplyContext) -> None:
+    presentation = ctx.presentation
     total = len(presentation.slides)
     if op.from_index >= total:
         raise IndexError(f"move_slide from_index out of range: {op.from_index}, total={total}")
@@ -397,9 +583,11 @@ def _apply_move(op: MoveSlideOp, presentation: Presentation) -> None:
     slide_id = presentation.slides._sldIdLst[op.from_index]
     presentation.slides._sldIdLst.remove(slide_id)
     presentation.slides._sldIdLst.insert(op.to_index, slide_id)
+    ctx.mark_dirty(presentation.part)
 
 
-def _apply_set_slide_size(op: SetSlideSizeOp, presentation: Presentation) -> None:
+def _apply_set_slide_size(op: SetSlideSizeOp, ctx: ApplyContext) -> None:
+    presentation = ctx.presentation
     if op.preset == "16:9":
         width_inches, height_inches = 13.333, 7.5
     elif op.preset == "4:3":
@@ -409,9 +597,11 @@ def _apply_set_slide_size(op: SetSlideSizeOp, presentation: Presentation) -> Non
         height_inches = float(op.height_inches)
     presentation.slide_width = Inches(width_inches)
     presentation.slide_height = Inches(height_inches)
+    ctx.mark_dirty(presentation.part)
 
 
-def _apply_set_slide_layout(op: SetSlideLayoutOp, presentation: Presentation) -> None:
+def _apply_set_slide_layout(op: SetSlideLayoutOp, ctx: ApplyContext) -> None:
+    presentation = ctx.presentation
     if op.slide_index >= len(presentation.slides):
         raise IndexError(
             f"set_slide_layout slide_index out of range: {op.slide_index}, total={len(presentation.slides)}"
@@ -426,15 +616,18 @@ def _apply_set_slide_layout(op: SetSlideLayoutOp, presentation: Presentation) ->
         if rel.reltype == _SLIDE_LAYOUT_RELTYPE:
             slide.part.drop_rel(rel.rId)
     slide.part.relate_to(target_layout.part, _SLIDE_LAYOUT_RELTYPE)
+    ctx.mark_dirty(slide.part)
 
 
-def _apply_set_notes(op: SetNotesOp, presentation: Presentation) -> None:
-    slide = _slide_or_raise(presentation, op.slide_index, "set_notes")
-    slide.notes_slide.notes_text_frame.text = op.text
+def _apply_set_notes(op: SetNotesOp, ctx: ApplyContext) -> None:
+    slide = _slide_or_raise(ctx, op.slide_index, "set_notes")
+    notes_slide = slide.notes_slide
+    notes_slide.notes_text_frame.text = op.text
+    ctx.mark_dirty(notes_slide.part)
 
 
-def _apply_add_textbox(op: AddTextBoxOp, presentation: Presentation) -> None:
-    slide = _slide_or_raise(presentation, op.slide_index, "add_textbox")
+def _apply_add_textbox(op: AddTextBoxOp, ctx: ApplyContext) -> None:
+    slide = _slide_or_raise(ctx, op.slide_index, "add_textbox")
     shape = slide.shapes.add_textbox(
         Inches(op.x_inches),
         Inches(op.y_inches),
@@ -443,22 +636,24 @@ def _apply_add_textbox(op: AddTextBoxOp, presentation: Presentation) -> None:
     )
     if op.name:
         shape.name = op.name
+    ctx.shape_added(slide, shape)
     _write_text_frame(shape.text_frame, op.text, op.paragraphs, op.vertical_anchor, op.word_wrap)
 
 
-def _apply_set_shape_text(op: SetShapeTextOp, presentation: Presentation) -> None:
-    slide = _slide_or_raise(presentation, op.slide_index, "set_shape_text")
+def _apply_set_shape_text(op: SetShapeTextOp, ctx: ApplyContext) -> None:
+    slide = _slide_or_raise(ctx, op.slide_index, "set_shape_text")
+    index = ctx.shapes_of(slide)
     if op.shape_name is not None:
-        shape = _shape_by_name(slide, op.shape_name)
+        shape = _shape_by_name(index, op.shape_name)
     else:
-        shape = _shape_by_index(slide, int(op.shape_index))
+        shape = _shape_by_index(index, int(op.shape_index))
     if not getattr(shape, "has_text_frame", False):
         raise ValueError(f"target shape has no text frame: {shape.name}")
     _write_text_frame(shape.text_frame, op.text, op.paragraphs, op.vertical_anchor, op.word_wrap)
 
 
-def _apply_add_image(op: AddImageOp, presentation: Presentation) -> None:
-    slide = _slide_or_raise(presentation, op.slide_index, "add_image")
+def _apply_add_image(op: AddImageOp, ctx: ApplyContext) -> None:
+    slide = _slide_or_raise(ctx, op.slide_index, "add_image")
     image_path = Path(op.image_path).expanduser().resolve()
     if not image_path.exists():
         raise FileNotFoundError(f"image_path not found: {image_path}")
@@ -467,11 +662,12 @@ def _apply_add_image(op: AddImageOp, presentation: Presentation) -> None:
     y = Inches(op.y_inches)
     box_w = Inches(op.width_inches)
     box_h = Inches(op.height_inches)
-    _insert_picture_with_fit(slide, image_path, x, y, box_w, box_h, op.fit, op.name)
+    pic = _insert_picture_with_fit(ctx, slide, image_path, x, y, box_w, box_h, op.fit, op.name)
+    ctx.shape_added(slide, pic)
 
 
-def _apply_add_shape(op: AddShapeOp, presentation: Presentation) -> None:
-    slide = _slide_or_raise(presentation, op.slide_index, "add_shape")
+def _apply_add_shape(op: AddShapeOp, ctx: ApplyContext) -> None:
+    slide = _slide_or_raise(ctx, op.slide_index, "add_shape")
     x = Inches(op.x_inches)
     y = Inches(op.y_inches)
     width = Inches(op.width_inches)
@@ -490,6 +686,7 @@ def _apply_add_shape(op: AddShapeOp, presentation: Presentation) -> None:
 
     if op.name:
         shape.name = op.name
+    ctx.shape_added(slide, shape)
 
     if op.fill_color_hex is not None and hasattr(shape, "fill"):
         shape.fill.solid()
@@ -510,8 +707,8 @@ def _apply_add_shape(op: AddShapeOp, presentation: Presentation) -> None:
             paragraph.font.color.rgb = _hex_to_rgb(op.text_color_hex)
 
 
-def _apply_add_table(op: AddTableOp, presentation: Presentation) -> None:
-    slide = _slide_or_raise(presentation, op.slide_index, "add_table")
+def _apply_add_table(op: AddTableOp, ctx: ApplyContext) -> None:
+    slide = _slide_or_raise(ctx, op.slide_index, "add_table")
     rows = len(op.data)
     cols = max(len(row) for row in op.data)
     table_shape = slide.shapes.add_table(
@@ -524,6 +721,7 @@ def _apply_add_table(op: AddTableOp, presentation: Presentation) -> None:
     )
     if op.name:
         table_shape.name = op.name
+    ctx.shape_added(slide, table_shape)
     table = table_shape.table
     for row_idx in range(rows):
         row = op.data[row_idx]
@@ -538,23 +736,31 @@ def _apply_add_table(op: AddTableOp, presentation: Presentation) -> None:
                 paragraph.font.bold = True
 
 
-def _apply_set_slide_background(op: SetSlideBackgroundOp, presentation: Presentation) -> None:
-    slide = _slide_or_raise(presentation, op.slide_index, "set_slide_background")
+def _apply_set_slide_background(op: SetSlideBackgroundOp, ctx: ApplyContext) -> None:
+    slide = _slide_or_raise(ctx, op.slide_index, "set_slide_background")
     fill = slide.background.fill
     fill.solid()
     fill.fore_color.rgb = _hex_to_rgb(op.color_hex)
 
 
-def _apply_fill_placeholder(op: FillPlaceholderOp, presentation: Presentation) -> None:
-    slide = _slide_or_raise(presentation, op.slide_index, "fill_placeholder")
-    placeholder = _placeholder_for_target(slide, op.placeholder_idx, op.placeholder_type)
+def _apply_fill_placeholder(op: FillPlaceholderOp, ctx: ApplyContext) -> None:
+    slide = _slide_or_raise(ctx, op.slide_index, "fill_placeholder")
+    placeholder = _placeholder_for_target(ctx.shapes_of(slide), op.placeholder_idx, op.placeholder_type)
     if op.image_path is not None:
         image_path = Path(op.image_path).expanduser().resolve()
         if not image_path.exists():
             raise FileNotFoundError(f"image_path not found: {image_path}")
         if not hasattr(placeholder, "insert_picture"):
             raise ValueError(f"placeholder does not support image insertion: {placeholder.name}")
-        placeholder.insert_picture(str(image_path))
+        # What `insert_picture` builds, with the image part taken from the per-job image store.
+        image_part, rId, info = ctx.image_part(slide, image_path)
+        pic = CT_Picture.new_ph_pic(placeholder.shape_id, placeholder.name, image_part.desc, rId)
+        pic.crop_to_fit(info.size, (placeholder.width, placeholder.height))
+        # Move the `p:ph` across so the picture stays a placeholder and keeps the layout geometry.
+        pic.nvPicPr.nvPr.insert(0, placeholder.element.ph)
+        placeholder.element.addnext(pic)
+        placeholder.element.getparent().remove(placeholder.element)
+        ctx.invalidate_shapes(slide)
         return
 
     if not getattr(placeholder, "has_text_frame", False):
@@ -562,9 +768,9 @@ def _apply_fill_placeholder(op: FillPlaceholderOp, presentation: Presentation) -
     _write_text_frame(placeholder.text_frame, op.text, op.paragraphs, None, None)
 
 
-def _apply_set_shape_geometry(op: SetShapeGeometryOp, presentation: Presentation) -> None:
-    slide = _slide_or_raise(presentation, op.slide_index, "set_shape_geometry")
-    shape = _shape_for_target(slide, op.shape_name, op.shape_index)
+def _apply_set_shape_geometry(op: SetShapeGeometryOp, ctx: ApplyContext) -> None:
+    slide = _slide_or_raise(ctx, op.slide_index, "set_shape_geometry")
+    shape = _shape_for_target(ctx.shapes_of(slide), op.shape_name, op.shape_index)
     if op.x_inches is not None:
         shape.left = Inches(op.x_inches)
     if op.y_inches is not None:
@@ -575,9 +781,9 @@ def _apply_set_shape_geometry(op: SetShapeGeometryOp, presentation: Presentation
         shape.height = Inches(op.height_inches)
 
 
-def _apply_set_shape_z_order(op: SetShapeZOrderOp, presentation: Presentation) -> None:
-    slide = _slide_or_raise(presentation, op.slide_index, "set_shape_z_order")
-    shape = _shape_for_target(slide, op.shape_name, op.shape_index)
+def _apply_set_shape_z_order(op: SetShapeZOrderOp, ctx: ApplyContext) -> None:
+    slide = _slide_or_raise(ctx, op.slide_index, "set_shape_z_order")
+    shape = _shape_for_target(ctx.shapes_of(slide), op.shape_name, op.shape_index)
     sp_tree = slide.shapes._spTree
     children = list(sp_tree)
     element = shape.element
@@ -587,6 +793,7 @@ def _apply_set_shape_z_order(op: SetShapeZOrderOp, presentation: Presentation) -
     draw_indices = _draw_node_indices(sp_tree)
     if not draw_indices:
         return
+    ctx.invalidate_shapes(slide)
 
     if op.action == "bring_to_front":
         sp_tree.remove(element)
@@ -612,8 +819,8 @@ def _apply_set_shape_z_order(op: SetShapeZOrderOp, presentation: Presentation) -
     _move_shape_tree_node(sp_tree, element, prev_targets[-1])
 
 
-def _apply_add_chart(op: AddChartOp, presentation: Presentation) -> None:
-    slide = _slide_or_raise(presentation, op.slide_index, "add_chart")
+def _apply_add_chart(op: AddChartOp, ctx: ApplyContext) -> None:
+    slide = _slide_or_raise(ctx, op.slide_index, "add_chart")
     chart_data = CategoryChartData()
     chart_data.categories = op.categories
     for series in op.series:
@@ -628,21 +835,23 @@ def _apply_add_chart(op: AddChartOp, presentation: Presentation) -> None:
     )
     if op.name:
         chart_shape.name = op.name
+    ctx.shape_added(slide, chart_shape)
 
 
-def _apply_update_chart_data(op: UpdateChartDataOp, presentation: Presentation) -> None:
-    slide = _slide_or_raise(presentation, op.slide_index, "update_chart_data")
-    chart = _chart_for_target(slide, op.chart_name, op.chart_index)
+def _apply_update_chart_data(op: UpdateChartDataOp, ctx: ApplyContext) -> None:
+    slide = _slide_or_raise(ctx, op.slide_index, "update_chart_data")
+    chart = _chart_for_target(ctx.shapes_of(slide), op.chart_name, op.chart_index)
     chart_data = CategoryChartData()
     chart_data.categories = op.categories
     for series in op.series:
         chart_data.add_series(series.name, tuple(series.values))
     chart.replace_data(chart_data)
+    ctx.mark_dirty(chart.part, chart.part.chart_workbook.xlsx_part)
 
 
-def _apply_set_table_cell(op: SetTableCellOp, presentation: Presentation) -> None:
-    slide = _slide_or_raise(presentation, op.slide_index, "set_table_cell")
-    table = _table_for_target(slide, op.table_name, op.table_index)
+def _apply_set_table_cell(op: SetTableCellOp, ctx: ApplyContext) -> None:
+    slide = _slide_or_raise(ctx, op.slide_index, "set_table_cell")
+    table = _table_for_target(ctx.shapes_of(slide), op.table_name, op.table_index)
     cell = _table_cell_or_raise(table, op.row, op.col, "set_table_cell")
     if op.text is not None:
         cell.text_frame.text = op.text
@@ -662,17 +871,92 @@ def _apply_set_table_cell(op: SetTableCellOp, presentation: Presentation) -> Non
         cell.fill.fore_color.rgb = _hex_to_rgb(op.fill_color_hex)
 
 
-def _apply_merge_table_cells(op: MergeTableCellsOp, presentation: Presentation) -> None:
-    slide = _slide_or_raise(presentation, op.slide_index, "merge_table_cells")
-    table = _table_for_target(slide, op.table_name, op.table_index)
+def _fill_cell_text(value: str | bool | int | float, column: TableColumnFormatSpec | None) -> str:
+    if isinstance(value, str):
+        return value
+    if isinstance(value, bool):
+        return str(value)
+    if column is not None and column.number_format is not None:
+        return format(value, column.number_format)
+    return str(value)
+
+
+def _has_run_format(column: TableColumnFormatSpec) -> bool:
+    return (
+        column.font_size_pt is not None
+        or column.bold is not None
+        or column.italic is not None
+        or column.text_color_hex is not None
+    )
+
+
+def _write_fill_table_cell(tc, text: str, column: TableColumnFormatSpec | None) -> None:
+    tx_body = tc.get_or_add_txBody()
+    for paragraph in tx_body.findall(qn("a:p")):
+        tx_body.remove(paragraph)
+
+    for line in text.split("\n"):
+        paragraph = etree.SubElement(tx_body, qn("a:p"))
+        if column is not None and column.alignment is not None:
+            etree.SubElement(paragraph, qn("a:pPr")).set("algn", _ALIGN_ATTR_MAP[column.alignment])
+        if not line:
+            continue
+        run = etree.SubElement(paragraph, qn("a:r"))
+        if column is not None and _has_run_format(column):
+            r_pr = etree.SubElement(run, qn("a:rPr"))
+            if column.font_size_pt is not None:
+                r_pr.set("sz", str(int(round(column.font_size_pt * 100))))
+            if column.bold is not None:
+                r_pr.set("b", "1" if column.bold else "0")
+            if column.italic is not None:
+                r_pr.set("i", "1" if column.italic else "0")
+            if column.text_color_hex is not None:
+                solid = etree.SubElement(r_pr, qn("a:solidFill"))
+                etree.SubElement(solid, qn("a:srgbClr")).set("val", column.text_color_hex.lstrip("#").upper())
+        etree.SubElement(run, qn("a:t")).text = line
+
+    if column is not None and column.fill_color_hex is not None:
+        solid = tc.get_or_add_tcPr().get_or_change_to_solidFill()
+        for child in list(solid):
+            solid.remove(child)
+        etree.SubElement(solid, qn("a:srgbClr")).set("val", column.fill_color_hex.lstrip("#").upper())
+
+
+def _apply_fill_table(op: FillTableOp, ctx: ApplyContext) -> None:
+    slide = _slide_or_raise(ctx, op.slide_index, "fill_table")
+    table = _table_for_target(ctx.shapes_of(slide), op.table_name, op.table_index)
+    tr_lst = table._tbl.tr_lst
+    total_rows = len(tr_lst)
+    total_cols = len(tr_lst[0].tc_lst) if tr_lst else 0
+    end_row = op.start_row + len(op.data)
+    end_col = op.start_col + max(len(row) for row in op.data)
+    if end_row > total_rows or end_col > total_cols:
+        raise IndexError(
+            f"fill_table data out of range: rows={op.start_row}..{end_row - 1}, cols={op.start_col}..{end_col - 1}, "
+            f"total_rows={total_rows}, total_cols={total_cols}"
+        )
+
+    columns = op.columns
+    for row_offset, row in enumerate(op.data):
+        tc_lst = tr_lst[op.start_row + row_offset].tc_lst
+        for col_offset, value in enumerate(row):
+            if value is None:
+                continue
+            column = columns[col_offset] if col_offset < len(columns) else None
+            _write_fill_table_cell(tc_lst[op.start_col + col_offset], _fill_cell_text(value, column), column)
+
+
+def _apply_merge_table_cells(op: MergeTableCellsOp, ctx: ApplyContext) -> None:
+    slide = _slide_or_raise(ctx, op.slide_index, "merge_table_cells")
+    table = _table_for_target(ctx.shapes_of(slide), op.table_name, op.table_index)
     start_cell = _table_cell_or_raise(table, op.start_row, op.start_col, "merge_table_cells")
     end_cell = _table_cell_or_raise(table, op.end_row, op.end_col, "merge_table_cells")
     start_cell.merge(end_cell)
 
 
-def _apply_set_table_style(op: SetTableStyleOp, presentation: Presentation) -> None:
-    slide = _slide_or_raise(presentation, op.slide_index, "set_table_style")
-    table = _table_for_target(slide, op.table_name, op.table_index)
+def _apply_set_table_style(op: SetTableStyleOp, ctx: ApplyContext) -> None:
+    slide = _slide_or_raise(ctx, op.slide_index, "set_table_style")
+    table = _table_for_target(ctx.shapes_of(slide), op.table_name, op.table_index)
 
     for row_idx, row in enumerate(table.rows):
         for col_idx, _ in enumerate(table.columns):
@@ -696,9 +980,9 @@ def _apply_set_table_style(op: SetTableStyleOp, presentation: Presentation) -> N
                     cell.fill.fore_color.rgb = _hex_to_rgb(op.body_fill_color_hex)
 
 
-def _apply_set_table_row_col_size(op: SetTableRowColSizeOp, presentation: Presentation) -> None:
-    slide = _slide_or_raise(presentation, op.slide_index, "set_table_row_col_size")
-    table = _table_for_target(slide, op.table_name, op.table_index)
+def _apply_set_table_row_col_size(op: SetTableRowColSizeOp, ctx: ApplyContext) -> None:
+    slide = _slide_or_raise(ctx, op.slide_index, "set_table_row_col_size")
+    table = _table_for_target(ctx.shapes_of(slide), op.table_name, op.table_index)
     if op.row_index is not None and op.row_height_inches is not None:
         if op.row_index >= len(table.rows):
             raise IndexError(
@@ -713,15 +997,15 @@ def _apply_set_table_row_col_size(op: SetTableRowColSizeOp, presentation: Presen
         table.columns[op.col_index].width = Inches(op.col_width_inches)
 
 
-def _apply_set_shape_hyperlink(op: SetShapeHyperlinkOp, presentation: Presentation) -> None:
-    slide = _slide_or_raise(presentation, op.slide_index, "set_shape_hyperlink")
-    shape = _shape_for_target(slide, op.shape_name, op.shape_index)
+def _apply_set_shape_hyperlink(op: SetShapeHyperlinkOp, ctx: ApplyContext) -> None:
+    slide = _slide_or_raise(ctx, op.slide_index, "set_shape_hyperlink")
+    shape = _shape_for_target(ctx.shapes_of(slide), op.shape_name, op.shape_index)
     shape.click_action.hyperlink.address = op.url
 
 
-def _apply_set_text_hyperlink(op: SetTextHyperlinkOp, presentation: Presentation) -> None:
-    slide = _slide_or_raise(presentation, op.slide_index, "set_text_hyperlink")
-    shape = _shape_for_target(slide, op.shape_name, op.shape_index)
+def _apply_set_text_hyperlink(op: SetTextHyperlinkOp, ctx: ApplyContext) -> None:
+    slide = _slide_or_raise(ctx, op.slide_index, "set_text_hyperlink")
+    shape = _shape_for_target(ctx.shapes_of(slide), op.shape_name, op.shape_index)
     if not getattr(shape, "has_text_frame", False):
         raise ValueError(f"target shape has no text frame: {shape.name}")
 
@@ -745,13 +1029,13 @@ def _apply_set_text_hyperlink(op: SetTextHyperlinkOp, presentation: Presentation
         raise ValueError("set_text_hyperlink cannot find target text run")
 
 
-def _apply_replace_image(op: ReplaceImageOp, presentation: Presentation) -> None:
-    slide = _slide_or_raise(presentation, op.slide_index, "replace_image")
+def _apply_replace_image(op: ReplaceImageOp, ctx: ApplyContext) -> None:
+    slide = _slide_or_raise(ctx, op.slide_index, "replace_image")
     image_path = Path(op.image_path).expanduser().resolve()
     if not image_path.exists():
         raise FileNotFoundError(f"image_path not found: {image_path}")
 
-    shape = _shape_for_target(slide, op.shape_name, op.shape_index)
+    shape = _shape_for_target(ctx.shapes_of(slide), op.shape_name, op.shape_index)
     if not hasattr(shape, "image"):
         raise ValueError(f"target shape is not an image: {shape.name}")
 
@@ -761,16 +1045,19 @@ def _apply_replace_image(op: ReplaceImageOp, presentation: Presentation) -> None
     old_el = shape.element
     old_idx = list(sp_tree).index(old_el)
     sp_tree.remove(old_el)
+    ctx.invalidate_shapes(slide)
 
-    new_pic = _insert_picture_with_fit(slide, image_path, left, top, width, height, op.fit, name)
+    new_pic = _insert_picture_with_fit(ctx, slide, image_path, left, top, width, height, op.fit, name)
     new_el = new_pic.element
     sp_tree.remove(new_el)
     sp_tree.insert(old_idx, new_el)
 
 
-def _apply_align_shapes(op: AlignShapesOp, presentation: Presentation) -> None:
-    slide = _slide_or_raise(presentation, op.slide_index, "align_shapes")
-    shapes = [_shape_by_name(slide, name) for name in op.shape_names]
+def _apply_align_shapes(op: AlignShapesOp, ctx: ApplyContext) -> None:
+    presentation = ctx.presentation
+    slide = _slide_or_raise(ctx, op.slide_index, "align_shapes")
+    index = ctx.shapes_of(slide)
+    shapes = [_shape_by_name(index, name) for name in op.shape_names]
     anchor = shapes[0]
 
     if op.align in ("left", "center", "right"):
@@ -820,9 +1107,10 @@ def _apply_align_shapes(op: AlignShapesOp, presentation: Presentation) -> None:
             shape.top = int(target - shape.height)
 
 
-def _apply_distribute_shapes(op: DistributeShapesOp, presentation: Presentation) -> None:
-    slide = _slide_or_raise(presentation, op.slide_index, "distribute_shapes")
-    shapes = [_shape_by_name(slide, name) for name in op.shape_names]
+def _apply_distribute_shapes(op: DistributeShapesOp, ctx: ApplyContext) -> None:
+    slide = _slide_or_raise(ctx, op.slide_index, "distribute_shapes")
+    index = ctx.shapes_of(slide)
+    shapes = [_shape_by_name(index, name) for name in op.shape_names]
 
     if op.direction == "horizontal":
         ordered = sorted(shapes, key=lambda s: s.left)
@@ -847,7 +1135,14 @@ def _apply_distribute_shapes(op: DistributeShapesOp, presentation: Presentation)
         cursor += shape.height + gap
 
 
-def _to_operations(raw_ops: Iterable[Operation] | list[dict] | dict) -> tuple[list[Operation], OperationPlan | None]:
+def _to_operations(
+    raw_ops: Iterable[Operation] | list[dict] | dict | OperationPlan | OperationStream,
+) -> tuple[Iterable[Operation], PlanHeader | None]:
+    if isinstance(raw_ops, OperationPlan):
+        return raw_ops.operations, raw_ops
+    if isinstance(raw_ops, OperationStream):
+        # Left as an iterator: each op is validated only when `_run_operations` reaches it.
+        return raw_ops.operations, raw_ops.header
     if isinstance(raw_ops, dict):
         plan = parse_plan(raw_ops)
         return plan.operations, plan
@@ -859,168 +1154,267 @@ def _to_operations(raw_ops: Iterable[Operation] | list[dict] | dict) -> tuple[li
     return raw_list, None  # type: ignore[return-value]
 
 
-def apply_ops(
-    input_pptx: str | Path | None,
-    ops: Iterable[Operation] | list[dict] | dict,
-    output_pptx: str | Path | None,
-    verify: bool = False,
-    strict_verify: bool = True,
-    template_pptx: str | Path | None = None,
-) -> ApplyResult:
-    operations, plan = _to_operations(ops)
-    template_path_raw = template_pptx if template_pptx is not None else input_pptx
-    if template_path_raw is None and plan and plan.template_pptx:
-        template_path_raw = plan.template_pptx
-    if template_path_raw is None:
-        raise ValueError("template_pptx is required")
-    if output_pptx is None:
-        raise ValueError("output_pptx is required")
+def _apply_copy_slide(op: CopySlideOp, ctx: ApplyContext) -> None:
+    plan, copier, SlideSpec = ctx.plan, ctx.copier, ctx.slide_spec_cls
+    if copier is None or SlideSpec is None:
+        # Only streamed plans get here: a list plan with copy_slide always starts the engine.
+        raise ValueError(
+            "copy_slide requires the copy engine; a streamed plan must declare "
+            "reuse_slide_libraries in its header for the engine to be set up"
+        )
+    mode = op.mode.value if isinstance(op.mode, CopyMode) else str(op.mode)
+    source_path = op.source_path
+    if source_path is None:
+        if not plan:
+            raise ValueError("copy_slide with reuse_library_index requires plan context")
+        if op.reuse_library_index is None:
+            raise ValueError("copy_slide missing source_path and reuse_library_index")
+        if op.reuse_library_index >= len(plan.reuse_slide_libraries):
+            raise IndexError(
+                f"reuse_library_index out of range: {op.reuse_library_index}, "
+                f"total={len(plan.reuse_slide_libraries)}"
+            )
+        source_path = plan.reuse_slide_libraries[op.reuse_library_index]
+    copier.copy_slide(
+        SlideSpec(source_path=ctx.library_path(source_path), slide_index=op.source_slide_index),
+        mode=mode,
+    )
+    ctx.invalidate_shapes()
+    # The copier may have added image parts the image store does not know about.
+    ctx.images = None
+    ctx.media_added = True
+
+
+_OP_HANDLERS: dict[str, OpHandler] = {
+    "copy_slide": _apply_copy_slide,
+    "create_slide_on_layout": _apply_create,
+    "rewrite_text": _apply_rewrite,
+    "delete_slide": _apply_delete,
+    "move_slide": _apply_move,
+    "set_slide_size": _apply_set_slide_size,
+    "set_slide_layout": _apply_set_slide_layout,
+    "set_notes": _apply_set_notes,
+    "add_textbox": _apply_add_textbox,
+    "set_shape_text": _apply_set_shape_text,
+    "add_image": _apply_add_image,
+    "add_shape": _apply_add_shape,
+    "add_table": _apply_add_table,
+    "set_slide_background": _apply_set_slide_background,
+    "fill_placeholder": _apply_fill_placeholder,
+    "set_shape_geometry": _apply_set_shape_geometry,
+    "set_shape_z_order": _apply_set_shape_z_order,
+    "add_chart": _apply_add_chart,
+    "update_chart_data": _apply_update_chart_data,
+    "set_table_cell": _apply_set_table_cell,
+    "fill_table": _apply_fill_table,
+    "merge_table_cells": _apply_merge_table_cells,
+    "set_table_style": _apply_set_table_style,
+    "set_table_row_col_size": _apply_set_table_row_col_size,
+    "set_shape_hyperlink": _apply_set_shape_hyperlink,
+    "set_text_hyperlink": _apply_set_text_hyperlink,
+    "replace_image": _apply_replace_image,
+    "align_shapes": _apply_align_shapes,
+    "distribute_shapes": _apply_distribute_shapes,
+}
 
-    input_path = Path(template_path_raw).expanduser().resolve()
-    output_path = Path(output_pptx).expanduser().resolve()
-    output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    needs_copy_ops = any(isinstance(op, CopySlideOp) for op in operations)
-    copier = None
-    if needs_copy_ops:
-        SlideCopier, SlideSpec = _import_copy_ops()
-        copier = SlideCopier(target_template=input_path, clear_existing=False)
-        presentation = copier.presentation
-    else:
-        SlideSpec = None  # type: ignore[assignment]
-        presentation = Presentation(str(input_path))
+def register_op_handler(op_name: str, handler: OpHandler, replace: bool = False) -> None:
+    """Register `handler(op, ctx)` for operations whose `op` discriminator is `op_name`.
 
-    for op in operations:
-        if isinstance(op, CopySlideOp):
-            if copier is None or SlideSpec is None:
-                raise RuntimeError("copy_slide requested without initialized copy engine")
-            mode = op.mode.value if isinstance(op.mode, CopyMode) else str(op.mode)
-            source_path = op.source_path
-            if source_path is None:
-                if not plan:
-                    raise ValueError("copy_slide with reuse_library_index requires plan context")
-                if op.reuse_library_index is None:
-                    raise ValueError("copy_slide missing source_path and reuse_library_index")
-                if op.reuse_library_index >= len(plan.reuse_slide_libraries):
-                    raise IndexError(
-                        f"reuse_library_index out of range: {op.reuse_library_index}, "
-                        f"total={len(plan.reuse_slide_libraries)}"
-                    )
-                source_path = plan.reuse_slide_libraries[op.reuse_library_index]
-            copier.copy_slide(
-                SlideSpec(source_path=source_path, slide_index=op.source_slide_index),
-                mode=mode,
-            )
-            continue
-        if isinstance(op, CreateSlideOnLayoutOp):
-            _apply_create(op, presentation)
-            continue
-        if isinstance(op, RewriteTextOp):
-            _apply_rewrite(op, presentation)
-            continue
-        if isinstance(op, DeleteSlideOp):
-            _apply_delete(op, presentation)
-            continue
-        if isinstance(op, MoveSlideOp):
-            _apply_move(op, presentation)
-            continue
-        if isinstance(op, SetSlideSizeOp):
-            _apply_set_slide_size(op, presentation)
-            continue
-        if isinstance(op, SetSlideLayoutOp):
-            _apply_set_slide_layout(op, presentation)
-            continue
-        if isinstance(op, SetNotesOp):
-            _apply_set_notes(op, presentation)
-            continue
-        if isinstance(op, AddTextBoxOp):
-            _apply_add_textbox(op, presentation)
-            continue
-        if isinstance(op, SetShapeTextOp):
-            _apply_set_shape_text(op, presentation)
-            continue
-        if isinstance(op, AddImageOp):
-            _apply_add_image(op, presentation)
-            continue
-        if isinstance(op, AddShapeOp):
-            _apply_add_shape(op, presentation)
-            continue
-        if isinstance(op, AddTableOp):
-            _apply_add_table(op, presentation)
-            continue
-        if isinstance(op, SetSlideBackgroundOp):
-            _apply_set_slide_background(op, presentation)
-            continue
-        if isinstance(op, FillPlaceholderOp):
-            _apply_fill_placeholder(op, presentation)
-            continue
-        if isinstance(op, SetShapeGeometryOp):
-            _apply_set_shape_geometry(op, presentation)
-            continue
-        if isinstance(op, SetShapeZOrderOp):
-            _apply_set_shape_z_order(op, presentation)
-            continue
-        if isinstance(op, AddChartOp):
-            _apply_add_chart(op, presentation)
-            continue
-        if isinstance(op, UpdateChartDataOp):
-            _apply_update_chart_data(op, presentation)
-            continue
-        if isinstance(op, SetTableCellOp):
-            _apply_set_table_cell(op, presentation)
-            continue
-        if isinstance(op, MergeTableCellsOp):
-            _apply_merge_table_cells(op, presentation)
-            continue
-        if isinstance(op, SetTableStyleOp):
-            _apply_set_table_style(op, presentation)
-            continue
-        if isinstance(op, SetTableRowColSizeOp):
-            _apply_set_table_row_col_size(op, presentation)
-            continue
-        if isinstance(op, SetShapeHyperlinkOp):
-            _apply_set_shape_hyperlink(op, presentation)
-            continue
-        if isinstance(op, SetTextHyperlinkOp):
-            _apply_set_text_hyperlink(op, presentation)
-            continue
-        if isinstance(op, ReplaceImageOp):
-            _apply_replace_image(op, presentation)
-            continue
-        if isinstance(op, AlignShapesOp):
-            _apply_align_shapes(op, presentation)
-            continue
-        if isinstance(op, DistributeShapesOp):
-            _apply_distribute_shapes(op, presentation)
-            continue
-        raise ValueError(f"Unsupported operation type: {type(op)!r}")
+    Custom operation models are passed to `apply_ops` as model instances; the bundled
+    schema and `parse_plan` only cover the built-in operations.
+    """
+    if op_name in _OP_HANDLERS and not replace:
+        raise ValueError(f"op handler already registered: {op_name}")
 
-    if copier is not None:
-        saved_path = copier.save(output_path)
-    else:
-        presentation.save(str(output_path))
-        saved_path = output_path
+    def _run_custom(op, ctx: ApplyContext) -> None:
+        handler(op, ctx)
+        # Custom ops may restructure or edit any part, so neither cached shape indexes,
+        # the clean-part set nor the image store can be trusted afterwards.
+        ctx.invalidate_shapes()
+        ctx.mark_all_dirty()
+        ctx.images = None
+        ctx.media_added = True
+
+    _OP_HANDLERS[op_name] = _run_custom
+
+
+def _needs_copy_engine(operations: Iterable[Operation], plan: PlanHeader | None) -> bool:
+    if isinstance(operations, list):
+        return any(isinstance(op, CopySlideOp) for op in operations)
+    # A streamed plan cannot be scanned ahead, so its header has to declare the libraries;
+    # declaring them selects the copy engine even if no copy_slide follows.
+    return bool(plan and plan.reuse_slide_libraries)
+
+
+def _phase(profiler: _Profiler | None, name: str):
+    return profiler.phase(name) if profiler is not None else nullcontext()
 
+
+def _run_operations(operations: Iterable[Operation], ctx: ApplyContext) -> int:
+    handlers = _OP_HANDLERS
+    cancel_event = ctx.cancel_event
+    profiler = ctx.profiler
+    applied = 0
+    for op in operations:
+        if cancel_event is not None and cancel_event.is_set():
+            raise CancelledError(f"cancelled after {applied} operations")
+        op_name = getattr(op, "op", None)
+        handler = handlers.get(op_name)
+        if handler is None:
+            raise ValueError(f"Unsupported operation type: {type(op)!r}")
+        if profiler is None:
+            handler(op, ctx)
+        else:
+            wall, cpu = time.perf_counter(), time.thread_time()
+            handler(op, ctx)
+            profiler.op(applied, op_name, wall, cpu)
+        applied += 1
+    return applied
+
+
+def _save_and_verify(
+    presentation: Presentation,
+    copier,
+    output: Path | IO[bytes] | None,
+    operations_applied: int,
+    verify: bool,
+    strict_verify: bool,
+    source: Path | bytes | None = None,
+    clean_parts: dict[Any, str] | None = None,
+    incremental_verify: bool = False,
+    profiler: _Profiler | None = None,
+    source_key: tuple[str, int, int] | None = None,
+) -> ApplyResult:
     issues: list[str] = []
-    if verify:
-        report = verify_pptx(saved_path)
-        issues = report.issues
-        if issues and strict_verify:
-            raise ValueError("verification failed: " + "; ".join(issues))
+    output_bytes = None
+    if copier is not None:
+        with _phase(profiler, "save"):
+            saved_path = copier.save(output)
+        if verify:
+            with _phase(profiler, "verify"):
+                issues = verify_pptx(saved_path).issues
+    else:
+        # Checked on the parsed package before writing, so the output is never reopened.
+        if verify:
+            with _phase(profiler, "verify"):
+                baseline = None
+                if incremental_verify and source_key is not None:
+                    baseline = slide_baseline(source_key)
+                issues = verify_presentation(presentation, clean_parts=clean_parts, baseline=baseline).issues
+        if isinstance(source, Path) and _source_key(source) != source_key:
+            # The template file changed after it was loaded; its members no longer match the parts.
+            source, clean_parts = None, None
+        target = BytesIO() if output is None else output
+        with _phase(profiler, "save"):
+            save_presentation(presentation, target, source=source, clean_parts=clean_parts)
+        saved_path = output if isinstance(output, Path) else None
+        if output is None:
+            output_bytes = target.getvalue()
+
+    if issues and strict_verify:
+        raise ValueError("verification failed: " + "; ".join(issues))
 
     return ApplyResult(
-        output_path=saved_path.resolve(),
-        operations_applied=len(operations),
+        output_path=saved_path.resolve() if saved_path is not None else None,
+        operations_applied=operations_applied,
         verify_issues=issues,
+        output_bytes=output_bytes,
+        timings=profiler.timings if profiler is not None else None,
+    )
+
+
+def apply_ops(
+    input_pptx: PptxSource | None,
+    ops: Iterable[Operation] | list[dict] | dict | OperationPlan | OperationStream,
+    output_pptx: str | Path | IO[bytes] | None,
+    verify: bool = False,
+    strict_verify: bool = True,
+    template_pptx: PptxSource | None = None,
+    template_cache: TemplateCache | None = None,
+    incremental_verify: bool = False,
+    cancel_event: threading.Event | None = None,
+    profile: bool = False,
+    on_timing: TimingHook | None = None,
+) -> ApplyResult:
+    """Apply `ops` to a template and save the result.
+
+    The template may be a path, bytes or a readable binary stream. The output may be a
+    path, a writable binary stream, or None to get the deck back as
+    `ApplyResult.output_bytes` without touching the filesystem. When `cancel_event` is
+    set from another thread, the job stops before its next op with
+    `concurrent.futures.CancelledError` and no output is written.
+
+    With `profile` (or an `on_timing` hook, which implies it), wall and CPU time per
+    phase and per op are collected on `ApplyResult.timings`, and each `TimingEvent` is
+    also passed to `on_timing` as soon as it is measured.
+    """
+    profiler = _profiler(profile, on_timing)
+    with _phase(profiler, "parse"):
+        operations, plan = _to_operations(ops)
+    template_raw = template_pptx if template_pptx is not None else input_pptx
+    if template_raw is None and plan and plan.template_pptx:
+        template_raw = plan.template_pptx
+    if template_raw is None:
+        raise ValueError("template_pptx is required")
+
+    source = _template_source(template_raw)
+    output: Path | IO[bytes] | None = output_pptx  # type: ignore[assignment]
+    if isinstance(output_pptx, (str, os.PathLike)):
+        output = Path(output_pptx).expanduser().resolve()
+        output.parent.mkdir(parents=True, exist_ok=True)
+
+    copier = None
+    source_key = None
+    with _phase(profiler, "load"):
+        if _needs_copy_engine(operations, plan):
+            if not isinstance(source, Path) or not isinstance(output, Path):
+                raise ValueError("copy_slide requires template and output paths")
+            SlideCopier, SlideSpec = _import_copy_ops()
+            copier = SlideCopier(target_template=source, clear_existing=False)
+            presentation = copier.presentation
+        else:
+            SlideSpec = None  # type: ignore[assignment]
+            source_key = _source_key(source)
+            presentation = _open_template(source, template_cache)
+
+    ctx = ApplyContext(
+        presentation=presentation,
+        plan=plan,
+        copier=copier,
+        slide_spec_cls=SlideSpec,
+        cancel_event=cancel_event,
+        profiler=profiler,
+    )
+    with _phase(profiler, "apply"):
+        applied = _run_operations(operations, ctx)
+        ctx.dedupe_media()
+    return _save_and_verify(
+        presentation,
+        copier,
+        output,
+        applied,
+        verify,
+        strict_verify,
+        source=source,
+        clean_parts=ctx.clean_parts(),
+        incremental_verify=incremental_verify,
+        profiler=profiler,
+        source_key=source_key,
     )
 
 
 def generate_pptx(
-    template_pptx: str | Path,
+    template_pptx: PptxSource,
     ops: Iterable[Operation] | list[dict] | dict,
-    output_pptx: str | Path,
+    output_pptx: str | Path | IO[bytes] | None = None,
     verify: bool = False,
     strict_verify: bool = True,
+    template_cache: TemplateCache | None = None,
+    incremental_verify: bool = False,
+    cancel_event: threading.Event | None = None,
+    profile: bool = False,
+    on_timing: TimingHook | None = None,
 ) -> ApplyResult:
     """Generate PPTX from a master/layout template and operation list."""
     return apply_ops(
@@ -1030,4 +1424,88 @@ def generate_pptx(
         output_pptx=output_pptx,
         verify=verify,
         strict_verify=strict_verify,
+        template_cache=template_cache,
+        incremental_verify=incremental_verify,
+        cancel_event=cancel_event,
+        profile=profile,
+        on_timing=on_timing,
     )
+
+
+def render_batch(
+    template_pptx: PptxSource,
+    plans: Iterable[Iterable[Operation] | list[dict] | dict | OperationPlan | OperationStream],
+    output_dir: str | Path,
+    verify: bool = False,
+    strict_verify: bool = True,
+    template_cache: TemplateCache | None = None,
+    names: Iterable[str] | None = None,
+    incremental_verify: bool = False,
+    profile: bool = False,
+    on_timing: TimingHook | None = None,
+) -> Iterator[ApplyResult]:
+    """Render many plans against one template, yielding each result as it completes.
+
+    The template is parsed once and each plan runs on a clone of it; a plan's own
+    `template_pptx` is ignored. Outputs are named `<name>.pptx` from `names`, otherwise
+    `deck_00000.pptx`, `deck_00001.pptx`, ... in plan order; `names` must have one entry
+    per plan, a length mismatch raises `ValueError`. With `incremental_verify`,
+    only slides touched by a plan are rescanned; the rest reuse the template's baseline.
+    `profile` / `on_timing` work as in `apply_ops`, per plan; `load` is the clone.
+    """
+    source = _template_source(template_pptx)
+    out_dir = Path(output_dir).expanduser().resolve()
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    pristine: Presentation | None = None
+    pristine_key: tuple[str, int, int] | None = None
+    if names is not None:
+        named_plans = zip(names, plans, strict=True)
+    else:
+        named_plans = ((f"deck_{idx:05d}", raw) for idx, raw in enumerate(plans))
+
+    for name, raw_plan in named_plans:
+        profiler = _profiler(profile, on_timing)
+        with _phase(profiler, "parse"):
+            operations, plan = _to_operations(raw_plan)
+        output_path = out_dir / f"{name}.pptx"
+        if _needs_copy_engine(operations, plan):
+            # The copy engine owns its presentation, so these plans take the regular path.
+            yield apply_ops(
+                input_pptx=source,
+                ops=raw_plan if isinstance(raw_plan, OperationStream) else plan or operations,
+                output_pptx=output_path,
+                verify=verify,
+                strict_verify=strict_verify,
+                profile=profile,
+                on_timing=on_timing,
+            )
+            continue
+
+        with _phase(profiler, "load"):
+            if template_cache is not None and isinstance(source, Path):
+                source_key = _source_key(source)
+                presentation = template_cache.open(source)
+            else:
+                if pristine is None:
+                    pristine_key = _source_key(source)
+                    pristine = _open_template(source)
+                source_key = pristine_key
+                presentation = copy.deepcopy(pristine)
+        ctx = ApplyContext(presentation=presentation, plan=plan, profiler=profiler)
+        with _phase(profiler, "apply"):
+            applied = _run_operations(operations, ctx)
+            ctx.dedupe_media()
+        yield _save_and_verify(
+            presentation,
+            None,
+            output_path,
+            applied,
+            verify,
+            strict_verify,
+            source=source,
+            clean_parts=ctx.clean_parts(),
+            incremental_verify=incremental_verify,
+            profiler=profiler,
+            source_key=source_key,
+        )
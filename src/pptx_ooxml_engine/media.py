@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from typing import Any
+
+from pptx.opc.package import OpcPackage, XmlPart
+from pptx.opc.packuri import PackURI
+from pptx.parts.image import ImagePart
+
+from .cache import ImageInfo, ImageInfoCache, file_key, get_image_info_cache
+
+_MEDIA_PREFIX = "/ppt/media/"
+_IMAGE_PREFIX = "/ppt/media/image"
+_R_NS_PREFIX = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+
+
+class ImageStore:
+    """Image parts of one package, looked up by source file and by content.
+
+    Within a job, later uses of the same resolved path with unchanged mtime and size get
+    the part found or created the first time. Header facts and the content hash come from
+    the process-wide `ImageInfoCache`, so a file decoded by an earlier job is only read
+    again when its bytes have to be embedded. Existing image parts are matched by size
+    first, so a part is only hashed when an image of the same size shows up, and new
+    parts are named from indexes collected once instead of by walking the package.
+
+    Only parts added through the store are tracked, so it has to be dropped after anything
+    else (`copy_slide`, custom ops) may have added images to the package.
+    """
+
+    def __init__(self, package: OpcPackage, info_cache: ImageInfoCache | None = None):
+        self._package = package
+        self._infos = info_cache if info_cache is not None else get_image_info_cache()
+        self._by_file: dict[tuple[str, int, int], tuple[ImagePart, ImageInfo]] = {}
+        self._by_sha1: dict[str, ImagePart] = {}
+        self._unhashed: dict[int, list[ImagePart]] | None = None
+        self._used_idx: set[int] = set()
+        self._next_idx = 1
+
+    def part_for(self, path: Path) -> tuple[ImagePart, ImageInfo]:
+        key = file_key(path)
+        found = self._by_file.get(key)
+        if found is None:
+            info, blob = self._infos.lookup(path)
+            part = self._find(info)
+            if part is None:
+                # `ImagePart.new` without sniffing the image again or walking the whole
+                # package for a free partname.
+                part = ImagePart(
+                    self._next_partname(info.ext),
+                    info.content_type,
+                    self._package,
+                    blob if blob is not None else path.read_bytes(),
+                    path.name,
+                )
+                self._by_sha1[info.sha1] = part
+            found = self._by_file[key] = (part, info)
+        return found
+
+    def _find(self, info: ImageInfo) -> ImagePart | None:
+        if self._unhashed is None:
+            self._unhashed = {}
+            for part in self._package.iter_parts():
+                if part.partname.startswith(_IMAGE_PREFIX) and part.partname.idx is not None:
+                    self._used_idx.add(part.partname.idx)
+                if isinstance(part, ImagePart):
+                    self._unhashed.setdefault(len(part.blob), []).append(part)
+        for part in self._unhashed.pop(info.byte_size, ()):
+            self._by_sha1.setdefault(hashlib.sha1(part.blob).hexdigest(), part)
+        return self._by_sha1.get(info.sha1)
+
+    def _next_partname(self, ext: str) -> PackURI:
+        # Lowest free index, as `Package.next_image_partname` picks it.
+        while self._next_idx in self._used_idx:
+            self._next_idx += 1
+        self._used_idx.add(self._next_idx)
+        return PackURI(f"{_IMAGE_PREFIX}{self._next_idx}.{ext}")
+
+
+def dedupe_media(package: OpcPackage) -> set[Any]:
+    """Point every relationship to a byte-identical copy of a media part at one part.
+
+    The first copy in package order is kept; each XML part referring to another copy is
+    related to the kept one, its `r:` attributes are repointed and the old relationship is
+    dropped, so the copy is left out when the package is saved. Only parts of equal type
+    and size are hashed. Returns the parts whose relationships were rewritten.
+    """
+    referrers: dict[Any, list] = {}
+    for part in package.iter_parts():
+        if not isinstance(part, XmlPart):
+            continue
+        for rel in part.rels.values():
+            if not rel.is_external and rel.target_part.partname.startswith(_MEDIA_PREFIX):
+                referrers.setdefault(rel.target_part, []).append((part, rel))
+
+    same_size: dict[tuple[str, int], list] = {}
+    for media in referrers:
+        same_size.setdefault((media.content_type, len(media.blob)), []).append(media)
+
+    rewired: set[Any] = set()
+    for candidates in same_size.values():
+        if len(candidates) < 2:
+            continue
+        kept: dict[bytes, Any] = {}
+        for media in candidates:
+            keep = kept.setdefault(hashlib.sha1(media.blob).digest(), media)
+            if keep is media:
+                continue
+            for part, rel in referrers[media]:
+                rId = part.relate_to(keep, rel.reltype)
+                for elem in part._element.iter():
+                    for name, value in elem.attrib.items():
+                        if value == rel.rId and name.startswith(_R_NS_PREFIX):
+                            elem.set(name, rId)
+                part.drop_rel(rel.rId)
+                rewired.add(part)
+    return rewired
@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from enum import Enum
-from typing import Annotated, Literal, Union
+from functools import lru_cache
+from pathlib import Path
+from typing import Annotated, Iterable, Iterator, Literal, Union
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError, model_validator
 
 HEX_COLOR_PATTERN = r"^#?[0-9A-Fa-f]{6}$"
 
@@ -204,6 +211,62 @@ class SetTableCellOp(BaseModel):
         return self
 
 
+class TableColumnFormatSpec(BaseModel):
+    bold: bool | None = None
+    italic: bool | None = None
+    font_size_pt: float | None = Field(default=None, gt=0)
+    text_color_hex: str | None = Field(default=None, pattern=HEX_COLOR_PATTERN)
+    fill_color_hex: str | None = Field(default=None, pattern=HEX_COLOR_PATTERN)
+    alignment: Literal["left", "center", "right", "justify"] | None = None
+    number_format: str | None = None
+
+    @model_validator(mode="after")
+    def _check_number_format(self) -> "TableColumnFormatSpec":
+        if self.number_format is not None:
+            errors = []
+            # Integer-only specs such as "d" or ",d" are valid too.
+            for sample in (1, 1.5):
+                try:
+                    format(sample, self.number_format)
+                    return self
+                except ValueError as exc:
+                    errors.append(exc)
+            raise ValueError(f"invalid number_format {self.number_format!r}: {errors[-1]}") from errors[-1]
+        return self
+
+
+class FillTableOp(BaseModel):
+    op: Literal["fill_table"]
+    slide_index: int = Field(ge=0)
+    table_name: str | None = None
+    table_index: int | None = Field(default=None, ge=0)
+    data: list[list[str | bool | int | float | None]] = Field(min_length=1)
+    start_row: int = Field(default=0, ge=0)
+    start_col: int = Field(default=0, ge=0)
+    columns: list[TableColumnFormatSpec] = Field(default_factory=list)
+
+    @model_validator(mode="after")
+    def _check_number_formats(self) -> "FillTableOp":
+        for row_idx, row in enumerate(self.data):
+            for col_idx, value in enumerate(row[: len(self.columns)]):
+                number_format = self.columns[col_idx].number_format
+                if number_format is None or value is None or isinstance(value, (str, bool)):
+                    continue
+                try:
+                    format(value, number_format)
+                except ValueError as exc:
+                    raise ValueError(
+                        f"data[{row_idx}][{col_idx}] {value!r} does not fit number_format {number_format!r}"
+                    ) from exc
+        return self
+
+    @model_validator(mode="after")
+    def _check_target(self) -> "FillTableOp":
+        if self.table_name is None and self.table_index is None:
+            raise ValueError("fill_table requires table_name or table_index")
+        return self
+
+
 class MergeTableCellsOp(BaseModel):
     op: Literal["merge_table_cells"]
     slide_index: int = Field(ge=0)
@@ -464,6 +527,7 @@ Operation = Annotated[
         AddShapeOp,
         AddTableOp,
         SetTableCellOp,
+        FillTableOp,
         MergeTableCellsOp,
         SetSlideBackgroundOp,
         FillPlaceholderOp,
@@ -483,12 +547,31 @@ Operation = Annotated[
 ]
 
 
-class OperationPlan(BaseModel):
+class PlanHeader(BaseModel):
     template_pptx: str | None = None
     reuse_slide_libraries: list[str] = Field(default_factory=list)
+
+
+class OperationPlan(PlanHeader):
     operations: list[Operation]
 
 
+class _JsonlPlanHeader(PlanHeader):
+    # Header keys only, so an operation line that lost its `op` key is not taken for one.
+    model_config = ConfigDict(extra="forbid")
+
+
+@dataclass
+class OperationStream:
+    """A plan header plus operations that are validated only as they are consumed."""
+
+    header: PlanHeader
+    operations: Iterator[Operation]
+
+    def __iter__(self) -> Iterator[Operation]:
+        return self.operations
+
+
 def parse_ops(raw_ops: list[dict] | dict) -> list[Operation]:
     plan = parse_plan(raw_ops)
     return plan.operations
@@ -499,3 +582,111 @@ def parse_plan(raw: list[dict] | dict) -> OperationPlan:
         return OperationPlan.model_validate(raw)
     plan = OperationPlan.model_validate({"operations": raw})
     return plan
+
+
+_TRUSTED_PLAN_LIMIT = 128
+_TRUSTED_PLANS: OrderedDict[str, OperationPlan] = OrderedDict()
+_TRUSTED_PLANS_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _plan_adapter() -> TypeAdapter[OperationPlan]:
+    return TypeAdapter(OperationPlan)
+
+
+@lru_cache(maxsize=None)
+def _ops_adapter() -> TypeAdapter[list[Operation]]:
+    return TypeAdapter(list[Operation])
+
+
+def parse_plan_json(data: bytes | str, content_hash: str | None = None) -> OperationPlan:
+    """Validate a plan (object) or bare operation list (array) straight from JSON text.
+
+    Parsing and validation run in pydantic's native JSON mode, without building Python
+    dicts first. When `content_hash` (sha256 hex of `data`) is given, a plan that already
+    passed validation under that hash is returned from an in-process cache without being
+    parsed again; the returned plan is shared and must not be mutated.
+    """
+    if content_hash is not None:
+        with _TRUSTED_PLANS_LOCK:
+            plan = _TRUSTED_PLANS.get(content_hash)
+            if plan is not None:
+                _TRUSTED_PLANS.move_to_end(content_hash)
+                return plan
+
+    head = data.lstrip()[:1]
+    if head in (b"[", "["):
+        plan = OperationPlan(operations=_ops_adapter().validate_json(data))
+    else:
+        plan = _plan_adapter().validate_json(data)
+
+    if content_hash is not None:
+        raw = data.encode("utf-8") if isinstance(data, str) else data
+        digest = hashlib.sha256(raw).hexdigest()
+        if digest != content_hash:
+            raise ValueError(f"content_hash does not match plan data: expected {content_hash}, got {digest}")
+        with _TRUSTED_PLANS_LOCK:
+            _TRUSTED_PLANS[content_hash] = plan
+            while len(_TRUSTED_PLANS) > _TRUSTED_PLAN_LIMIT:
+                _TRUSTED_PLANS.popitem(last=False)
+    return plan
+
+
+@lru_cache(maxsize=None)
+def _op_adapter() -> TypeAdapter[Operation]:
+    return TypeAdapter(Operation)
+
+
+def _validate_line(lineno: int, line: bytes | str) -> Operation:
+    try:
+        return _op_adapter().validate_json(line)
+    except ValidationError as exc:
+        raise ValueError(f"invalid operation on line {lineno}: {exc}") from exc
+
+
+def parse_ops_jsonl(lines: Iterable[bytes | str]) -> OperationStream:
+    """Read a JSON Lines plan: an optional header object, then one operation per line.
+
+    The header is the first non-blank line when it has no `op` key; it may carry only
+    `template_pptx` and `reuse_slide_libraries`, any other key is an error. Only the
+    header is read eagerly; each operation is parsed and validated when the stream
+    reaches it, so plans of any length are held one line at a time. Blank lines are
+    skipped.
+    """
+    numbered = enumerate(lines, start=1)
+    header = PlanHeader()
+    first: tuple[int, bytes | str] | None = None
+    for lineno, line in numbered:
+        if not line.strip():
+            continue
+        try:
+            head = json.loads(line)
+        except ValueError as exc:
+            raise ValueError(f"invalid JSON on line {lineno}: {exc}") from exc
+        if isinstance(head, dict) and "op" not in head:
+            try:
+                header = _JsonlPlanHeader.model_validate(head)
+            except ValidationError as exc:
+                raise ValueError(f"invalid header on line {lineno}: {exc}") from exc
+        else:
+            first = (lineno, line)
+        break
+
+    def _operations() -> Iterator[Operation]:
+        if first is not None:
+            yield _validate_line(*first)
+        for lineno, line in numbered:
+            if line.strip():
+                yield _validate_line(lineno, line)
+
+    return OperationStream(header=header, operations=_operations())
+
+
+def load_ops_jsonl(path: str | Path) -> OperationStream:
+    """Open a `.jsonl` plan file as an `OperationStream`; the file closes once drained."""
+
+    def _lines() -> Iterator[bytes]:
+        with open(path, "rb") as handle:
+            yield from handle
+
+    return parse_ops_jsonl(_lines())
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import os
+import signal
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from .cache import TemplateCache
+from .engine import ApplyResult, _import_copy_ops, apply_ops
+
+_WORKER_CACHE: TemplateCache | None = None
+# Seconds the parent waits past `timeout` before it stops a worker the job's own
+# SIGALRM could not interrupt, and the polling interval while such a limit is armed.
+_TIMEOUT_GRACE = 1.0
+_TIMEOUT_POLL = 0.05
+
+
+@dataclass
+class RenderOutcome:
+    index: int
+    name: str
+    result: ApplyResult | None
+    error: str | None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _init_worker(*template_paths: Path) -> None:
+    global _WORKER_CACHE
+    _WORKER_CACHE = TemplateCache()
+    for template_path in template_paths:
+        _WORKER_CACHE.open(template_path)
+    try:
+        _import_copy_ops()
+    except ModuleNotFoundError:
+        pass
+
+
+def _raise_timeout(signum, frame) -> None:
+    raise TimeoutError("render job timed out")
+
+
+def _render_job(
+    template_path: Path,
+    raw_plan: Any,
+    output_path: Path,
+    verify: bool,
+    strict_verify: bool,
+    timeout: float | None,
+) -> tuple[ApplyResult | None, str | None]:
+    use_alarm = timeout is not None and hasattr(signal, "SIGALRM")
+    if use_alarm:
+        previous = signal.signal(signal.SIGALRM, _raise_timeout)
+    try:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, timeout)
+        result = apply_ops(
+            input_pptx=template_path,
+            ops=raw_plan,
+            output_pptx=output_path,
+            verify=verify,
+            strict_verify=strict_verify,
+            template_cache=_WORKER_CACHE,
+        )
+        return result, None
+    except Exception as exc:
+        return None, f"{type(exc).__name__}: {exc}"
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
+
+
+def _kill_workers(executor: ProcessPoolExecutor) -> None:
+    kill_workers = getattr(executor, "kill_workers", None)
+    if kill_workers is not None:  # Python 3.14+
+        kill_workers()
+        return
+    # Older versions have no public way to stop a busy worker.
+    processes = list((executor._processes or {}).values())
+    executor.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        process.kill()
+
+
+def _error(exc: BaseException) -> str:
+    return f"{type(exc).__name__}: {exc}"
+
+
+def render_parallel(
+    template_pptx: str | Path,
+    plans: Iterable[Any],
+    output_dir: str | Path,
+    workers: int | None = None,
+    max_in_flight: int | None = None,
+    timeout: float | None = None,
+    ordered: bool = True,
+    verify: bool = False,
+    strict_verify: bool = True,
+    names: Iterable[str] | None = None,
+) -> Iterator[RenderOutcome]:
+    """Render plans on a pool of worker processes pre-warmed with the template.
+
+    At most `max_in_flight` plans are submitted or buffered at once. A failing plan,
+    including one that cannot be pickled to or from a worker, yields an outcome carrying
+    its error instead of aborting the batch. `timeout` is enforced per job inside the
+    worker where SIGALRM is available; a job still running `_TIMEOUT_GRACE` seconds past
+    it (e.g. stuck in C code) fails with `TimeoutError`, the pool is recycled and the
+    other unfinished jobs are resubmitted. With a timeout, no more than `workers` jobs are
+    handed to the pool at once, so a job's clock starts when a worker takes it. With
+    `ordered`, outcomes follow plan order, otherwise they are yielded as they complete.
+    """
+    input_path = Path(template_pptx).expanduser().resolve()
+    out_dir = Path(output_dir).expanduser().resolve()
+    out_dir.mkdir(parents=True, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or workers * 2
+    if max_in_flight < 1:
+        raise ValueError(f"max_in_flight must be positive: {max_in_flight}")
+    max_submitted = workers if timeout is not None else max_in_flight
+
+    if names is not None:
+        jobs = iter(enumerate(zip(names, plans, strict=True)))
+    else:
+        jobs = ((idx, (f"deck_{idx:05d}", raw)) for idx, raw in enumerate(plans))
+
+    def new_executor() -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(input_path,))
+
+    executor = new_executor()
+    pending: dict[Future, tuple[int, str, Any]] = {}
+    running_since: dict[Future, float] = {}
+    buffered: dict[int, RenderOutcome] = {}
+    ready: list[RenderOutcome] = []
+    next_index = 0
+    exhausted = False
+
+    def submit(index: int, name: str, raw_plan: Any) -> None:
+        try:
+            future = executor.submit(
+                _render_job,
+                input_path,
+                raw_plan,
+                out_dir / f"{name}.pptx",
+                verify,
+                strict_verify,
+                timeout,
+            )
+        except Exception as exc:
+            ready.append(RenderOutcome(index, name, None, _error(exc)))
+            return
+        pending[future] = (index, name, raw_plan)
+
+    def collect(future: Future) -> bool:
+        index, name, _ = pending.pop(future)
+        running_since.pop(future, None)
+        try:
+            result, error = future.result()
+        except BrokenProcessPool as exc:
+            ready.append(RenderOutcome(index, name, None, _error(exc)))
+            return True
+        except Exception as exc:
+            # A plan or result that could not be pickled.
+            result, error = None, _error(exc)
+        ready.append(RenderOutcome(index, name, result, error))
+        return False
+
+    try:
+        while True:
+            while not exhausted and len(pending) < max_submitted and len(pending) + len(buffered) < max_in_flight:
+                job = next(jobs, None)
+                if job is None:
+                    exhausted = True
+                    break
+                index, (name, raw_plan) = job
+                submit(index, name, raw_plan)
+
+            if pending:
+                poll = None
+                if timeout is not None:
+                    now = time.monotonic()
+                    for future in pending:
+                        if future.running():
+                            running_since.setdefault(future, now)
+                    deadlines = [since + timeout + _TIMEOUT_GRACE - now for since in running_since.values()]
+                    poll = max(0.0, min([_TIMEOUT_POLL, *deadlines]))
+                done, _ = wait(pending, timeout=poll, return_when=FIRST_COMPLETED)
+                pool_broken = False
+                for future in done:
+                    pool_broken |= collect(future)
+                expired = []
+                if timeout is not None:
+                    now = time.monotonic()
+                    limit = timeout + _TIMEOUT_GRACE
+                    expired = [future for future, since in running_since.items() if now - since > limit]
+
+                if pool_broken:
+                    # A worker died hard; jobs still queued on the dead pool fail with it.
+                    for index, name, _ in pending.values():
+                        ready.append(RenderOutcome(index, name, None, "BrokenProcessPool: worker pool terminated"))
+                    pending.clear()
+                    running_since.clear()
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    executor = new_executor()
+                elif expired:
+                    for future in expired:
+                        index, name, _ = pending.pop(future)
+                        running_since.pop(future)
+                        error = f"TimeoutError: render job exceeded {timeout}s; worker stopped"
+                        ready.append(RenderOutcome(index, name, None, error))
+                    for future in [future for future in pending if future.done()]:
+                        collect(future)
+                    unfinished = list(pending.values())
+                    pending.clear()
+                    running_since.clear()
+                    _kill_workers(executor)
+                    executor = new_executor()
+                    for index, name, raw_plan in unfinished:
+                        submit(index, name, raw_plan)
+
+            for outcome in ready:
+                if ordered:
+                    buffered[outcome.index] = outcome
+                else:
+                    yield outcome
+            ready.clear()
+            while next_index in buffered:
+                yield buffered.pop(next_index)
+                next_index += 1
+            if exhausted and not pending:
+                break
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Iterator
+
+PHASES = ("parse", "load", "apply", "save", "verify")
+
+
+@dataclass
+class TimingEvent:
+    """One measured span: a job phase, or a single op when `kind == "op"`."""
+
+    kind: str
+    name: str
+    wall: float
+    cpu: float
+    index: int | None = None
+
+
+@dataclass
+class OpTypeTiming:
+    count: int = 0
+    wall: float = 0.0
+    cpu: float = 0.0
+
+
+@dataclass
+class ApplyTimings:
+    """Wall and CPU seconds per phase and per op of one `apply_ops` job.
+
+    CPU time is the rendering thread's own (`time.thread_time`), so it stays meaningful
+    when several jobs share a process. A streamed plan is parsed while it is applied, so
+    its parse cost is part of `apply`.
+    """
+
+    phases: dict[str, TimingEvent] = field(default_factory=dict)
+    ops: list[TimingEvent] = field(default_factory=list)
+
+    @property
+    def by_op_type(self) -> dict[str, OpTypeTiming]:
+        totals: dict[str, OpTypeTiming] = {}
+        for event in self.ops:
+            entry = totals.setdefault(event.name, OpTypeTiming())
+            entry.count += 1
+            entry.wall += event.wall
+            entry.cpu += event.cpu
+        return totals
+
+
+TimingHook = Callable[[TimingEvent], None]
+
+
+class _Profiler:
+    def __init__(self, hook: TimingHook | None = None) -> None:
+        self.timings = ApplyTimings()
+        self._hook = hook
+
+    def _record(self, event: TimingEvent) -> None:
+        if event.kind == "op":
+            self.timings.ops.append(event)
+        else:
+            self.timings.phases[event.name] = event
+        if self._hook is not None:
+            self._hook(event)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        wall, cpu = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            self._record(TimingEvent("phase", name, time.perf_counter() - wall, time.thread_time() - cpu))
+
+    def op(self, index: int, name: str, wall_start: float, cpu_start: float) -> None:
+        self._record(
+            TimingEvent("op", name, time.perf_counter() - wall_start, time.thread_time() - cpu_start, index)
+        )
+
+
+def _profiler(profile: bool, on_timing: TimingHook | None) -> _Profiler | None:
+    if not profile and on_timing is None:
+        return None
+    return _Profiler(on_timing)
@@ -0,0 +1,347 @@
+from __future__ import annotations
+
+import ipaddress
+import json
+import os
+import socketserver
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Iterable
+
+from pydantic import ValidationError
+
+from .engine import ApplyResult
+from .models import OperationPlan, parse_plan
+from .parallel import _init_worker, _render_job
+
+_LATENCY_WINDOW = 1024
+# Operation fields naming files the render reads.
+_INPUT_PATH_FIELDS = ("image_path", "source_path")
+
+
+def _within(root: Path, raw: str | Path, field: str) -> Path:
+    # Relative names resolve under the root; anything resolving outside it, `..` and
+    # symlinks included, is refused.
+    path = (root / Path(raw).expanduser()).resolve()
+    if not path.is_relative_to(root):
+        raise ValueError(f"{field} must be inside {root}: {raw}")
+    return path
+
+
+def _is_loopback(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+class RenderService:
+    """A warm pool of render worker processes shared by every request of a daemon.
+
+    Workers keep a `TemplateCache` for the life of the process, import the copy engine
+    up front and pre-open the `preload` templates. At most `workers + max_queue` jobs
+    are accepted at once; `submit` raises `RuntimeError` beyond that so callers can
+    shed load instead of queueing without bound.
+
+    Request paths are confined: outputs must resolve inside `output_root`, and templates
+    and every file the plan reads (`reuse_slide_libraries`, copy_slide `source_path`,
+    image `image_path`) inside `template_root`. Both default to the working directory;
+    relative names resolve against them.
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        max_queue: int | None = None,
+        timeout: float | None = None,
+        preload: Iterable[str | Path] = (),
+        output_root: str | Path | None = None,
+        template_root: str | Path | None = None,
+    ) -> None:
+        self.output_root = Path(output_root or ".").expanduser().resolve()
+        self.template_root = Path(template_root or ".").expanduser().resolve()
+        self.workers = workers or os.cpu_count() or 1
+        self.max_queue = max_queue if max_queue is not None else self.workers * 8
+        if self.max_queue < 0:
+            raise ValueError(f"max_queue must be non-negative: {self.max_queue}")
+        self.timeout = timeout
+        self._preload = tuple(Path(path).expanduser().resolve() for path in preload)
+        self._lock = threading.Lock()
+        self._executor = self._new_executor()
+        self._pending = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._latency_total = 0.0
+        self._latencies: deque[float] = deque(maxlen=_LATENCY_WINDOW)
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker, initargs=self._preload)
+
+    def submit(
+        self,
+        plan: OperationPlan | list | dict,
+        output_pptx: str | Path,
+        template_pptx: str | Path | None = None,
+        verify: bool = False,
+        strict_verify: bool = True,
+    ) -> Future:
+        """Queue one render; the future resolves to `(ApplyResult | None, error | None)`."""
+        if not isinstance(plan, OperationPlan):
+            plan = parse_plan(plan)
+        template_raw = template_pptx if template_pptx is not None else plan.template_pptx
+        if template_raw is None:
+            raise ValueError("template_pptx is required")
+        template_path = _within(self.template_root, template_raw, "template_pptx")
+        output_path = _within(self.output_root, output_pptx, "output_pptx")
+        plan = self._confine_inputs(plan)
+
+        with self._lock:
+            if self._pending >= self.workers + self.max_queue:
+                self._rejected += 1
+                raise RuntimeError(f"render queue is full: {self._pending} jobs pending")
+            self._pending += 1
+            executor = self._executor
+        started = time.perf_counter()
+        try:
+            future = executor.submit(
+                _render_job, template_path, plan, output_path, verify, strict_verify, self.timeout
+            )
+        except BaseException:
+            with self._lock:
+                self._pending -= 1
+            raise
+        future.add_done_callback(lambda done: self._finish(done, executor, started))
+        return future
+
+    def _confine_inputs(self, plan: OperationPlan) -> OperationPlan:
+        # Rewritten on copies: a plan from `parse_plan_json`'s cache is shared.
+        root = self.template_root
+        operations = []
+        for index, op in enumerate(plan.operations):
+            update = {
+                field: str(_within(root, value, f"operations[{index}].{field}"))
+                for field in _INPUT_PATH_FIELDS
+                if isinstance(value := getattr(op, field, None), str)
+            }
+            operations.append(op.model_copy(update=update) if update else op)
+        libraries = [
+            str(_within(root, raw, f"reuse_slide_libraries[{index}]"))
+            for index, raw in enumerate(plan.reuse_slide_libraries)
+        ]
+        return plan.model_copy(update={"operations": operations, "reuse_slide_libraries": libraries})
+
+    def _finish(self, future: Future, executor: ProcessPoolExecutor, started: float) -> None:
+        elapsed = time.perf_counter() - started
+        error = None if future.cancelled() else future.exception()
+        failed = future.cancelled() or error is not None or future.result()[1] is not None
+        with self._lock:
+            self._pending -= 1
+            self._completed += 1
+            self._failed += failed
+            self._latency_total += elapsed
+            self._latencies.append(elapsed)
+            if isinstance(error, BrokenProcessPool) and executor is self._executor:
+                # A worker died hard; later jobs go to a fresh pool.
+                self._executor = self._new_executor()
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    def render(
+        self,
+        plan: OperationPlan | list | dict,
+        output_pptx: str | Path,
+        template_pptx: str | Path | None = None,
+        verify: bool = False,
+        strict_verify: bool = True,
+    ) -> ApplyResult:
+        """Submit a render and wait for it; worker errors are raised as `RuntimeError`."""
+        try:
+            result, error = self.submit(plan, output_pptx, template_pptx, verify, strict_verify).result()
+        except BrokenProcessPool as exc:
+            result, error = None, f"BrokenProcessPool: {exc}"
+        if error is not None:
+            raise RuntimeError(error)
+        return result
+
+    def metrics(self) -> dict[str, Any]:
+        """Queue depth, throughput counters and latency (ms) over the last 1024 jobs."""
+        with self._lock:
+            pending = self._pending
+            latencies = sorted(self._latencies)
+            completed = self._completed
+            latency_total = self._latency_total
+            counters = {"completed": completed, "failed": self._failed, "rejected": self._rejected}
+
+        def percentile(fraction: float) -> float:
+            if not latencies:
+                return 0.0
+            return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))] * 1000
+
+        return {
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "in_flight": min(pending, self.workers),
+            "queue_depth": max(0, pending - self.workers),
+            **counters,
+            "latency_ms": {
+                "mean": latency_total * 1000 / completed if completed else 0.0,
+                "p50": percentile(0.50),
+                "p95": percentile(0.95),
+                "p99": percentile(0.99),
+                "max": latencies[-1] * 1000 if latencies else 0.0,
+            },
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            executor = self._executor
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+class _RenderRequestHandler(BaseHTTPRequestHandler):
+    """`POST /render`, `GET /metrics` and `GET /health`; every body is JSON."""
+
+    server_version = "pptx-ooxml-engine"
+    protocol_version = "HTTP/1.1"
+    # Buffer the response so headers and body leave in one write; separate small writes
+    # on a keep-alive connection stall on Nagle / delayed ACK.
+    wbufsize = -1
+
+    def address_string(self) -> str:
+        # Unix socket peers have no (host, port) address.
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+    def _send_json(self, status: int, payload: dict[str, Any]) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        if self.path == "/metrics":
+            self._send_json(200, self.server.service.metrics())
+        elif self.path == "/health":
+            self._send_json(200, {"ok": True})
+        else:
+            self._send_json(404, {"error": f"not found: {self.path}"})
+
+    def do_POST(self) -> None:
+        if self.path != "/render":
+            self._send_json(404, {"error": f"not found: {self.path}"})
+            return
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        try:
+            request = json.loads(body)
+            if not isinstance(request, dict) or "plan" not in request or "output_pptx" not in request:
+                raise ValueError("request requires plan and output_pptx")
+            future = self.server.service.submit(
+                request["plan"],
+                request["output_pptx"],
+                template_pptx=request.get("template_pptx"),
+                verify=bool(request.get("verify", False)),
+                strict_verify=bool(request.get("strict_verify", True)),
+            )
+        except RuntimeError as exc:
+            self._send_json(503, {"error": str(exc)})
+            return
+        except (ValueError, ValidationError) as exc:
+            self._send_json(400, {"error": str(exc)})
+            return
+
+        try:
+            result, error = future.result()
+        except BrokenProcessPool as exc:
+            result, error = None, f"BrokenProcessPool: {exc}"
+        if error is not None:
+            self._send_json(422, {"error": error})
+            return
+        self._send_json(
+            200,
+            {
+                "output_path": str(result.output_path),
+                "operations_applied": result.operations_applied,
+                "verify_issues": result.verify_issues,
+            },
+        )
+
+
+class _HTTPRenderServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], service: RenderService) -> None:
+        self.service = service
+        super().__init__(address, _RenderRequestHandler)
+
+
+class _UnixRenderServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str, service: RenderService) -> None:
+        self.service = service
+        super().__init__(path, _RenderRequestHandler)
+
+    def server_close(self) -> None:
+        super().server_close()
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+
+
+def make_server(
+    service: RenderService,
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    unix_socket: str | Path | None = None,
+) -> socketserver.BaseServer:
+    """Bind an HTTP server for `service` on `host:port`, or on `unix_socket` when given."""
+    if unix_socket is not None:
+        socket_path = str(Path(unix_socket).expanduser())
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        return _UnixRenderServer(socket_path, service)
+    return _HTTPRenderServer((host, port), service)
+
+
+def serve(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    unix_socket: str | Path | None = None,
+    workers: int | None = None,
+    max_queue: int | None = None,
+    timeout: float | None = None,
+    preload: Iterable[str | Path] = (),
+    output_root: str | Path | None = None,
+    template_root: str | Path | None = None,
+    allow_remote: bool = False,
+) -> None:
+    """Run the render daemon until interrupted.
+
+    Binding TCP to anything but a loopback address needs `allow_remote`: requests name
+    files on this host, so the daemon is meant for local callers.
+    """
+    if unix_socket is None and not allow_remote and not _is_loopback(host):
+        raise ValueError(f"refusing to serve on non-loopback host {host!r} without allow_remote")
+    service = RenderService(
+        workers=workers,
+        max_queue=max_queue,
+        timeout=timeout,
+        preload=preload,
+        output_root=output_root,
+        template_root=template_root,
+    )
+    server = make_server(service, host=host, port=port, unix_socket=unix_socket)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
@@ -1,12 +1,28 @@
 from __future__ import annotations
 
+import os
 import posixpath
+import tempfile
+import threading
 import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
+from io import BytesIO
 from pathlib import Path
+from typing import IO, Any, Hashable, Mapping
 from zipfile import ZipFile
 
+from lxml import etree
 from pptx import Presentation
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml.ns import qn
+
+from .cache import VerifyCache
+
+_R_NS_PREFIX = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_HASH_CHUNK = 64 * 1024
 
 
 @dataclass
@@ -30,104 +46,497 @@ def _norm(base_part: str, target: str) -> str:
     return posixpath.normpath(posixpath.join(posixpath.dirname(base_part), target))
 
 
-def verify_pptx(path: str | Path) -> VerifyReport:
-    issues: list[str] = []
-    target = Path(path).expanduser().resolve()
+_NS_REL = "http://schemas.openxmlformats.org/package/2006/relationships"
+_NS_P = "http://schemas.openxmlformats.org/presentationml/2006/main"
+_RID_ATTR = f"{_R_NS_PREFIX}id"
 
-    try:
-        Presentation(str(target))
-    except Exception as exc:
-        return VerifyReport([f"python-pptx cannot open file: {exc}"])
+RelMap = dict[str, dict[str, str]]
+_SlideCheck = tuple[list[str], "str | None"]
 
-    ns_rel = "http://schemas.openxmlformats.org/package/2006/relationships"
-    ns_p = "http://schemas.openxmlformats.org/presentationml/2006/main"
-    rid_attr = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
 
-    def rel_map(archive: ZipFile, rel_path: str) -> dict[str, dict[str, str]]:
+def _rel_map(
+    archive: ZipFile,
+    rel_path: str,
+    issues: list[str],
+    rel_maps: dict[str, RelMap | None],
+) -> RelMap:
+    # Each rels part is parsed at most once per run; a missing one is still reported
+    # every time it is looked up.
+    if rel_path not in rel_maps:
         try:
             root = ET.fromstring(archive.read(rel_path))
         except KeyError:
-            issues.append(f"missing rels part: {rel_path}")
-            return {}
-        return {
-            rel.attrib["Id"]: {"Type": rel.attrib["Type"], "Target": rel.attrib["Target"]}
-            for rel in root.findall(f"{{{ns_rel}}}Relationship")
-        }
-
-    with ZipFile(target) as archive:
-        pres = "ppt/presentation.xml"
-        pres_rels = _rels_path(pres)
+            rel_maps[rel_path] = None
+        else:
+            rel_maps[rel_path] = {
+                rel.attrib["Id"]: {"Type": rel.attrib["Type"], "Target": rel.attrib["Target"]}
+                for rel in root.findall(f"{{{_NS_REL}}}Relationship")
+            }
+    mapping = rel_maps[rel_path]
+    if mapping is None:
+        issues.append(f"missing rels part: {rel_path}")
+        return {}
+    return mapping
+
+
+def _read_optional(archive: ZipFile, name: str) -> bytes | None:
+    try:
+        return archive.read(name)
+    except KeyError:
+        return None
+
+
+def _iter_streamed_elements(stream):
+    """Yield each element at its start tag, freeing it once its end tag is parsed.
+
+    Only the chain of open ancestors stays in memory, so peak usage is bounded by the
+    document depth and the largest single element rather than the whole part.
+    """
+    stack: list[ET.Element] = []
+    for event, elem in ET.iterparse(stream, events=("start", "end")):
+        if event == "start":
+            stack.append(elem)
+            yield elem
+            continue
+        stack.pop()
+        elem.clear()
+        if stack:
+            # A closed element is always its parent's most recent child.
+            del stack[-1][-1]
+
+
+def _slide_facts(
+    archive: ZipFile,
+    slide_part: str,
+    rel_maps: dict[str, RelMap | None],
+    streaming: bool,
+) -> dict | None:
+    """Name-independent check result for one slide, or None when the slide part is missing."""
+    rels_issues: list[str] = []
+    slide_rel_map = _rel_map(archive, _rels_path(slide_part), rels_issues, rel_maps)
+    try:
+        if streaming:
+            stream = archive.open(slide_part)
+        else:
+            slide_root = ET.fromstring(archive.read(slide_part))
+    except KeyError:
+        return None
+
+    # Dangling r:id references.
+    dangling: list[str] = []
+    if streaming:
+        with stream:
+            _collect_dangling(_iter_streamed_elements(stream), slide_rel_map, dangling)
+    else:
+        _collect_dangling(slide_root.iter(), slide_rel_map, dangling)
+
+    layout_target = None
+    for item in slide_rel_map.values():
+        if item["Type"].endswith("/slideLayout"):
+            layout_target = item["Target"]
+            break
+    return {"rels_missing": bool(rels_issues), "dangling": dangling, "layout_target": layout_target or None}
+
+
+def _check_slide(
+    archive: ZipFile,
+    slide_part: str,
+    rel_maps: dict[str, RelMap | None],
+    streaming: bool = False,
+    cache: VerifyCache | None = None,
+) -> _SlideCheck:
+    """Issues for one slide part, plus the layout part it points at (None if unresolved).
+
+    With a `cache`, the result is looked up by the content hash of the slide and its rels
+    part, so a byte-identical slide verified before is not parsed again. In `streaming`
+    mode the slide is hashed chunk by chunk from the member stream.
+    """
+    facts = None
+    key = None
+    if cache is not None:
+        rels_bytes = _read_optional(archive, _rels_path(slide_part))
+        rels_input = None if rels_bytes is None else (len(rels_bytes), (rels_bytes,))
+        if streaming:
+            try:
+                info = archive.getinfo(slide_part)
+            except KeyError:
+                info = None
+            if info is not None:
+                with archive.open(info) as stream:
+                    chunks = iter(lambda: stream.read(_HASH_CHUNK), b"")
+                    key = cache.key_chunks((info.file_size, chunks), rels_input)
+        else:
+            slide_bytes = _read_optional(archive, slide_part)
+            if slide_bytes is not None:
+                key = cache.key_chunks((len(slide_bytes), (slide_bytes,)), rels_input)
+        if key is not None:
+            facts = cache.get(key)
+    if facts is None:
+        facts = _slide_facts(archive, slide_part, rel_maps, streaming)
+        if key is not None and facts is not None:
+            cache.put(key, facts)
+
+    rels_path = _rels_path(slide_part)
+    if facts is None:
+        issues = [f"missing rels part: {rels_path}"] if rel_maps[rels_path] is None else []
+        issues.append(f"missing slide part: {slide_part}")
+        return issues, None
+    issues = [f"missing rels part: {rels_path}"] if facts["rels_missing"] else []
+    issues.extend(f"dangling relationship {rid} in {slide_part}" for rid in facts["dangling"])
+    if not facts["layout_target"]:
+        issues.append(f"missing slideLayout relation in {slide_part}")
+        return issues, None
+    return issues, _norm(slide_part, facts["layout_target"])
+
+
+def _collect_dangling(elements, slide_rel_map: RelMap, dangling: list[str]) -> None:
+    for elem in elements:
+        for attr_name, attr_value in elem.attrib.items():
+            if attr_name.startswith(_R_NS_PREFIX) and attr_value:
+                if attr_value not in slide_rel_map:
+                    dangling.append(attr_value)
+
+
+def _deck_file(source: str | bytes) -> str | BytesIO:
+    return BytesIO(source) if isinstance(source, bytes) else source
+
+
+def _check_slide_shard(
+    source: str | bytes,
+    slide_parts: list[str],
+    streaming: bool,
+    cache: VerifyCache | None,
+) -> tuple[list[_SlideCheck], int]:
+    with ZipFile(_deck_file(source)) as archive:
+        rel_maps: dict[str, RelMap | None] = {}
+        checks = [_check_slide(archive, slide_part, rel_maps, streaming, cache) for slide_part in slide_parts]
+    return checks, cache.writes if cache is not None else 0
+
+
+def _open_error(source: str | bytes) -> str | None:
+    try:
+        Presentation(_deck_file(source))
+    except Exception as exc:
+        return f"python-pptx cannot open file: {exc}"
+    return None
+
+
+_EXECUTORS: dict[int, ProcessPoolExecutor] = {}
+_EXECUTORS_LOCK = threading.Lock()
+
+
+def _shared_executor(workers: int) -> ProcessPoolExecutor:
+    """Process pool of `workers` processes reused by every parallel `verify_pptx` call."""
+    with _EXECUTORS_LOCK:
+        executor = _EXECUTORS.get(workers)
+        if executor is None:
+            executor = _EXECUTORS[workers] = ProcessPoolExecutor(max_workers=workers)
+        return executor
+
+
+def _drop_shared_executor(workers: int, executor: Executor) -> None:
+    with _EXECUTORS_LOCK:
+        if _EXECUTORS.get(workers) is executor:
+            del _EXECUTORS[workers]
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def verify_pptx(
+    path: str | Path | bytes | IO[bytes],
+    workers: int | None = None,
+    streaming: bool = False,
+    cache: VerifyCache | None = None,
+    executor: Executor | None = None,
+) -> VerifyReport:
+    """Check slide -> layout -> master integrity and relationship ids of a saved deck.
+
+    With `workers` > 1 the per-slide checks (slide parse, dangling `r:id` scan, layout
+    lookup) are sharded across a process pool of that size, kept for later calls with
+    the same `workers`; pass `executor` to run the shards on a pool of your own instead.
+    A deck given as bytes or a stream is written to one temporary file that every shard
+    opens. Results are merged in slide order, so the report is identical to the serial
+    one. With `streaming`, slide parts are scanned incrementally from the zip member
+    stream instead of being parsed whole.
+    With a `VerifyCache`, slides byte-identical to ones verified before (same slide and
+    rels content) reuse the stored result instead of being parsed. A deck held in memory
+    can be passed as bytes or a readable binary stream instead of a path.
+    """
+    issues: list[str] = []
+    if isinstance(path, (str, os.PathLike)):
+        target: str | bytes = str(Path(path).expanduser().resolve())
+    elif isinstance(path, (bytes, bytearray, memoryview)):
+        target = bytes(path)
+    else:
+        target = path.read()
+    shared = executor is None and workers is not None and workers > 1
+    if shared:
+        executor = _shared_executor(workers)
+    shard_workers = workers or os.cpu_count() or 1
+    spilled = None
+    if executor is not None and isinstance(target, bytes):
+        # Shards get a path, so the deck is not pickled once per shard.
+        with tempfile.NamedTemporaryFile(suffix=".pptx", delete=False) as handle:
+            handle.write(target)
+        spilled = target = handle.name
+    try:
+        # In parallel mode the python-pptx load check overlaps with the slide shards.
+        open_check = executor.submit(_open_error, target) if executor else None
+        if open_check is None:
+            error = _open_error(target)
+            if error:
+                return VerifyReport([error])
+
+        rel_maps: dict[str, RelMap | None] = {}
+        layout_masters: dict[str, str | None] = {}
+
         try:
-            pres_root = ET.fromstring(archive.read(pres))
-        except KeyError:
-            return VerifyReport(["missing ppt/presentation.xml"])
-        pres_rel_map = rel_map(archive, pres_rels)
-
-        # Registered masters.
-        registered_masters: set[str] = set()
-        master_lst = pres_root.find(f"{{{ns_p}}}sldMasterIdLst")
-        if master_lst is not None:
-            for master_id in master_lst.findall(f"{{{ns_p}}}sldMasterId"):
-                rid = master_id.attrib.get(rid_attr)
-                if not rid:
-                    continue
-                rel = pres_rel_map.get(rid)
-                if rel:
-                    registered_masters.add(_norm(pres, rel["Target"]))
-
-        used_masters: set[str] = set()
-        slide_lst = pres_root.find(f"{{{ns_p}}}sldIdLst")
-        if slide_lst is None:
-            return VerifyReport(issues)
-
-        for slide_id in slide_lst.findall(f"{{{ns_p}}}sldId"):
-            slide_rid = slide_id.attrib.get(rid_attr)
-            rel = pres_rel_map.get(slide_rid or "")
-            if not rel:
-                issues.append(f"slide rId missing in presentation rels: {slide_rid}")
-                continue
-            slide_part = _norm(pres, rel["Target"])
-            slide_rels = _rels_path(slide_part)
-            slide_rel_map = rel_map(archive, slide_rels)
+            archive = ZipFile(_deck_file(target))
+        except Exception:
+            error = open_check.result() if open_check is not None else None
+            if error:
+                return VerifyReport([error])
+            raise
+
+        with archive:
+
+            def layout_master(layout_part: str) -> str | None:
+                layout_rels = _rels_path(layout_part)
+                if layout_part in layout_masters:
+                    if rel_maps.get(layout_rels) is None:
+                        issues.append(f"missing rels part: {layout_rels}")
+                    return layout_masters[layout_part]
+                master_target = None
+                for item in _rel_map(archive, layout_rels, issues, rel_maps).values():
+                    if item["Type"].endswith("/slideMaster"):
+                        master_target = item["Target"]
+                        break
+                master = _norm(layout_part, master_target) if master_target else None
+                layout_masters[layout_part] = master
+                return master
+
+            pres = "ppt/presentation.xml"
             try:
-                slide_root = ET.fromstring(archive.read(slide_part))
+                pres_root = ET.fromstring(archive.read(pres))
             except KeyError:
-                issues.append(f"missing slide part: {slide_part}")
-                continue
+                pres_root = None
+            if open_check is not None:
+                error = open_check.result()
+                if error:
+                    return VerifyReport([error])
+            if pres_root is None:
+                return VerifyReport(["missing ppt/presentation.xml"])
+            pres_rel_map = _rel_map(archive, _rels_path(pres), issues, rel_maps)
 
-            # Dangling r:id references.
-            for elem in slide_root.iter():
-                for attr_name, attr_value in elem.attrib.items():
-                    if attr_name.startswith("{http://schemas.openxmlformats.org/officeDocument/2006/relationships}") and attr_value:
-                        if attr_value not in slide_rel_map:
-                            issues.append(
-                                f"dangling relationship {attr_value} in {slide_part}"
-                            )
-
-            layout_target = None
-            for item in slide_rel_map.values():
-                if item["Type"].endswith("/slideLayout"):
-                    layout_target = item["Target"]
-                    break
-            if not layout_target:
-                issues.append(f"missing slideLayout relation in {slide_part}")
-                continue
+            # Registered masters.
+            registered_masters: set[str] = set()
+            master_lst = pres_root.find(f"{{{_NS_P}}}sldMasterIdLst")
+            if master_lst is not None:
+                for master_id in master_lst.findall(f"{{{_NS_P}}}sldMasterId"):
+                    rid = master_id.attrib.get(_RID_ATTR)
+                    if not rid:
+                        continue
+                    rel = pres_rel_map.get(rid)
+                    if rel:
+                        registered_masters.add(_norm(pres, rel["Target"]))
+
+            used_masters: set[str] = set()
+            slide_lst = pres_root.find(f"{{{_NS_P}}}sldIdLst")
+            if slide_lst is None:
+                return VerifyReport(issues)
+
+            # (rId, slide part) in deck order; the part is None when the rId does not resolve.
+            slides: list[tuple[str | None, str | None]] = []
+            for slide_id in slide_lst.findall(f"{{{_NS_P}}}sldId"):
+                slide_rid = slide_id.attrib.get(_RID_ATTR)
+                rel = pres_rel_map.get(slide_rid or "")
+                slides.append((slide_rid, _norm(pres, rel["Target"]) if rel else None))
+
+            slide_parts = [slide_part for _, slide_part in slides if slide_part is not None]
+            if executor is not None and slide_parts:
+                # A few shards per worker keeps the pool busy when slide sizes are uneven.
+                shard_size = -(-len(slide_parts) // (shard_workers * 4))
+                shards = [slide_parts[i : i + shard_size] for i in range(0, len(slide_parts), shard_size)]
+                shard_results = list(
+                    executor.map(
+                        _check_slide_shard,
+                        [target] * len(shards),
+                        shards,
+                        [streaming] * len(shards),
+                        [cache] * len(shards),
+                    )
+                )
+                if cache is not None:
+                    cache.note_written(sum(written for _, written in shard_results))
+                checks = (check for shard, _ in shard_results for check in shard)
+            else:
+                checks = (_check_slide(archive, slide_part, rel_maps, streaming, cache) for slide_part in slide_parts)
+
+            for slide_rid, slide_part in slides:
+                if slide_part is None:
+                    issues.append(f"slide rId missing in presentation rels: {slide_rid}")
+                    continue
+                slide_issues, layout_part = next(checks)
+                issues.extend(slide_issues)
+                if layout_part is None:
+                    continue
+                master_part = layout_master(layout_part)
+                if master_part is None:
+                    issues.append(f"missing slideMaster relation in {layout_part}")
+                    continue
+                used_masters.add(master_part)
+
+            missing_master = sorted(used_masters - registered_masters)
+            for master_part in missing_master:
+                issues.append(f"used but unregistered master: {master_part}")
+    except BrokenProcessPool:
+        if shared:
+            # The next call starts a fresh pool.
+            _drop_shared_executor(workers, executor)
+        raise
+    finally:
+        if spilled is not None:
+            os.unlink(spilled)
+
+    return VerifyReport(issues=issues)
+
+
+def _member_name(part) -> str:
+    return part.partname.membername
 
-            layout_part = _norm(slide_part, layout_target)
-            layout_rels = _rels_path(layout_part)
-            layout_rel_map = rel_map(archive, layout_rels)
-            master_target = None
-            for item in layout_rel_map.values():
-                if item["Type"].endswith("/slideMaster"):
-                    master_target = item["Target"]
-                    break
-            if not master_target:
-                issues.append(f"missing slideMaster relation in {layout_part}")
+
+def _first_related(part, reltype: str):
+    for rel in part.rels.values():
+        if rel.reltype == reltype:
+            return rel
+    return None
+
+
+def _dangling_rids(slide_part) -> tuple[str, ...]:
+    rels = slide_part.rels
+    return tuple(
+        attr_value
+        for elem in slide_part._element.iter(etree.Element)
+        for attr_name, attr_value in elem.attrib.items()
+        if attr_name.startswith(_R_NS_PREFIX) and attr_value and attr_value not in rels
+    )
+
+
+_BASELINE_LIMIT = 64
+_SLIDE_BASELINES: OrderedDict[Hashable, dict[str, tuple[str, ...]]] = OrderedDict()
+_SLIDE_BASELINES_LOCK = threading.Lock()
+
+
+def slide_baseline(template_key: Hashable) -> dict[str, tuple[str, ...]]:
+    """Per-template store of slide scan results, keyed by the slide's partname in the template.
+
+    Only results for slides that no op touched are recorded, so an entry always describes
+    the template's own slide. The most recently used templates are kept.
+    """
+    with _SLIDE_BASELINES_LOCK:
+        baseline = _SLIDE_BASELINES.get(template_key)
+        if baseline is None:
+            baseline = _SLIDE_BASELINES[template_key] = {}
+            while len(_SLIDE_BASELINES) > _BASELINE_LIMIT:
+                _SLIDE_BASELINES.popitem(last=False)
+        else:
+            _SLIDE_BASELINES.move_to_end(template_key)
+        return baseline
+
+
+def verify_presentation(
+    presentation: Presentation,
+    clean_parts: Mapping[Any, str] | None = None,
+    baseline: dict[str, tuple[str, ...]] | None = None,
+) -> VerifyReport:
+    """Run the `verify_pptx` checks against an in-memory presentation.
+
+    The already-parsed part trees and relationships are inspected directly, so a deck
+    can be verified before it is saved without reopening the output. Issue messages use
+    the member names the parts will have in the saved package.
+
+    For incremental verification pass `clean_parts` (untouched part -> template partname)
+    and a `baseline` from `slide_baseline`: the dangling `r:id` scan of an untouched
+    slide is then taken from, or recorded into, the baseline. Relationship, layout and
+    master checks are cheap and always run on the current package.
+    """
+    issues: list[str] = []
+
+    def dangling_of(slide_part) -> tuple[str, ...]:
+        source_name = clean_parts.get(slide_part) if clean_parts is not None and baseline is not None else None
+        if source_name is None:
+            return _dangling_rids(slide_part)
+        cached = baseline.get(source_name)
+        if cached is None:
+            cached = baseline[source_name] = _dangling_rids(slide_part)
+        return cached
+
+    pres_part = presentation.part
+    pres = _member_name(pres_part)
+    pres_element = pres_part._element
+    if not pres_part.rels:
+        issues.append(f"missing rels part: {_rels_path(pres)}")
+
+    registered_masters: set[str] = set()
+    master_lst = pres_element.find(qn("p:sldMasterIdLst"))
+    if master_lst is not None:
+        for master_id in master_lst.findall(qn("p:sldMasterId")):
+            rid = master_id.get(qn("r:id"))
+            if not rid or rid not in pres_part.rels:
                 continue
-            used_masters.add(_norm(layout_part, master_target))
+            rel = pres_part.rels[rid]
+            if rel.is_external:
+                registered_masters.add(_norm(pres, rel.target_ref))
+            else:
+                registered_masters.add(_member_name(rel.target_part))
+
+    used_masters: set[str] = set()
+    slide_lst = pres_element.find(qn("p:sldIdLst"))
+    if slide_lst is None:
+        return VerifyReport(issues)
+
+    for slide_id in slide_lst.findall(qn("p:sldId")):
+        slide_rid = slide_id.get(qn("r:id"))
+        if not slide_rid or slide_rid not in pres_part.rels:
+            issues.append(f"slide rId missing in presentation rels: {slide_rid}")
+            continue
+        rel = pres_part.rels[slide_rid]
+        if rel.is_external:
+            issues.append(f"missing slide part: {_norm(pres, rel.target_ref)}")
+            continue
+        slide_part = rel.target_part
+        slide_name = _member_name(slide_part)
+        if not slide_part.rels:
+            issues.append(f"missing rels part: {_rels_path(slide_name)}")
+
+        # Dangling r:id references.
+        for rid in dangling_of(slide_part):
+            issues.append(f"dangling relationship {rid} in {slide_name}")
+
+        layout_rel = _first_related(slide_part, RT.SLIDE_LAYOUT)
+        if layout_rel is None:
+            issues.append(f"missing slideLayout relation in {slide_name}")
+            continue
+        if layout_rel.is_external:
+            # Mirrors verify_pptx, which finds no rels part for a target outside the package.
+            layout_name = _norm(slide_name, layout_rel.target_ref)
+            issues.append(f"missing rels part: {_rels_path(layout_name)}")
+            issues.append(f"missing slideMaster relation in {layout_name}")
+            continue
+        layout_part = layout_rel.target_part
+        layout_name = _member_name(layout_part)
+        if not layout_part.rels:
+            issues.append(f"missing rels part: {_rels_path(layout_name)}")
+        master_rel = _first_related(layout_part, RT.SLIDE_MASTER)
+        if master_rel is None:
+            issues.append(f"missing slideMaster relation in {layout_name}")
+            continue
+        if master_rel.is_external:
+            used_masters.add(_norm(layout_name, master_rel.target_ref))
+        else:
+            used_masters.add(_member_name(master_rel.target_part))
 
-        missing_master = sorted(used_masters - registered_masters)
-        for master_part in missing_master:
-            issues.append(f"used but unregistered master: {master_part}")
+    missing_master = sorted(used_masters - registered_masters)
+    for master_part in missing_master:
+        issues.append(f"used but unregistered master: {master_part}")
 
     return VerifyReport(issues=issues)
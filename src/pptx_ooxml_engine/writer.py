@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+import struct
+import sys
+import time
+import zlib
+from dataclasses import dataclass
+from io import BytesIO
+from pathlib import Path
+from typing import IO, Any, Iterable, Mapping
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile, ZipInfo
+
+from pptx import Presentation
+from pptx.opc.oxml import serialize_part_xml
+from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI
+from pptx.opc.serialized import _ContentTypesItem
+
+_LOCAL_HEADER_SIZE = 30
+_LOCAL_HEADER_SIGNATURE = b"PK\x03\x04"
+_CENTRAL_HEADER_SIGNATURE = b"PK\x01\x02"
+_END_SIGNATURE = b"PK\x05\x06"
+_ZIP64_END_SIGNATURE = b"PK\x06\x06"
+_ZIP64_LOCATOR_SIGNATURE = b"PK\x06\x07"
+_RAW_COPY_CHUNK = 1024 * 1024
+_FLAG_ENCRYPTED = 0x01
+_FLAG_DATA_DESCRIPTOR = 0x08
+_FLAG_UTF8 = 0x800
+# Same thresholds as `zipfile`: beyond them sizes, offsets and counts go in zip64 records.
+_ZIP64_LIMIT = (1 << 31) - 1
+_ZIP_FILECOUNT_LIMIT = (1 << 16) - 1
+_VERSION = 20
+_ZIP64_VERSION = 45
+_CREATE_SYSTEM = 0 if sys.platform == "win32" else 3
+
+
+@dataclass
+class SaveStats:
+    raw_copied: int
+    compressed: int
+
+
+class _SourceArchive:
+    """Template zip whose members can be copied into an output zip still compressed."""
+
+    def __init__(self, source: Path | bytes):
+        self._fp = BytesIO(source) if isinstance(source, bytes) else open(source, "rb")
+        try:
+            with ZipFile(self._fp) as archive:
+                self._infos = {info.filename: info for info in archive.infolist()}
+        except Exception:
+            self._fp.close()
+            raise
+
+    def close(self) -> None:
+        self._fp.close()
+
+    def member(self, name: str) -> ZipInfo | None:
+        info = self._infos.get(name)
+        if info is None or info.flag_bits & _FLAG_ENCRYPTED:
+            return None
+        if info.compress_type not in (ZIP_STORED, ZIP_DEFLATED):
+            return None
+        return info
+
+    def matching(self, name: str, blob: bytes) -> ZipInfo | None:
+        info = self.member(name)
+        if info is None or info.file_size != len(blob):
+            return None
+        if zlib.crc32(blob) != info.CRC:
+            return None
+        return info
+
+    def copy_raw(self, info: ZipInfo, target: _ZipWriter) -> None:
+        self._fp.seek(info.header_offset)
+        header = self._fp.read(_LOCAL_HEADER_SIZE)
+        if header[:4] != _LOCAL_HEADER_SIGNATURE:
+            raise ValueError(f"bad local file header for template member: {info.filename}")
+        name_len, extra_len = struct.unpack("<HH", header[26:30])
+        self._fp.seek(info.header_offset + _LOCAL_HEADER_SIZE + name_len + extra_len)
+        target.add(
+            info.filename,
+            info.date_time,
+            info.compress_type,
+            info.CRC,
+            info.compress_size,
+            info.file_size,
+            # Sizes and CRC go in the local header, so no trailing data descriptor is written.
+            info.flag_bits & ~(_FLAG_DATA_DESCRIPTOR | _FLAG_UTF8),
+            info.external_attr,
+            self._chunks(info),
+        )
+
+    def _chunks(self, info: ZipInfo) -> Iterable[bytes]:
+        remaining = info.compress_size
+        while remaining:
+            chunk = self._fp.read(min(remaining, _RAW_COPY_CHUNK))
+            if not chunk:
+                raise ValueError(f"truncated template member: {info.filename}")
+            remaining -= len(chunk)
+            yield chunk
+
+
+def _dos_time(date_time: tuple[int, ...]) -> tuple[int, int]:
+    # Clamped to the DOS range, as `ZipFile(strict_timestamps=False)` does.
+    if date_time[0] < 1980:
+        date_time = (1980, 1, 1, 0, 0, 0)
+    elif date_time[0] > 2107:
+        date_time = (2107, 12, 31, 23, 59, 59)
+    year, month, day, hour, minute, second = date_time
+    return hour << 11 | minute << 5 | second // 2, (year - 1980) << 9 | month << 5 | day
+
+
+class _ZipWriter:
+    """Write-once zip archive whose members are added with their CRC and sizes known.
+
+    Local headers are final when written, so members need no data descriptor and the
+    target is never seeked; a member can be passed through still compressed. The central
+    directory is written by `close`.
+    """
+
+    def __init__(self, fp: IO[bytes]):
+        self._fp = fp
+        self._offset = 0
+        self._central: list[bytes] = []
+        self._date_time = time.localtime(time.time())[:6]
+
+    def _write(self, data: bytes) -> None:
+        self._fp.write(data)
+        self._offset += len(data)
+
+    def writestr(self, name: str, blob: bytes) -> None:
+        compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+        data = compressor.compress(blob) + compressor.flush()
+        self.add(name, self._date_time, ZIP_DEFLATED, zlib.crc32(blob), len(data), len(blob), 0, 0o600 << 16, (data,))
+
+    def add(
+        self,
+        name: str,
+        date_time: tuple[int, ...],
+        compress_type: int,
+        crc: int,
+        compress_size: int,
+        file_size: int,
+        flag_bits: int,
+        external_attr: int,
+        data: Iterable[bytes],
+    ) -> None:
+        try:
+            filename = name.encode("ascii")
+        except UnicodeEncodeError:
+            filename = name.encode("utf-8")
+            flag_bits |= _FLAG_UTF8
+        dos_time, dos_date = _dos_time(date_time)
+        header_offset = self._offset
+
+        zip64 = file_size > _ZIP64_LIMIT or compress_size > _ZIP64_LIMIT
+        local_extra = struct.pack("<HHQQ", 1, 16, file_size, compress_size) if zip64 else b""
+        version = _ZIP64_VERSION if zip64 or header_offset > _ZIP64_LIMIT else _VERSION
+        self._write(
+            struct.pack(
+                "<4s2B4HL2L2H",
+                _LOCAL_HEADER_SIGNATURE,
+                version,
+                0,
+                flag_bits,
+                compress_type,
+                dos_time,
+                dos_date,
+                crc,
+                0xFFFFFFFF if zip64 else compress_size,
+                0xFFFFFFFF if zip64 else file_size,
+                len(filename),
+                len(local_extra),
+            )
+            + filename
+            + local_extra
+        )
+        written = 0
+        for chunk in data:
+            self._write(chunk)
+            written += len(chunk)
+        if written != compress_size:
+            raise ValueError(f"zip member {name} wrote {written} bytes, expected {compress_size}")
+
+        central_fields = [value for value in (file_size, compress_size, header_offset) if value > _ZIP64_LIMIT]
+        central_extra = b""
+        if central_fields:
+            central_extra = struct.pack(f"<HH{len(central_fields)}Q", 1, 8 * len(central_fields), *central_fields)
+        self._central.append(
+            struct.pack(
+                "<4s4B4HL2L5H2L",
+                _CENTRAL_HEADER_SIGNATURE,
+                version,
+                _CREATE_SYSTEM,
+                version,
+                0,
+                flag_bits,
+                compress_type,
+                dos_time,
+                dos_date,
+                crc,
+                compress_size if compress_size <= _ZIP64_LIMIT else 0xFFFFFFFF,
+                file_size if file_size <= _ZIP64_LIMIT else 0xFFFFFFFF,
+                len(filename),
+                len(central_extra),
+                0,
+                0,
+                0,
+                external_attr,
+                header_offset if header_offset <= _ZIP64_LIMIT else 0xFFFFFFFF,
+            )
+            + filename
+            + central_extra
+        )
+
+    def close(self) -> None:
+        start = self._offset
+        for record in self._central:
+            self._write(record)
+        count, size = len(self._central), self._offset - start
+        if count > _ZIP_FILECOUNT_LIMIT or start > _ZIP64_LIMIT or size > _ZIP64_LIMIT:
+            end64 = self._offset
+            self._write(
+                struct.pack(
+                    "<4sQ2H2L4Q", _ZIP64_END_SIGNATURE, 44, _ZIP64_VERSION, _ZIP64_VERSION, 0, 0, count, count, size, start
+                )
+            )
+            self._write(struct.pack("<4sLQL", _ZIP64_LOCATOR_SIGNATURE, 0, end64, 1))
+            count, size, start = min(count, 0xFFFF), min(size, 0xFFFFFFFF), min(start, 0xFFFFFFFF)
+        self._write(struct.pack("<4s4H2LH", _END_SIGNATURE, 0, 0, count, count, size, start, 0))
+
+
+def save_presentation(
+    presentation: Presentation,
+    target: str | Path | IO[bytes],
+    source: str | Path | bytes | None = None,
+    clean_parts: Mapping[Any, str] | None = None,
+) -> SaveStats:
+    """Write `presentation` to `target` (a path or a writable binary stream) part by part.
+
+    Members are written in the same order as `Presentation.save`. When `source` is the
+    template the presentation was loaded from (its path or its bytes), a member whose
+    bytes are unchanged is copied from the template zip as-is instead of being compressed
+    again. Parts listed in `clean_parts` (part -> partname in the template) are known to
+    be unmodified and are copied without being serialized at all, as long as they kept
+    their partname.
+    """
+    package = presentation.part.package
+    parts = tuple(package.iter_parts())
+    if isinstance(source, str):
+        source = Path(source)
+    archive = _SourceArchive(source) if source is not None else None
+    stats = SaveStats(raw_copied=0, compressed=0)
+    fp = open(target, "wb") if isinstance(target, (str, Path)) else target
+    try:
+        zf = _ZipWriter(fp)
+
+        def write(name: str, blob: bytes) -> None:
+            info = archive.matching(name, blob) if archive is not None else None
+            if info is not None:
+                archive.copy_raw(info, zf)
+                stats.raw_copied += 1
+            else:
+                zf.writestr(name, blob)
+                stats.compressed += 1
+
+        write(CONTENT_TYPES_URI.membername, serialize_part_xml(_ContentTypesItem.xml_for(parts)))
+        write(PACKAGE_URI.rels_uri.membername, package._rels.xml)
+        for part in parts:
+            name = part.partname.membername
+            clean_info = None
+            if archive is not None and clean_parts and clean_parts.get(part) == part.partname:
+                clean_info = archive.member(name)
+            if clean_info is not None:
+                archive.copy_raw(clean_info, zf)
+                stats.raw_copied += 1
+            else:
+                write(name, part.blob)
+            if part._rels:
+                write(part.partname.rels_uri.membername, part.rels.xml)
+        zf.close()
+    finally:
+        if archive is not None:
+            archive.close()
+        if fp is not target:
+            fp.close()
+    return stats
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from pathlib import Path
+from typing import Literal
+
+import pytest
+from pptx import Presentation
+from pydantic import BaseModel
+
+
+def _build_titled_pptx(path: Path, title: str) -> None:
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[0])
+    if slide.shapes.title is not None:
+        slide.shapes.title.text = title
+    prs.save(str(path))
+
+
+class _SlowOp(BaseModel):
+    op: Literal["slow_test_op"]
+
+
+def test_agenerate_pptx_bounds_concurrency_without_blocking_loop(tmp_path: Path, monkeypatch) -> None:
+    import pptx_ooxml_engine.engine as engine
+    from pptx_ooxml_engine.aio import AsyncRenderer
+    from pptx_ooxml_engine.models import RewriteTextOp
+
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def _slow(op, ctx) -> None:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+
+    monkeypatch.setattr(engine, "_OP_HANDLERS", dict(engine._OP_HANDLERS))
+    engine.register_op_handler("slow_test_op", _slow)
+    template = tmp_path / "template.pptx"
+    _build_titled_pptx(template, "Old Title")
+    renderer = AsyncRenderer(max_concurrency=2)
+
+    async def _main() -> tuple[list, int]:
+        ticks = 0
+
+        async def _ticker() -> None:
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.005)
+                ticks += 1
+
+        ticker = asyncio.create_task(_ticker())
+        results = await asyncio.gather(
+            *(
+                renderer.generate_pptx(
+                    template,
+                    [
+                        _SlowOp(op="slow_test_op"),
+                        RewriteTextOp(op="rewrite_text", slide_index=0, find="Old", replace=str(idx)),
+                    ],
+                    tmp_path / f"out_{idx}.pptx",
+                )
+                for idx in range(5)
+            )
+        )
+        ticker.cancel()
+        return results, ticks
+
+    try:
+        results, ticks = asyncio.run(_main())
+    finally:
+        renderer.close()
+
+    assert peak == 2
+    assert ticks > 10
+    assert [Presentation(str(r.output_path)).slides[0].shapes.title.text for r in results] == [
+        f"{idx} Title" for idx in range(5)
+    ]
+
+
+def test_aapply_ops_cancellation_stops_job_before_next_op(tmp_path: Path, monkeypatch) -> None:
+    import pptx_ooxml_engine.engine as engine
+    from pptx_ooxml_engine.aio import AsyncRenderer, aapply_ops
+
+    applied: list[int] = []
+
+    def _slow(op, ctx) -> None:
+        applied.append(1)
+        time.sleep(0.02)
+
+    monkeypatch.setattr(engine, "_OP_HANDLERS", dict(engine._OP_HANDLERS))
+    engine.register_op_handler("slow_test_op", _slow)
+    template = tmp_path / "template.pptx"
+    _build_titled_pptx(template, "Old Title")
+    output = tmp_path / "cancelled.pptx"
+    renderer = AsyncRenderer(max_concurrency=1)
+
+    async def _main() -> None:
+        task = asyncio.create_task(
+            aapply_ops(template, [_SlowOp(op="slow_test_op")] * 200, output, renderer=renderer)
+        )
+        await asyncio.sleep(0.2)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    try:
+        asyncio.run(_main())
+        stopped_at = len(applied)
+        time.sleep(0.1)
+    finally:
+        renderer.close()
+
+    assert 0 < stopped_at < 200
+    assert len(applied) == stopped_at
+    assert not output.exists()
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import os
+import shutil
+from pathlib import Path
+
+from pptx import Presentation
+
+
+def _build_titled_pptx(path: Path, title: str) -> None:
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[0])
+    if slide.shapes.title is not None:
+        slide.shapes.title.text = title
+    prs.save(str(path))
+
+
+def test_template_cache_hands_out_independent_clones(tmp_path: Path) -> None:
+    from pptx_ooxml_engine.cache import TemplateCache
+
+    template = tmp_path / "template.pptx"
+    _build_titled_pptx(template, "Pristine")
+    cache = TemplateCache()
+
+    first = cache.open(template)
+    first.slides[0].shapes.title.text = "Mutated"
+    second = cache.open(template)
+
+    assert second.slides[0].shapes.title.text == "Pristine"
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+
+
+def test_template_cache_keys_on_mtime_and_shares_identical_content(tmp_path: Path) -> None:
+    from pptx_ooxml_engine.cache import TemplateCache
+
+    template = tmp_path / "template.pptx"
+    twin = tmp_path / "twin.pptx"
+    _build_titled_pptx(template, "Version 1")
+    shutil.copyfile(template, twin)
+    cache = TemplateCache()
+
+    cache.open(template)
+    cache.open(twin)
+    assert cache.stats().misses == 1
+    assert cache.stats().hits == 1
+
+    _build_titled_pptx(template, "Version 2")
+    stat = template.stat()
+    os.utime(template, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    reopened = cache.open(template)
+
+    assert reopened.slides[0].shapes.title.text == "Version 2"
+    assert cache.stats().misses == 2
+
+
+def test_template_cache_evicts_least_recently_used_by_byte_budget(tmp_path: Path) -> None:
+    from pptx_ooxml_engine.cache import TemplateCache, _package_cost
+
+    first = tmp_path / "first.pptx"
+    second = tmp_path / "second.pptx"
+    _build_titled_pptx(first, "First")
+    _build_titled_pptx(second, "Second")
+    budget = max(_package_cost(first.read_bytes()), _package_cost(second.read_bytes()))
+    cache = TemplateCache(max_bytes=budget)
+
+    cache.open(first)
+    cache.open(second)
+    stats = cache.stats()
+
+    assert stats.entries == 1
+    assert stats.evictions == 1
+    assert stats.current_bytes <= budget
+
+
+def test_template_cache_drops_only_the_stale_key_and_keeps_aliases(tmp_path: Path) -> None:
+    from pptx_ooxml_engine.cache import TemplateCache
+
+    template = tmp_path / "template.pptx"
+    twin = tmp_path / "twin.pptx"
+    _build_titled_pptx(template, "Same")
+    twin.write_bytes(template.read_bytes())
+    cache = TemplateCache()
+    cache.open(template)
+    cache.open(twin)
+    owned = cache.stats().current_bytes
+
+    _build_titled_pptx(template, "Changed")
+    os.utime(template, ns=(0, 1))
+    cache.open(template)
+    cache.open(twin)
+    stats = cache.stats()
+
+    assert (stats.misses, stats.hits, stats.evictions, stats.entries) == (2, 2, 0, 2)
+    assert stats.current_bytes > owned
+    cache.clear()
+    assert cache.stats() == TemplateCache().stats()
+
+
+def test_apply_ops_uses_template_cache(tmp_path: Path) -> None:
+    from pptx_ooxml_engine.cache import TemplateCache
+    from pptx_ooxml_engine.engine import apply_ops
+
+    template = tmp_path / "template.pptx"
+    _build_titled_pptx(template, "Old Title")
+    cache = TemplateCache()
+    ops = [{"op": "rewrite_text", "slide_index": 0, "find": "Old", "replace": "New"}]
+
+    for idx in range(3):
+        apply_ops(template, ops, tmp_path / f"out_{idx}.pptx", verify=True, template_cache=cache)
+
+    assert cache.stats().misses == 1
+    assert cache.stats().hits == 2
+    prs = Presentation(str(tmp_path / "out_2.pptx"))
+    assert prs.slides[0].shapes.title.text == "New Title"
+
+
+def test_verify_cache_is_bounded_and_evicts_least_recently_used(tmp_path: Path) -> None:
+    from pptx_ooxml_engine.cache import VerifyCache
+
+    cache = VerifyCache(tmp_path / "verify", max_entries=10)
+    keys = [cache.key(f"part {idx}".encode()) for idx in range(11)]
+    for idx, key in enumerate(keys):
+        assert cache.put(key, {"idx": idx})
+        stat = cache._path(key).stat()
+        os.utime(cache._path(key), ns=(stat.st_atime_ns, idx * 1_000_000_000))
+
+    assert len(cache) == 9
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[10]) == {"idx": 10}
+    assert not cache.put(keys[10], {"idx": 10})
+
+
+def _write_png(path: Path, size: tuple[int, int], color: str = "red") -> None:
+    from PIL import Image
+
+    Image.new("RGB", size, color).save(path, format="PNG")
+
+
+def test_image_info_cache_keys_on_mtime_and_evicts_least_recently_used(tmp_path: Path) -> None:
+    import hashlib
+
+    from pptx_ooxml_engine.cache import ImageInfoCache
+
+    wide, tall, square = tmp_path / "wide.png", tmp_path / "tall.png", tmp_path / "square.png"
+    _write_png(wide, (40, 20))
+    _write_png(tall, (10, 30))
+    _write_png(square, (8, 8))
+    cache = ImageInfoCache(max_entries=2)
+
+    info = cache.get(wide)
+    assert (info.size, info.ext, info.content_type) == ((40, 20), "png", "image/png")
+    assert (info.sha1, info.byte_size) == (hashlib.sha1(wide.read_bytes()).hexdigest(), wide.stat().st_size)
+    assert cache.get(wide) is info
+    cache.get(tall)
+    cache.get(wide)
+    cache.get(square)  # evicts tall, the least recently used
+    assert (cache.stats().hits, cache.stats().misses, cache.stats().evictions) == (2, 3, 1)
+
+    _write_png(wide, (20, 40))
+    stat = wide.stat()
+    os.utime(wide, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert cache.get(wide).size == (20, 40)
+    assert len(cache) == 2
+
+    cache.clear()
+    assert (len(cache), cache.stats().hits, cache.stats().misses, cache.stats().evictions) == (0, 0, 0, 0)
+
+
+def test_apply_ops_fits_pictures_from_cached_image_info(tmp_path: Path, monkeypatch) -> None:
+    from pptx.parts.image import Image
+    from pptx.util import Inches
+
+    from pptx_ooxml_engine.cache import get_image_info_cache
+    from pptx_ooxml_engine.engine import apply_ops
+
+    template = tmp_path / "template.pptx"
+    photo = tmp_path / "photo.png"
+    _build_titled_pptx(template, "Catalog")
+    _write_png(photo, (40, 20))
+    decoded: list[str] = []
+    from_file = Image.from_file
+    monkeypatch.setattr(Image, "from_file", lambda path: decoded.append(path) or from_file(path))
+    ops = [
+        {
+            "op": "add_image",
+            "slide_index": 0,
+            "image_path": str(photo),
+            "x_inches": 1,
+            "y_inches": 1,
+            "width_inches": 2,
+            "height_inches": 2,
+            "fit": "contain",
+            "name": f"photo_{idx}",
+        }
+        for idx in range(3)
+    ]
+
+    hits = get_image_info_cache().stats().hits
+    for job in range(2):
+        apply_ops(template, ops, tmp_path / f"output_{job}.pptx")
+
+    # Decoded once; the second job only reads the bytes to embed them.
+    assert len(decoded) == 1
+    assert get_image_info_cache().stats().hits == hits + 1
+    shapes = Presentation(str(tmp_path / "output_1.pptx")).slides[0].shapes
+    pic = next(shape for shape in shapes if shape.name == "photo_2")
+    assert (pic.width, pic.height, pic.top) == (Inches(2), Inches(1), Inches(1.5))
@@ -5,6 +5,7 @@ import subprocess
 import sys
 from pathlib import Path
 
+import pytest
 from pptx import Presentation
 
 
@@ -116,3 +117,134 @@ def test_cli_can_use_template_from_ops_file(tmp_path: Path) -> None:
 
     assert completed.returncode == 0, completed.stderr
     assert output_pptx.exists()
+
+
+def test_cli_streams_jsonl_ops_file(tmp_path: Path) -> None:
+    project_root = Path(__file__).resolve().parents[1]
+    template_pptx = tmp_path / "template.pptx"
+    output_pptx = tmp_path / "output_from_jsonl.pptx"
+    ops_file = tmp_path / "ops.jsonl"
+
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[0])
+    if slide.shapes.title is not None:
+        slide.shapes.title.text = "Old Title"
+    prs.save(str(template_pptx))
+
+    lines = [
+        {"template_pptx": str(template_pptx)},
+        {"op": "rewrite_text", "slide_index": 0, "find": "Old", "replace": "New"},
+        {"op": "set_notes", "slide_index": 0, "text": "streamed"},
+    ]
+    ops_file.write_text("\n".join(json.dumps(line) for line in lines) + "\n", encoding="utf-8")
+
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "pptx_ooxml_engine.cli",
+            "--ops-file",
+            str(ops_file),
+            "--output",
+            str(output_pptx),
+            "--verify",
+        ],
+        cwd=str(project_root),
+        env={"PYTHONPATH": str(project_root / "src")},
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert completed.returncode == 0, completed.stderr
+    out = Presentation(str(output_pptx))
+    assert out.slides[0].shapes.title.text == "New Title"
+    assert out.slides[0].notes_slide.notes_text_frame.text == "streamed"
+
+
+def test_cli_batch_renders_each_ops_file(tmp_path: Path) -> None:
+    project_root = Path(__file__).resolve().parents[1]
+    template_pptx = tmp_path / "template.pptx"
+    output_dir = tmp_path / "decks"
+
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[0])
+    if slide.shapes.title is not None:
+        slide.shapes.title.text = "Old Title"
+    prs.save(str(template_pptx))
+
+    ops_files = []
+    for name in ("alpha", "beta"):
+        ops_file = tmp_path / f"{name}.json"
+        ops_file.write_text(
+            json.dumps(
+                {"operations": [{"op": "rewrite_text", "slide_index": 0, "find": "Old", "replace": name}]}
+            ),
+            encoding="utf-8",
+        )
+        ops_files.append(str(ops_file))
+
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "pptx_ooxml_engine.cli",
+            "batch",
+            "--template",
+            str(template_pptx),
+            "--output-dir",
+            str(output_dir),
+            "--verify",
+            *ops_files,
+        ],
+        cwd=str(project_root),
+        env={"PYTHONPATH": str(project_root / "src")},
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert completed.returncode == 0, completed.stderr
+    assert completed.stdout.split() == [str(output_dir / "alpha.pptx"), str(output_dir / "beta.pptx")]
+    assert Presentation(str(output_dir / "beta.pptx")).slides[0].shapes.title.text == "beta Title"
+
+
+def test_cli_batch_rejects_ops_files_with_the_same_name(tmp_path: Path, capsys) -> None:
+    from pptx_ooxml_engine.cli import main
+
+    for folder in ("a", "b"):
+        (tmp_path / folder).mkdir()
+        (tmp_path / folder / "deck.json").write_text('{"operations": []}', encoding="utf-8")
+
+    with pytest.raises(SystemExit) as exc:
+        main(["batch", "--template", "t.pptx", "--output-dir", str(tmp_path / "out"),
+              str(tmp_path / "a" / "deck.json"), str(tmp_path / "b" / "deck.json")])
+
+    assert exc.value.code == 2
+    assert "deck" in capsys.readouterr().err
+    assert not (tmp_path / "out").exists()
+
+
+def test_cli_trivial_commands_do_not_import_heavy_dependencies() -> None:
+    project_root = Path(__file__).resolve().parents[1]
+    script = (
+        "import sys\n"
+        "from pptx_ooxml_engine.cli import main\n"
+        "from pptx_ooxml_engine import load_ops_schema\n"
+        "main(['--version'])\n"
+        "main([])\n"
+        "assert load_ops_schema()\n"
+        "heavy = sorted({m.split('.')[0] for m in sys.modules} & {'pptx', 'lxml', 'pydantic'})\n"
+        "print('heavy=' + ','.join(heavy))\n"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=str(project_root),
+        env={"PYTHONPATH": str(project_root / "src")},
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert completed.returncode == 0, completed.stderr
+    assert completed.stdout.splitlines()[-1] == "heavy="
@@ -7,7 +7,7 @@ from pathlib import Path
 import pytest
 from pptx import Presentation
 from pptx.dml.color import RGBColor
-from pptx.enum.shapes import MSO_SHAPE_TYPE
+from pptx.enum.shapes import MSO_SHAPE_TYPE, PP_PLACEHOLDER
 from pptx.util import Inches
 
 
@@ -722,3 +722,499 @@ def test_apply_ops_v1_3_chart_table_and_text_link_ops(tmp_path: Path) -> None:
         if run.hyperlink.address
     ]
     assert "https://example.com/docs" in linked
+
+
+def test_render_batch_streams_results_from_one_template(tmp_path: Path) -> None:
+    from pptx_ooxml_engine.engine import render_batch
+
+    template = tmp_path / "template.pptx"
+    _build_target_pptx(template)
+    plans = [
+        [{"op": "rewrite_text", "slide_index": 0, "find": "Original", "replace": f"Deck {idx}"}]
+        for idx in range(3)
+    ]
+
+    results = render_batch(template, plans, tmp_path / "out", verify=True)
+    first = next(results)
+    assert first.output_path == (tmp_path / "out" / "deck_00000.pptx").resolve()
+    remaining = list(results)
+
+    assert len(remaining) == 2
+    for idx, result in enumerate([first, *remaining]):
+        assert result.operations_applied == 1
+        assert result.verify_issues == []
+        prs = Presentation(str(result.output_path))
+        assert any(f"Deck {idx} Title" == t for t in _slide_texts(prs.slides[0]))
+
+
+def test_render_batch_uses_given_output_names(tmp_path: Path) -> None:
+    from pptx_ooxml_engine.engine import render_batch
+
+    template = tmp_path / "template.pptx"
+    _build_target_pptx(template)
+    plans = [
+        {"operations": [{"op": "create_slide_on_layout", "layout_index": 0, "title": "Appended"}]},
+        {"operations": [{"op": "delete_slide", "slide_index": 0}]},
+    ]
+
+    results = list(render_batch(template, plans, tmp_path / "named", names=["grow", "shrink"]))
+
+    assert [r.output_path.name for r in results] == ["grow.pptx", "shrink.pptx"]
+    assert len(Presentation(str(results[0].output_path)).slides) == 2
+    assert len(Presentation(str(results[1].output_path)).slides) == 0
+
+    with pytest.raises(ValueError):
+        list(render_batch(template, plans, tmp_path / "short", names=["grow"]))
+
+
+def test_apply_ops_dispatches_registered_custom_op(tmp_path: Path, monkeypatch) -> None:
+    from typing import Literal
+
+    from pydantic import BaseModel
+
+    import pptx_ooxml_engine.engine as engine
+
+    class StampFooterOp(BaseModel):
+        op: Literal["stamp_footer"]
+        slide_index: int
+        text: str
+
+    def _apply_stamp_footer(op: StampFooterOp, ctx) -> None:
+        slide = ctx.presentation.slides[op.slide_index]
+        box = slide.shapes.add_textbox(Inches(0.5), Inches(6.8), Inches(4), Inches(0.4))
+        box.name = "footer"
+        box.text_frame.text = op.text
+
+    monkeypatch.setattr(engine, "_OP_HANDLERS", dict(engine._OP_HANDLERS))
+    engine.register_op_handler("stamp_footer", _apply_stamp_footer)
+    with pytest.raises(ValueError, match="already registered"):
+        engine.register_op_handler("stamp_footer", _apply_stamp_footer)
+
+    template = tmp_path / "template.pptx"
+    output = tmp_path / "output_custom_op.pptx"
+    _build_target_pptx(template)
+    result = engine.apply_ops(
+        template,
+        [StampFooterOp(op="stamp_footer", slide_index=0, text="Confidential")],
+        output,
+        verify=True,
+    )
+
+    assert result.operations_applied == 1
+    prs = Presentation(str(output))
+    assert "Confidential" in _slide_texts(prs.slides[0])
+
+
+def test_apply_ops_shape_index_tracks_added_and_reordered_shapes(tmp_path: Path, monkeypatch) -> None:
+    import pptx_ooxml_engine.engine as engine
+
+    builds: list[object] = []
+    original_init = engine._SlideShapeIndex.__init__
+
+    def _counting_init(self, slide) -> None:
+        builds.append(slide)
+        original_init(self, slide)
+
+    monkeypatch.setattr(engine._SlideShapeIndex, "__init__", _counting_init)
+
+    template = tmp_path / "template.pptx"
+    output = tmp_path / "output_shape_index.pptx"
+    _build_target_pptx(template)
+    box = {"op": "add_shape", "slide_index": 0, "shape_type": "rect", "width_inches": 1.0, "height_inches": 1.0}
+    engine.apply_ops(
+        template,
+        [
+            {"op": "set_shape_text", "slide_index": 0, "shape_index": 0, "text": "Indexed"},
+            {**box, "x_inches": 1.0, "y_inches": 1.0, "name": "a"},
+            {**box, "x_inches": 3.0, "y_inches": 1.0, "name": "b"},
+            {"op": "set_shape_geometry", "slide_index": 0, "shape_name": "a", "x_inches": 2.0},
+            {"op": "set_shape_z_order", "slide_index": 0, "shape_name": "b", "action": "send_to_back"},
+            {"op": "set_shape_text", "slide_index": 0, "shape_index": 0, "text": "Back"},
+            {"op": "set_shape_text", "slide_index": 0, "shape_name": "a", "text": "Front"},
+        ],
+        output,
+        verify=True,
+    )
+
+    # One build up front and one rebuild after the z-order change; additions are appended in place.
+    assert len(builds) == 2
+    prs = Presentation(str(output))
+    shapes = list(prs.slides[0].shapes)
+    assert (shapes[0].name, shapes[0].text_frame.text) == ("b", "Back")
+    by_name = {shape.name: shape for shape in shapes}
+    assert by_name["a"].text_frame.text == "Front"
+    assert by_name["a"].left == Inches(2.0)
+    assert "Indexed" in _slide_texts(prs.slides[0])
+
+
+def test_apply_ops_fill_table_writes_grid_in_one_pass(tmp_path: Path) -> None:
+    from pptx.enum.text import PP_ALIGN
+    from pptx.util import Pt
+
+    from pptx_ooxml_engine.engine import apply_ops
+
+    template = tmp_path / "template_fill_table.pptx"
+    output = tmp_path / "output_fill_table.pptx"
+    _build_target_pptx(template)
+
+    apply_ops(
+        template,
+        [
+            {
+                "op": "add_table",
+                "slide_index": 0,
+                "x_inches": 0.5,
+                "y_inches": 1.5,
+                "width_inches": 9.0,
+                "height_inches": 3.0,
+                "name": "fin",
+                "data": [["Item", "FY24", "FY25"], ["seed", "", ""], ["", "", ""]],
+            },
+            {
+                "op": "fill_table",
+                "slide_index": 0,
+                "table_name": "fin",
+                "start_row": 1,
+                "data": [["Revenue", 1234567.891, 42], ["Cost\nof sales", None, 7.5]],
+                "columns": [
+                    {"bold": True},
+                    {"number_format": ",.2f", "alignment": "right", "fill_color_hex": "DDEEFF"},
+                    {"font_size_pt": 12, "text_color_hex": "#FF0000"},
+                ],
+            },
+        ],
+        output,
+        verify=True,
+    )
+
+    table = Presentation(str(output)).slides[0].shapes[-1].table
+    assert table.cell(0, 0).text_frame.text == "Item"
+    assert table.cell(1, 0).text_frame.paragraphs[0].runs[0].font.bold is True
+    assert table.cell(1, 1).text_frame.text == "1,234,567.89"
+    assert table.cell(1, 1).text_frame.paragraphs[0].alignment == PP_ALIGN.RIGHT
+    assert table.cell(1, 1).fill.fore_color.rgb == RGBColor.from_string("DDEEFF")
+    assert table.cell(2, 0).text_frame.text == "Cost\nof sales"
+    assert table.cell(2, 1).text_frame.text == ""
+    third = table.cell(2, 2).text_frame.paragraphs[0].runs[0]
+    assert third.text == "7.5"
+    assert third.font.size == Pt(12)
+    assert third.font.color.rgb == RGBColor.from_string("FF0000")
+
+
+def test_apply_ops_fill_table_rejects_data_outside_table(tmp_path: Path) -> None:
+    from pptx_ooxml_engine.engine import apply_ops
+
+    template = tmp_path / "template_fill_table_range.pptx"
+    _build_target_pptx(template)
+    ops = [
+        {
+            "op": "add_table",
+            "slide_index": 0,
+            "x_inches": 0.5,
+            "y_inches": 1.5,
+            "width_inches": 4.0,
+            "height_inches": 1.0,
+            "data": [["a", "b"], ["c", "d"]],
+        },
+        {"op": "fill_table", "slide_index": 0, "table_index": 0, "start_col": 1, "data": [["x", "y"]]},
+    ]
+
+    with pytest.raises(IndexError, match="fill_table data out of range"):
+        apply_ops(template, ops, tmp_path / "never.pptx")
+
+
+def test_apply_ops_serializes_parts_when_template_changes_before_save(tmp_path: Path, monkeypatch) -> None:
+    from zipfile import ZipFile
+
+    import pptx_ooxml_engine.engine as engine
+
+    built = tmp_path / "built.pptx"
+    _build_target_pptx(built)
+    template = tmp_path / "template.pptx"
+    with ZipFile(built) as source, ZipFile(template, "w") as target:
+        for info in source.infolist():
+            data = source.read(info)
+            target.writestr(info, data + b"\n" if info.filename == "ppt/theme/theme1.xml" else data)
+
+    run_operations = engine._run_operations
+
+    def replace_template_then_run(operations, ctx):
+        template.write_bytes(built.read_bytes())
+        return run_operations(operations, ctx)
+
+    monkeypatch.setattr(engine, "_run_operations", replace_template_then_run)
+    output = tmp_path / "output.pptx"
+    engine.apply_ops(template, [{"op": "set_notes", "slide_index": 0, "text": "Notes"}], output, verify=True)
+
+    with ZipFile(output) as archive:
+        assert archive.testzip() is None
+        assert archive.read("ppt/theme/theme1.xml").endswith(b">\n")
+
+
+def test_apply_ops_rejects_streamed_copy_slide_without_declared_libraries(tmp_path: Path) -> None:
+    import json
+
+    from pptx_ooxml_engine.engine import apply_ops
+    from pptx_ooxml_engine.models import parse_ops_jsonl
+
+    template = tmp_path / "template.pptx"
+    _build_target_pptx(template)
+    stream = parse_ops_jsonl(
+        [json.dumps({"op": "copy_slide", "source_path": str(template), "source_slide_index": 0})]
+    )
+
+    with pytest.raises(ValueError, match="must declare reuse_slide_libraries"):
+        apply_ops(template, stream, tmp_path / "never.pptx")
+    assert not (tmp_path / "never.pptx").exists()
+
+
+def test_apply_ops_copies_untouched_template_parts_verbatim(tmp_path: Path) -> None:
+    from zipfile import ZipFile
+
+    from pptx.chart.data import CategoryChartData
+    from pptx.enum.chart import XL_CHART_TYPE
+
+    from pptx_ooxml_engine.engine import apply_ops
+
+    built = tmp_path / "built.pptx"
+    prs = Presentation()
+    chart_slide = prs.slides.add_slide(prs.slide_layouts[5])
+    chart_data = CategoryChartData()
+    chart_data.categories = ["Q1", "Q2"]
+    chart_data.add_series("Revenue", (1, 2))
+    chart_shape = chart_slide.shapes.add_chart(
+        XL_CHART_TYPE.COLUMN_CLUSTERED, Inches(1), Inches(1), Inches(4), Inches(3), chart_data
+    )
+    chart_shape.name = "revenue_chart"
+    notes_slide = prs.slides.add_slide(prs.slide_layouts[5])
+    notes_slide.notes_slide.notes_text_frame.text = "Old notes"
+    prs.save(str(built))
+
+    # A trailing newline that python-pptx would not write back proves the theme is copied, not re-serialized.
+    template = tmp_path / "template.pptx"
+    with ZipFile(built) as source, ZipFile(template, "w") as target:
+        for info in source.infolist():
+            data = source.read(info)
+            if info.filename == "ppt/theme/theme1.xml":
+                data += b"\n"
+            target.writestr(info, data)
+
+    output = tmp_path / "output.pptx"
+    apply_ops(
+        template,
+        [
+            {
+                "op": "update_chart_data",
+                "slide_index": 0,
+                "chart_name": "revenue_chart",
+                "categories": ["Q1", "Q2", "Q3"],
+                "series": [{"name": "Revenue", "values": [5, 6, 7]}],
+            },
+            {"op": "set_notes", "slide_index": 1, "text": "New notes"},
+        ],
+        output,
+        verify=True,
+    )
+
+    with ZipFile(template) as source, ZipFile(output) as archive:
+        assert archive.read("ppt/theme/theme1.xml") == source.read("ppt/theme/theme1.xml")
+    out = Presentation(str(output))
+    chart = next(shape.chart for shape in out.slides[0].shapes if shape.has_chart)
+    assert list(chart.plots[0].categories) == ["Q1", "Q2", "Q3"]
+    assert list(chart.series[0].values) == [5.0, 6.0, 7.0]
+    assert out.slides[1].notes_slide.notes_text_frame.text == "New notes"
+
+
+def test_apply_ops_accepts_bytes_and_streams_without_touching_disk(tmp_path: Path) -> None:
+    from io import BytesIO
+
+    from pptx_ooxml_engine.engine import apply_ops, generate_pptx
+    from pptx_ooxml_engine.verify import verify_pptx
+
+    template = tmp_path / "template.pptx"
+    _build_target_pptx(template)
+    data = template.read_bytes()
+    ops = [{"op": "rewrite_text", "slide_index": 0, "find": "Original", "replace": "New"}]
+
+    result = generate_pptx(data, ops, verify=True)
+    assert result.output_path is None and result.verify_issues == []
+    assert "New Title" in _slide_texts(Presentation(BytesIO(result.output_bytes)).slides[0])
+    assert verify_pptx(result.output_bytes).issues == verify_pptx(BytesIO(result.output_bytes)).issues == []
+
+    sink = BytesIO()
+    streamed = apply_ops(BytesIO(data), ops, sink)
+    assert streamed.output_path is None and streamed.output_bytes is None
+    assert "New Title" in _slide_texts(Presentation(BytesIO(sink.getvalue())).slides[0])
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["template.pptx"]
+
+
+def test_apply_ops_profile_reports_phases_ops_and_hook_events(tmp_path: Path) -> None:
+    from pptx_ooxml_engine.engine import apply_ops
+
+    template = tmp_path / "template.pptx"
+    _build_target_pptx(template)
+    ops = [
+        {"op": "rewrite_text", "slide_index": 0, "find": "Original", "replace": "New"},
+        {"op": "set_notes", "slide_index": 0, "text": "Timed"},
+        {"op": "rewrite_text", "slide_index": 0, "find": "New", "replace": "Final"},
+    ]
+
+    plain = apply_ops(template, ops, tmp_path / "plain.pptx", verify=True)
+    assert plain.timings is None
+
+    events = []
+    result = apply_ops(template, ops, tmp_path / "profiled.pptx", verify=True, on_timing=events.append)
+    timings = result.timings
+    assert list(timings.phases) == ["parse", "load", "apply", "verify", "save"]
+    assert [(event.index, event.name) for event in timings.ops] == [
+        (0, "rewrite_text"),
+        (1, "set_notes"),
+        (2, "rewrite_text"),
+    ]
+    assert timings.by_op_type["rewrite_text"].count == 2
+    assert all(event.wall >= 0 and event.cpu >= 0 for event in timings.ops)
+    assert timings.phases["apply"].wall >= sum(event.wall for event in timings.ops)
+    assert [event.name for event in events] == [
+        "parse",
+        "load",
+        "rewrite_text",
+        "set_notes",
+        "rewrite_text",
+        "apply",
+        "verify",
+        "save",
+    ]
+
+
+def test_copy_slide_resolves_each_source_library_once(tmp_path: Path, monkeypatch) -> None:
+    from dataclasses import dataclass
+
+    import pptx_ooxml_engine.engine as engine
+    from pptx_ooxml_engine.models import PlanHeader, parse_ops
+
+    @dataclass
+    class Spec:
+        source_path: str
+        slide_index: int
+
+    class RecordingCopier:
+        def __init__(self) -> None:
+            self.specs: list[Spec] = []
+
+        def copy_slide(self, spec: Spec, mode: str) -> None:
+            self.specs.append(spec)
+
+    library = tmp_path / "library.pptx"
+    _build_source_pptx(library)
+    monkeypatch.chdir(tmp_path)
+    copier = RecordingCopier()
+    ctx = engine.ApplyContext(
+        presentation=Presentation(),
+        plan=PlanHeader(reuse_slide_libraries=["./library.pptx"]),
+        copier=copier,
+        slide_spec_cls=Spec,
+    )
+    ops = parse_ops(
+        [
+            {"op": "copy_slide", "source_path": "library.pptx", "source_slide_index": 0},
+            {"op": "copy_slide", "reuse_library_index": 0, "source_slide_index": 0},
+            {"op": "copy_slide", "source_path": str(library), "source_slide_index": 0},
+        ]
+    )
+    assert engine._run_operations(ops, ctx) == 3
+
+    assert {spec.source_path for spec in copier.specs} == {str(library.resolve())}
+    with pytest.raises(FileNotFoundError, match="missing.pptx"):
+        engine._apply_copy_slide(
+            parse_ops([{"op": "copy_slide", "source_path": "missing.pptx", "source_slide_index": 0}])[0], ctx
+        )
+
+
+def test_apply_ops_reads_each_image_once_and_shares_one_media_part(tmp_path: Path, monkeypatch) -> None:
+    from zipfile import ZipFile
+
+    from pptx.parts.image import Image
+
+    from pptx_ooxml_engine.engine import apply_ops
+
+    template = tmp_path / "template.pptx"
+    prs = Presentation()
+    for _ in range(3):
+        prs.slides.add_slide(prs.slide_layouts[8])  # Picture with Caption
+    prs.save(str(template))
+    logo = tmp_path / "logo.png"
+    logo_copy = tmp_path / "logo_copy.png"
+    _write_tiny_png(logo)
+    _write_tiny_png(logo_copy)
+
+    reads: list[str] = []
+    from_file = Image.from_file
+    monkeypatch.setattr(Image, "from_file", lambda path: reads.append(path) or from_file(path))
+
+    box = {"x_inches": 0.2, "y_inches": 0.2, "width_inches": 1.0, "height_inches": 0.5}
+    ops = [{"op": "add_image", "slide_index": idx % 3, "image_path": str(logo), **box} for idx in range(6)]
+    ops += [
+        {"op": "add_image", "slide_index": 0, "image_path": str(logo_copy), "name": "alias", **box},
+        {"op": "fill_placeholder", "slide_index": 1, "placeholder_type": "picture", "image_path": str(logo)},
+        {"op": "replace_image", "slide_index": 0, "shape_name": "alias", "image_path": str(logo)},
+    ]
+    apply_ops(template, ops, tmp_path / "output.pptx", verify=True)
+
+    assert sorted(reads) == sorted([str(logo.resolve()), str(logo_copy.resolve())])
+    with ZipFile(tmp_path / "output.pptx") as archive:
+        assert [name for name in archive.namelist() if name.startswith("ppt/media/")] == ["ppt/media/image1.png"]
+    out = Presentation(str(tmp_path / "output.pptx"))
+    assert sum(shape.shape_type == MSO_SHAPE_TYPE.PICTURE for shape in out.slides[0].shapes) == 3
+    placeholders = out.slides[1].placeholders
+    filled = next(shape for shape in placeholders if shape.placeholder_format.type == PP_PLACEHOLDER.PICTURE)
+    layout_ph = out.slides[1].slide_layout.placeholders.get(idx=filled.placeholder_format.idx)
+    assert filled.shape_type == MSO_SHAPE_TYPE.PLACEHOLDER and filled.is_placeholder
+    assert (filled.left, filled.top, filled.width, filled.height) == (
+        layout_ph.left, layout_ph.top, layout_ph.width, layout_ph.height
+    )
+
+
+def test_apply_ops_collapses_byte_identical_media_parts(tmp_path: Path, monkeypatch) -> None:
+    from typing import Literal
+    from zipfile import ZipFile
+
+    from pydantic import BaseModel
+
+    import pptx_ooxml_engine.engine as engine
+
+    built = tmp_path / "built.pptx"
+    image_a = tmp_path / "a.png"
+    image_b = tmp_path / "b.png"
+    _write_tiny_png(image_a)
+    _write_tiny_png_alt(image_b)
+    prs = Presentation()
+    for image in (image_a, image_b):
+        prs.slides.add_slide(prs.slide_layouts[6]).shapes.add_picture(str(image), Inches(1), Inches(1))
+    prs.save(str(built))
+
+    # Same bytes under two partnames, as left behind by slides copied from one library.
+    template = tmp_path / "template.pptx"
+    with ZipFile(built) as source, ZipFile(template, "w") as target:
+        for info in source.infolist():
+            name = "ppt/media/image1.png" if info.filename == "ppt/media/image2.png" else info.filename
+            target.writestr(info, source.read(name))
+
+    # A job that adds no media leaves the template's media as they are.
+    text_only = tmp_path / "text_only.pptx"
+    engine.apply_ops(template, [{"op": "set_notes", "slide_index": 0, "text": "Notes"}], text_only)
+    with ZipFile(text_only) as archive:
+        assert len([name for name in archive.namelist() if name.startswith("ppt/media/")]) == 2
+
+    class TouchOp(BaseModel):
+        op: Literal["touch"]
+
+    monkeypatch.setattr(engine, "_OP_HANDLERS", dict(engine._OP_HANDLERS))
+    engine.register_op_handler("touch", lambda op, ctx: None)
+    output = tmp_path / "output.pptx"
+    engine.apply_ops(template, [TouchOp(op="touch")], output, verify=True)
+
+    with ZipFile(output) as archive:
+        assert [name for name in archive.namelist() if name.startswith("ppt/media/")] == ["ppt/media/image1.png"]
+    out = Presentation(str(output))
+    blobs = [next(iter(slide.shapes)).image.blob for slide in out.slides]
+    assert blobs == [image_a.read_bytes()] * 2
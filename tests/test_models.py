@@ -317,3 +317,108 @@ def test_update_chart_data_series_values_must_match_categories() -> None:
                 ]
             }
         )
+
+
+def test_fill_table_requires_target_and_valid_number_format() -> None:
+    from pydantic import ValidationError
+
+    from pptx_ooxml_engine.models import parse_ops
+
+    with pytest.raises(ValidationError, match="fill_table requires table_name or table_index"):
+        parse_ops([{"op": "fill_table", "slide_index": 0, "data": [["a"]]}])
+
+    with pytest.raises(ValidationError, match="invalid number_format"):
+        parse_ops(
+            [
+                {
+                    "op": "fill_table",
+                    "slide_index": 0,
+                    "table_index": 0,
+                    "data": [[1.0]],
+                    "columns": [{"number_format": ",.2q"}],
+                }
+            ]
+        )
+
+    with pytest.raises(ValidationError, match=r"data\[1\]\[0\] 2.5 does not fit number_format ',d'"):
+        parse_ops(
+            [
+                {
+                    "op": "fill_table",
+                    "slide_index": 0,
+                    "table_index": 0,
+                    "data": [[1200], [2.5]],
+                    "columns": [{"number_format": ",d"}],
+                }
+            ]
+        )
+
+    ops = parse_ops(
+        [
+            {
+                "op": "fill_table",
+                "slide_index": 0,
+                "table_index": 0,
+                "data": [["a", 1, 2.5, None, True]],
+                "columns": [{}, {"number_format": ",d"}, {}, {}, {"number_format": ",.2f"}],
+            }
+        ]
+    )
+    assert ops[0].data == [["a", 1, 2.5, None, True]]
+    assert ops[0].data[0][4] is True
+
+
+def test_parse_plan_json_validates_bytes_and_trusts_known_hash() -> None:
+    import hashlib
+    import json
+
+    from pydantic import ValidationError
+
+    from pptx_ooxml_engine.models import RewriteTextOp, parse_plan, parse_plan_json
+
+    raw = {
+        "template_pptx": "/tmp/template.pptx",
+        "operations": [{"op": "rewrite_text", "slide_index": 0, "find": "a", "replace": "b"}],
+    }
+    data = json.dumps(raw).encode("utf-8")
+
+    plan = parse_plan_json(data)
+    assert plan == parse_plan(raw)
+    assert parse_plan_json(json.dumps(raw["operations"])).operations == plan.operations
+    assert isinstance(plan.operations[0], RewriteTextOp)
+
+    content_hash = hashlib.sha256(data).hexdigest()
+    trusted = parse_plan_json(data, content_hash=content_hash)
+    assert parse_plan_json(data, content_hash=content_hash) is trusted
+
+    with pytest.raises(ValueError, match="content_hash does not match"):
+        parse_plan_json(data, content_hash="0" * 64)
+    with pytest.raises(ValidationError):
+        parse_plan_json(b'{"operations": [{"op": "rewrite_text", "slide_index": -1}]}')
+
+
+def test_parse_ops_jsonl_reads_header_and_validates_lazily() -> None:
+    import json
+
+    from pptx_ooxml_engine.models import RewriteTextOp, parse_ops_jsonl
+
+    lines = [
+        json.dumps({"template_pptx": "/tmp/template.pptx"}),
+        "",
+        json.dumps({"op": "rewrite_text", "slide_index": 0, "find": "a", "replace": "b"}),
+        json.dumps({"op": "rewrite_text", "slide_index": -1, "find": "a", "replace": "b"}),
+    ]
+    stream = parse_ops_jsonl(lines)
+    assert stream.header.template_pptx == "/tmp/template.pptx"
+
+    ops = iter(stream)
+    assert isinstance(next(ops), RewriteTextOp)
+    with pytest.raises(ValueError, match="invalid operation on line 4"):
+        next(ops)
+
+    headerless = parse_ops_jsonl(lines[2:3])
+    assert headerless.header.template_pptx is None
+    assert [op.replace for op in headerless] == ["b"]
+
+    with pytest.raises(ValueError, match="invalid header on line 1"):
+        parse_ops_jsonl([json.dumps({"slide_index": 0, "find": "a", "replace": "b"})])
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from pptx import Presentation
+
+
+def _build_titled_pptx(path: Path, title: str) -> None:
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[0])
+    if slide.shapes.title is not None:
+        slide.shapes.title.text = title
+    prs.save(str(path))
+
+
+def test_render_parallel_isolates_failures_and_keeps_order(tmp_path: Path) -> None:
+    from pptx_ooxml_engine.parallel import render_parallel
+
+    template = tmp_path / "template.pptx"
+    _build_titled_pptx(template, "Old Title")
+    plans = [
+        [{"op": "rewrite_text", "slide_index": 0, "find": "Old", "replace": "First"}],
+        [{"op": "rewrite_text", "slide_index": 0, "find": "Missing", "replace": "Never"}],
+        [{"op": "rewrite_text", "slide_index": 0, "find": "Old", "replace": "Third"}],
+        [{"op": "rewrite_text", "slide_index": 0, "find": "Old", "replace": "Fourth"}],
+    ]
+
+    outcomes = list(render_parallel(template, plans, tmp_path / "out", workers=2, max_in_flight=2, verify=True))
+
+    assert [outcome.index for outcome in outcomes] == [0, 1, 2, 3]
+    assert [outcome.ok for outcome in outcomes] == [True, False, True, True]
+    assert outcomes[1].error is not None and "cannot find target text" in outcomes[1].error
+    prs = Presentation(str(outcomes[3].result.output_path))
+    assert prs.slides[0].shapes.title.text == "Fourth Title"
+
+
+def test_render_parallel_enforces_per_job_timeout(tmp_path: Path) -> None:
+    from pptx_ooxml_engine.parallel import render_parallel
+
+    template = tmp_path / "template.pptx"
+    _build_titled_pptx(template, "Old Title")
+    slow_plan = [{"op": "create_slide_on_layout", "layout_index": 0, "title": f"S{idx}"} for idx in range(500)]
+
+    outcomes = list(
+        render_parallel(template, [slow_plan], tmp_path / "out", workers=1, timeout=0.000001, ordered=False)
+    )
+
+    assert len(outcomes) == 1
+    assert outcomes[0].error is not None and outcomes[0].error.startswith("TimeoutError")
+
+
+class _HangsWhenUnpickled:
+    # Blocks the worker before the job's own SIGALRM is armed, like a call stuck in C code.
+    def __reduce__(self):
+        import time
+
+        return time.sleep, (60,)
+
+
+def test_render_parallel_stops_hung_workers_and_reports_unpicklable_plans(tmp_path: Path) -> None:
+    from pptx_ooxml_engine.parallel import render_parallel
+
+    template = tmp_path / "template.pptx"
+    _build_titled_pptx(template, "Old Title")
+    plans = [
+        _HangsWhenUnpickled(),
+        (op for op in []),
+        [{"op": "rewrite_text", "slide_index": 0, "find": "Old", "replace": "After"}],
+    ]
+
+    outcomes = list(render_parallel(template, plans, tmp_path / "out", workers=1, timeout=0.2))
+
+    assert outcomes[0].error is not None and outcomes[0].error.startswith("TimeoutError")
+    assert outcomes[1].error is not None and "pickle" in outcomes[1].error
+    assert outcomes[2].ok
+    assert Presentation(str(outcomes[2].result.output_path)).slides[0].shapes.title.text == "After Title"
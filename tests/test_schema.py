@@ -35,6 +35,7 @@ def test_load_ops_schema() -> None:
         "add_chart",
         "update_chart_data",
         "set_table_cell",
+        "fill_table",
         "merge_table_cells",
         "set_table_style",
         "set_table_row_col_size",
@@ -45,3 +46,6 @@ def test_load_ops_schema() -> None:
         "distribute_shapes",
     }
     assert expected.issubset(op_consts)
+    fill_table = next(item for item in one_of if item["properties"]["op"].get("const") == "fill_table")
+    # The model accepts bool cells, so the published schema has to as well.
+    assert "boolean" in fill_table["properties"]["data"]["items"]["items"]["type"]
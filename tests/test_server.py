@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import http.client
+import json
+import socket
+import threading
+from pathlib import Path
+
+import pytest
+from pptx import Presentation
+
+
+def _build_titled_pptx(path: Path, title: str) -> None:
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[0])
+    if slide.shapes.title is not None:
+        slide.shapes.title.text = title
+    prs.save(str(path))
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path: str) -> None:
+        super().__init__("localhost")
+        self._socket_path = path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self._socket_path)
+
+
+def _request(conn: http.client.HTTPConnection, method: str, path: str, payload=None) -> tuple[int, dict]:
+    body = json.dumps(payload).encode("utf-8") if payload is not None else None
+    conn.request(method, path, body=body, headers={"Content-Type": "application/json"})
+    response = conn.getresponse()
+    return response.status, json.loads(response.read())
+
+
+def test_serve_renders_over_http_and_reports_metrics(tmp_path: Path) -> None:
+    from pptx_ooxml_engine.server import RenderService, make_server
+
+    template = tmp_path / "template.pptx"
+    _build_titled_pptx(template, "Old Title")
+    service = RenderService(workers=1, preload=[template], output_root=tmp_path, template_root=tmp_path)
+    server = make_server(service, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        conn = http.client.HTTPConnection(*server.server_address[:2])
+        status, payload = _request(
+            conn,
+            "POST",
+            "/render",
+            {
+                "template_pptx": str(template),
+                "output_pptx": str(tmp_path / "out.pptx"),
+                "plan": [{"op": "rewrite_text", "slide_index": 0, "find": "Old", "replace": "New"}],
+                "verify": True,
+            },
+        )
+        assert status == 200, payload
+        assert payload["verify_issues"] == [] and payload["operations_applied"] == 1
+        assert Presentation(payload["output_path"]).slides[0].shapes.title.text == "New Title"
+
+        status, payload = _request(
+            conn,
+            "POST",
+            "/render",
+            {
+                "template_pptx": str(template),
+                "output_pptx": str(tmp_path / "missing.pptx"),
+                "plan": [{"op": "rewrite_text", "slide_index": 0, "find": "Absent", "replace": "x"}],
+            },
+        )
+        assert status == 422 and "cannot find target text" in payload["error"]
+        status, payload = _request(conn, "POST", "/render", {"output_pptx": "x.pptx", "plan": [{"op": "bogus"}]})
+        assert status == 400
+        plan = [{"op": "rewrite_text", "slide_index": 0, "find": "Old", "replace": "New"}]
+        for outside in ({"output_pptx": "../escaped.pptx"}, {"output_pptx": "/tmp/escaped.pptx"}):
+            status, payload = _request(
+                conn, "POST", "/render", {"template_pptx": "template.pptx", "plan": plan, **outside}
+            )
+            assert status == 400 and "output_pptx must be inside" in payload["error"]
+        status, payload = _request(
+            conn, "POST", "/render", {"template_pptx": "/etc/hosts", "output_pptx": "ok.pptx", "plan": plan}
+        )
+        assert status == 400 and "template_pptx must be inside" in payload["error"]
+        box = {"x_inches": 0, "y_inches": 0, "width_inches": 1, "height_inches": 1}
+        for leaking in (
+            [{"op": "add_image", "slide_index": 0, "image_path": "/etc/hosts", **box}],
+            {"reuse_slide_libraries": ["../library.pptx"], "operations": plan},
+            [{"op": "copy_slide", "source_path": "/etc/hosts", "source_slide_index": 0}],
+        ):
+            status, payload = _request(
+                conn, "POST", "/render", {"template_pptx": "template.pptx", "output_pptx": "ok.pptx", "plan": leaking}
+            )
+            assert status == 400 and "must be inside" in payload["error"], payload
+        assert not (tmp_path.parent / "escaped.pptx").exists()
+
+        status, metrics = _request(conn, "GET", "/metrics")
+        assert status == 200
+        assert (metrics["completed"], metrics["failed"], metrics["queue_depth"]) == (2, 1, 0)
+        assert metrics["latency_ms"]["max"] >= metrics["latency_ms"]["p50"] > 0
+    finally:
+        server.shutdown()
+        server.server_close()
+        service.close()
+
+
+def test_serve_accepts_unix_socket_and_sheds_load_when_full(tmp_path: Path) -> None:
+    from pptx_ooxml_engine.server import RenderService, make_server
+
+    template = tmp_path / "template.pptx"
+    _build_titled_pptx(template, "Old Title")
+    service = RenderService(workers=1, max_queue=0, output_root=tmp_path, template_root=tmp_path)
+    socket_path = tmp_path / "render.sock"
+    server = make_server(service, unix_socket=socket_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        status, payload = _request(
+            _UnixHTTPConnection(str(socket_path)),
+            "POST",
+            "/render",
+            {
+                "output_pptx": str(tmp_path / "out.pptx"),
+                "plan": {
+                    "template_pptx": str(template),
+                    "operations": [{"op": "rewrite_text", "slide_index": 0, "find": "Old", "replace": "Unix"}],
+                },
+            },
+        )
+        assert status == 200, payload
+
+        plan = [{"op": "rewrite_text", "slide_index": 0, "find": "Old", "replace": "Busy"}]
+        first = service.submit(plan, tmp_path / "busy.pptx", template_pptx=template)
+        with pytest.raises(RuntimeError, match="render queue is full"):
+            service.submit(plan, tmp_path / "rejected.pptx", template_pptx=template)
+        assert first.result()[1] is None
+        assert service.metrics()["rejected"] == 1
+    finally:
+        server.shutdown()
+        server.server_close()
+        service.close()
+    assert not socket_path.exists()
+
+
+def test_serve_refuses_non_loopback_host_without_allow_remote() -> None:
+    from pptx_ooxml_engine.cli import main
+    from pptx_ooxml_engine.server import serve
+
+    with pytest.raises(ValueError, match="non-loopback"):
+        serve(host="0.0.0.0", port=0)
+    with pytest.raises(SystemExit) as exc:
+        main(["serve", "--host", "0.0.0.0"])
+    assert exc.value.code == 2
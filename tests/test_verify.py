@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from pptx import Presentation
+from pptx.oxml.ns import qn
+
+
+def _build_deck_with_issues() -> Presentation:
+    prs = Presentation()
+    for title in ("First", "Second"):
+        slide = prs.slides.add_slide(prs.slide_layouts[1])
+        slide.shapes.title.text = title
+    prs.slides[1].shapes.title._element.set(qn("r:id"), "rId99")
+    bogus = prs.slides._sldIdLst.add_sldId("rId404")
+    bogus.set("id", "9999")
+    return prs
+
+
+def test_verify_presentation_matches_verify_pptx_on_saved_file(tmp_path: Path) -> None:
+    from pptx_ooxml_engine.verify import verify_presentation, verify_pptx
+
+    prs = _build_deck_with_issues()
+    in_memory = verify_presentation(prs)
+    saved = tmp_path / "issues.pptx"
+    prs.save(str(saved))
+
+    assert in_memory.issues == verify_pptx(saved).issues
+    assert in_memory.issues == [
+        "dangling relationship rId99 in ppt/slides/slide2.xml",
+        "slide rId missing in presentation rels: rId404",
+    ]
+
+
+def test_apply_ops_verifies_without_reopening_output(tmp_path: Path, monkeypatch) -> None:
+    from pptx_ooxml_engine import engine
+
+    template = tmp_path / "template.pptx"
+    prs = Presentation()
+    prs.slides.add_slide(prs.slide_layouts[0]).shapes.title.text = "Title"
+    prs.save(str(template))
+
+    def _fail(path):
+        raise AssertionError("output was reopened for verification")
+
+    monkeypatch.setattr(engine, "verify_pptx", _fail)
+    result = engine.apply_ops(
+        template,
+        [{"op": "rewrite_text", "slide_index": 0, "find": "Title", "replace": "Checked"}],
+        tmp_path / "out.pptx",
+        verify=True,
+    )
+
+    assert result.verify_issues == []
+
+
+def test_verify_pptx_parses_shared_layout_rels_once(tmp_path: Path, monkeypatch) -> None:
+    from zipfile import ZipFile
+
+    from pptx_ooxml_engine import verify
+
+    built = tmp_path / "built.pptx"
+    prs = Presentation()
+    for idx in range(3):
+        prs.slides.add_slide(prs.slide_layouts[1]).shapes.title.text = f"Slide {idx}"
+    prs.save(str(built))
+    layout_rels = "ppt/slideLayouts/_rels/slideLayout2.xml.rels"
+    broken = tmp_path / "broken.pptx"
+    with ZipFile(built) as source, ZipFile(broken, "w") as target:
+        for info in source.infolist():
+            if info.filename != layout_rels:
+                target.writestr(info, source.read(info))
+
+    parsed: list[bytes] = []
+    real_fromstring = verify.ET.fromstring
+
+    def _counting_fromstring(data):
+        parsed.append(data)
+        return real_fromstring(data)
+
+    monkeypatch.setattr(verify.ET, "fromstring", _counting_fromstring)
+    assert verify.verify_pptx(built).issues == []
+    # presentation.xml, its rels, then three slides with their rels, one layout rels.
+    assert len(parsed) == 2 + 3 * 2 + 1
+
+    issues = verify.verify_pptx(broken).issues
+    assert issues == [
+        f"missing rels part: {layout_rels}",
+        "missing slideMaster relation in ppt/slideLayouts/slideLayout2.xml",
+    ] * 3
+
+
+def test_verify_pptx_parallel_matches_serial_report(tmp_path: Path) -> None:
+    from pptx_ooxml_engine.verify import verify_pptx
+
+    prs = _build_deck_with_issues()
+    for idx in range(6):
+        prs.slides.add_slide(prs.slide_layouts[1]).shapes.title.text = f"Extra {idx}"
+    prs.slides[5].shapes.title._element.set(qn("r:id"), "rId77")
+    deck = tmp_path / "issues.pptx"
+    prs.save(str(deck))
+
+    serial = verify_pptx(deck)
+    parallel = verify_pptx(deck, workers=2)
+
+    assert parallel.issues == serial.issues
+    assert serial.issues == [
+        "dangling relationship rId99 in ppt/slides/slide2.xml",
+        "slide rId missing in presentation rels: rId404",
+        "dangling relationship rId77 in ppt/slides/slide6.xml",
+    ]
+
+
+def test_verify_pptx_reuses_pools_and_hands_in_memory_decks_to_shards_as_one_file(tmp_path: Path) -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    from pptx_ooxml_engine import verify
+
+    prs = _build_deck_with_issues()
+    deck = tmp_path / "issues.pptx"
+    prs.save(str(deck))
+    serial = verify.verify_pptx(deck)
+
+    verify.verify_pptx(deck, workers=2)
+    pool = verify._EXECUTORS[2]
+    assert verify.verify_pptx(deck, workers=2).issues == serial.issues
+    assert verify._EXECUTORS[2] is pool
+
+    sources = []
+
+    class RecordingExecutor(ThreadPoolExecutor):
+        def submit(self, fn, /, *args, **kwargs):
+            sources.append(args[0])
+            return super().submit(fn, *args, **kwargs)
+
+    with RecordingExecutor(max_workers=2) as executor:
+        report = verify.verify_pptx(deck.read_bytes(), workers=2, executor=executor)
+
+    assert report.issues == serial.issues
+    assert len(sources) > 2 and len(set(sources)) == 1
+    assert isinstance(sources[0], str) and not Path(sources[0]).exists()
+
+
+def test_verify_pptx_streaming_matches_report_with_bounded_memory(tmp_path: Path) -> None:
+    import tracemalloc
+    from zipfile import ZipFile
+
+    from pptx.util import Inches
+
+    from pptx_ooxml_engine.cache import VerifyCache
+    from pptx_ooxml_engine.verify import _check_slide, verify_pptx
+
+    prs = _build_deck_with_issues()
+    table = prs.slides[0].shapes.add_table(100, 10, 0, 0, Inches(9), Inches(6)).table
+    for row in range(100):
+        for col in range(10):
+            table.cell(row, col).text = f"{row}-{col}"
+    deck = tmp_path / "issues.pptx"
+    prs.save(str(deck))
+
+    assert verify_pptx(deck, streaming=True).issues == verify_pptx(deck).issues
+
+    cache = VerifyCache(tmp_path / "verify-cache")
+    peaks = {}
+    with ZipFile(deck) as archive:
+        for streaming, slide_cache in ((False, None), (True, None), ("cached", cache), ("cached", cache)):
+            tracemalloc.start()
+            _check_slide(archive, "ppt/slides/slide1.xml", {}, bool(streaming), slide_cache)
+            peaks[streaming] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+    assert peaks[True] * 4 < peaks[False]
+    # The second cached call is a hit: hashed from the member stream, never read whole.
+    assert peaks["cached"] * 4 < peaks[False]
+
+
+def test_incremental_verify_rescans_only_touched_slides(tmp_path: Path, monkeypatch) -> None:
+    from pptx_ooxml_engine import verify
+    from pptx_ooxml_engine.engine import apply_ops
+
+    template = tmp_path / "template.pptx"
+    prs = Presentation()
+    for title in ("Edit Me", "Keep", "Broken"):
+        prs.slides.add_slide(prs.slide_layouts[1]).shapes.title.text = title
+    prs.slides[2].shapes.title._element.set(qn("r:id"), "rId99")
+    prs.save(str(template))
+
+    scanned: list[str] = []
+    real_scan = verify._dangling_rids
+
+    def _counting_scan(slide_part):
+        scanned.append(slide_part.partname.membername)
+        return real_scan(slide_part)
+
+    monkeypatch.setattr(verify, "_dangling_rids", _counting_scan)
+    ops = [{"op": "rewrite_text", "slide_index": 0, "find": "Edit", "replace": "Edited"}]
+    expected = ["dangling relationship rId99 in ppt/slides/slide3.xml"]
+
+    full = apply_ops(template, ops, tmp_path / "full.pptx", verify=True, strict_verify=False)
+    first = apply_ops(
+        template, ops, tmp_path / "first.pptx", verify=True, strict_verify=False, incremental_verify=True
+    )
+    scanned.clear()
+    second = apply_ops(
+        template, ops, tmp_path / "second.pptx", verify=True, strict_verify=False, incremental_verify=True
+    )
+
+    assert full.verify_issues == first.verify_issues == second.verify_issues == expected
+    assert scanned == ["ppt/slides/slide1.xml"]
+
+
+def test_verify_pptx_reuses_cached_results_for_identical_slides(tmp_path: Path, monkeypatch) -> None:
+    from pptx_ooxml_engine import verify
+    from pptx_ooxml_engine.cache import VerifyCache
+
+    prs = _build_deck_with_issues()
+    first = tmp_path / "first.pptx"
+    prs.save(str(first))
+    prs.slides.add_slide(prs.slide_layouts[1]).shapes.title.text = "Only in second"
+    second = tmp_path / "second.pptx"
+    prs.save(str(second))
+    cache = VerifyCache(tmp_path / "verify-cache")
+
+    parsed: list[str] = []
+    real_facts = verify._slide_facts
+
+    def _counting_facts(archive, slide_part, rel_maps, streaming):
+        parsed.append(slide_part)
+        return real_facts(archive, slide_part, rel_maps, streaming)
+
+    monkeypatch.setattr(verify, "_slide_facts", _counting_facts)
+    assert verify.verify_pptx(first, cache=cache).issues == verify.verify_pptx(first).issues
+    parsed.clear()
+
+    assert verify.verify_pptx(second, cache=cache).issues == [
+        "dangling relationship rId99 in ppt/slides/slide2.xml",
+        "slide rId missing in presentation rels: rId404",
+    ]
+    assert parsed == ["ppt/slides/slide4.xml"]
+    assert len(cache) == 3
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from io import BytesIO
+from pathlib import Path
+from zipfile import ZipFile
+
+from pptx import Presentation
+
+
+def _build_titled_pptx(path: Path, title: str) -> None:
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[0])
+    slide.shapes.title.text = title
+    prs.save(str(path))
+
+
+def test_save_presentation_copies_unchanged_members_from_source(tmp_path: Path) -> None:
+    from pptx_ooxml_engine.writer import save_presentation
+
+    template = tmp_path / "template.pptx"
+    _build_titled_pptx(template, "Old Title")
+    prs = Presentation(str(template))
+    prs.slides[0].shapes.title.text = "New Title"
+
+    stream = BytesIO()
+    stats = save_presentation(prs, stream, source=template)
+
+    assert stats.compressed == 1
+    with ZipFile(template) as source:
+        assert stats.raw_copied == len(source.namelist()) - 1
+    with ZipFile(BytesIO(stream.getvalue())) as archive:
+        assert archive.testzip() is None
+    assert Presentation(BytesIO(stream.getvalue())).slides[0].shapes.title.text == "New Title"
+
+
+def test_save_presentation_without_source_matches_presentation_save(tmp_path: Path) -> None:
+    from pptx_ooxml_engine.writer import save_presentation
+
+    template = tmp_path / "template.pptx"
+    _build_titled_pptx(template, "Title")
+    prs = Presentation(str(template))
+
+    out = tmp_path / "out.pptx"
+    stats = save_presentation(prs, out)
+    expected = BytesIO()
+    prs.save(expected)
+
+    assert stats.raw_copied == 0
+    with ZipFile(out) as archive, ZipFile(expected) as reference:
+        assert archive.namelist() == reference.namelist()
+        assert all(archive.read(name) == reference.read(name) for name in archive.namelist())
+
+
+def test_save_presentation_writes_zip64_records_past_the_limits(tmp_path: Path, monkeypatch) -> None:
+    import pptx_ooxml_engine.writer as writer
+
+    template = tmp_path / "template.pptx"
+    _build_titled_pptx(template, "Old Title")
+    prs = Presentation(str(template))
+    prs.slides[0].shapes.title.text = "New Title"
+    monkeypatch.setattr(writer, "_ZIP64_LIMIT", 100)
+    monkeypatch.setattr(writer, "_ZIP_FILECOUNT_LIMIT", 2)
+
+    stream = BytesIO()
+    stats = writer.save_presentation(prs, stream, source=template)
+
+    assert stats.raw_copied and stats.compressed
+    with ZipFile(BytesIO(stream.getvalue())) as archive, ZipFile(template) as source:
+        assert archive.testzip() is None
+        assert sorted(archive.namelist()) == sorted(source.namelist())
+    assert Presentation(BytesIO(stream.getvalue())).slides[0].shapes.title.text == "New Title"